@@ -0,0 +1,79 @@
+import argparse
+import sys
+from typing import Callable
+
+from . import (
+    bench_decorators,
+    bench_descriptor,
+    bench_memory,
+    bench_scaling,
+    bench_validator,
+)
+from .harness import AnyResult, ScalingResult, read_json, write_json
+
+SUITES: dict[str, Callable[[int, int], list[AnyResult]]] = {
+    "validator": bench_validator.run,
+    "descriptor": bench_descriptor.run,
+    "decorators": bench_decorators.run,
+    "memory": bench_memory.run,
+    "scaling": bench_scaling.run,
+}
+
+DEFAULT_SUITES = ["validator", "descriptor", "decorators"]
+"""Timing suites - memory is traced (which slows everything down) and
+pathological types are swept (which takes minutes) only when asked for."""
+
+
+def main(argv: "list[str] | None" = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Runs the benchmark suites."
+    )
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        choices=[[], *SUITES.keys()],
+        help=f"suites to run, {', '.join(DEFAULT_SUITES)} by default",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=100_000,
+        help="the biggest value size (number of elements), up to 10000000",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", "-o", help="write the results to the JSON file")
+    parser.add_argument(
+        "--compare", "-c", help="JSON file of a previous run to compare against"
+    )
+    args = parser.parse_args(argv)
+
+    baseline = read_json(args.compare) if args.compare else {}
+    results: list[AnyResult] = []
+    for suite in args.suites or DEFAULT_SUITES:
+        for result in SUITES[suite](args.max_size, args.repeat):
+            print(result.format(baseline.get(result.key)), flush=True)
+            results.append(result)
+
+    if args.output:
+        write_json(
+            args.output,
+            results,
+            suites=args.suites or DEFAULT_SUITES,
+            max_size=args.max_size,
+            repeat=args.repeat,
+        )
+
+    scaling = [result for result in results if isinstance(result, ScalingResult)]
+    if len(scaling) != 0:
+        print(bench_scaling.table(scaling))
+        for known_failure in bench_scaling.known_failures(scaling):
+            print(f"XFAIL {known_failure}", file=sys.stderr)
+        violations = bench_scaling.check(scaling)
+        for violation in violations:
+            print(f"FAILED {violation}", file=sys.stderr)
+        if len(violations) != 0:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src.pyvalidify.decorators import cls, func
+
+from .harness import Result, measure, sizes
+
+
+def _variants(__func: Callable) -> dict[str, Callable]:
+    """Undecorated baseline and both flavours of `func.validate`."""
+    return {
+        "baseline": __func,
+        "generic": func.validate(__func),
+        "specialized": func.validate(__func, specialize=True),
+    }
+
+
+def _scalar(a: int, b: str, c: float | None = None) -> None:
+    pass
+
+
+def _container(a: list[int]) -> None:
+    pass
+
+
+class _Plain:
+    a: int
+    b: list[int]
+
+    def __init__(self, a: int, b: list[int]) -> None:
+        self.a = a
+        self.b = b
+
+
+@dataclass
+class _PlainData:
+    a: int
+    b: list[int]
+
+
+def _classes() -> dict[str, tuple[type, type]]:
+    """Undecorated baseline and the class decorated with `cls.validate`."""
+
+    @cls.validate
+    class Validated(_Plain):
+        a: int
+        b: list[int]
+
+    @cls.validate
+    @dataclass
+    class ValidatedData:
+        a: int
+        b: list[int]
+
+    return {"class": (_Plain, Validated), "dataclass": (_PlainData, ValidatedData)}
+
+
+def run(max_size: int, repeat: int) -> list[Result]:
+    """Per-call overhead of `func.validate` and `cls.validate` against undecorated
+    baselines."""
+    results: list[Result] = []
+
+    for variant, f in _variants(_scalar).items():
+        results.append(
+            measure(
+                "func.validate", f"scalar/{variant}", lambda: f(1, ""), repeat=repeat
+            )
+        )
+
+    for size in sizes(min(max_size, 10_000)):
+        value = list(range(size))
+        for variant, f in _variants(_container).items():
+            results.append(
+                measure(
+                    "func.validate",
+                    f"container/{variant}",
+                    lambda: f(value),
+                    size,
+                    repeat=repeat,
+                )
+            )
+
+    for name, (plain, validated) in _classes().items():
+        for variant, klass in (("baseline", plain), ("validated", validated)):
+            instance: Any = klass(1, [1])
+            results.append(
+                measure(
+                    "cls.validate",
+                    f"{name}.__init__/{variant}",
+                    lambda: klass(1, [1, 2, 3]),
+                    repeat=repeat,
+                )
+            )
+            results.append(
+                measure(
+                    "cls.validate",
+                    f"{name}.setattr/{variant}",
+                    lambda: setattr(instance, "a", 2),
+                    repeat=repeat,
+                )
+            )
+
+    return results
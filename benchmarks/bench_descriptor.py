@@ -0,0 +1,24 @@
+from src.pyvalidify.descriptor import Descriptor
+
+from .cases import TYPES
+from .harness import Result, measure
+
+
+def run(max_size: int, repeat: int) -> list[Result]:
+    """`Descriptor` construction and `combinations()` across type complexity."""
+    results: list[Result] = []
+    for name, type_info in TYPES.items():
+        results.append(
+            measure("Descriptor", name, lambda: Descriptor(type_info), repeat=repeat)
+        )
+        descriptor = Descriptor(type_info)
+        results.append(
+            measure(
+                "Descriptor.combinations",
+                name,
+                descriptor.combinations,
+                repeat=repeat,
+            )
+        )
+
+    return results
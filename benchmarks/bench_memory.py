@@ -0,0 +1,51 @@
+from typing import Any, Callable
+
+from src.pyvalidify.validator import describe_type, isvalid
+
+from .harness import MemoryResult, measure_memory, sizes
+
+
+SCENARIOS: dict[str, tuple[Any, Callable[[int], Any]]] = {
+    # name: (type info, payload of the given number of elements)
+    "wide_list": (list[int], lambda n: list(range(n))),
+    "wide_dict": (dict[str, int], lambda n: {str(i): i for i in range(n)}),
+    "list_of_dicts": (
+        list[dict[str, int | str]],
+        lambda n: [{"id": i, "name": str(i)} for i in range(n // 2)],
+    ),
+    "deep": (
+        list[list[list[list[int]]]],
+        lambda n: [[[[i, i + 1]] * 2] * 2 for i in range(0, n, 8)],
+    ),
+    "big_tuple": (tuple[int, ...], lambda n: tuple(range(n))),
+    "fixed_tuple": (tuple[str, list[int]], lambda n: ("", list(range(n)))),
+}
+"""Payloads of (roughly) the given number of elements."""
+
+
+def run(max_size: int, repeat: int) -> list[MemoryResult]:
+    """Peak extra memory of `isvalid` and `describe_type` relative to the size of
+    the payload."""
+    results: list[MemoryResult] = []
+    for size in sizes(max_size):
+        for name, (type_info, build) in SCENARIOS.items():
+            results.append(
+                measure_memory(
+                    "isvalid",
+                    name,
+                    lambda: build(size),
+                    lambda value: isvalid(value, type_info),
+                    size,
+                )
+            )
+            results.append(
+                measure_memory(
+                    "describe_type",
+                    name,
+                    lambda: build(size),
+                    describe_type,
+                    size,
+                )
+            )
+
+    return results
@@ -0,0 +1,265 @@
+import functools
+import math
+import operator
+from typing import Any, Callable, NamedTuple
+
+from src.pyvalidify import counters
+from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.validator import isvalid
+
+from .harness import ScalingResult, measure
+
+MEMBERS: list[tuple[Any, Any]] = [
+    # union member, conforming value
+    (int, 1),
+    (str, "a"),
+    (float, 1.0),
+    (complex, 1j),
+    (range, range(1)),
+    (bool, True),
+    (bytes, b""),
+    (bytearray, bytearray()),
+    (memoryview, memoryview(b"")),
+    (None, None),
+    (list[int], [1]),
+    (list[str], ["a"]),
+    (set[int], {1}),
+    (frozenset[str], frozenset({"a"})),
+    (dict[str, int], {"a": 1}),
+    (tuple[int, ...], (1,)),
+]
+"""Distinct supported types - unions of up to 16 members are built from them."""
+
+
+def _union(__width: int) -> Any:
+    return functools.reduce(operator.or_, [member for member, _ in MEMBERS[:__width]])
+
+
+def _nested(__depth: int) -> tuple[Any, Any]:
+    type_info, value = int | str, [1, "a"]
+    for _ in range(__depth):
+        type_info, value = list[type_info], [value]
+
+    return type_info, value[0]
+
+
+def _nested_dict(__depth: int) -> tuple[Any, Any]:
+    type_info, value = int | None, 1
+    for _ in range(__depth):
+        type_info, value = dict[str, type_info], {"a": value}
+
+    return type_info, value
+
+
+class Limit(NamedTuple):
+    """Documented growth of the operations - `base ** param * param ** degree`
+    (`base` of 1 means polynomial growth)."""
+
+    base: float
+    degree: float
+
+
+LINEAR = Limit(1, 1)
+
+
+class Sweep(NamedTuple):
+    params: list[int]
+    case: Callable[[int], tuple[Any, Any]]
+    """Type info and a conforming value for the given parameter."""
+    limits: dict[str, Limit]
+    """Limits by operation, `LINEAR` unless given."""
+    known_failures: dict[str, str] = {}
+    """Operations known to exceed their limits, by the issue causing it. They are
+    reported apart from the failures - and as failures once within the limits."""
+
+
+UNPROPAGATED_UNIONS = (
+    "combinations of unions nested in collections are enumerated, see Known "
+    "Issues in README"
+)
+
+
+SWEEPS: dict[str, Sweep] = {
+    "union_width": Sweep(
+        list(range(2, 17, 2)),
+        lambda w: (_union(w), MEMBERS[w - 1][1]),
+        {},
+    ),
+    # list of mixed items may hold any subset of the members of the union, hence
+    # the number of combinations doubles with each member
+    "list_of_union_width": Sweep(
+        list(range(2, 17, 2)),
+        lambda w: (list[_union(w)], [value for _, value in MEMBERS[:w]]),
+        {},
+        {"combinations": UNPROPAGATED_UNIONS},
+    ),
+    # actual type of the value is matched level by level against the reductions
+    # of the expected one - each level with a union below doubles the work
+    "nesting_depth": Sweep(
+        list(range(1, 9)),
+        _nested,
+        {"reductions": Limit(1, 2)},
+        {"isvalid": UNPROPAGATED_UNIONS},
+    ),
+    "dict_nesting_depth": Sweep(
+        list(range(1, 9)),
+        _nested_dict,
+        {"reductions": Limit(1, 2)},
+        {"isvalid": UNPROPAGATED_UNIONS},
+    ),
+    "tuple_arity": Sweep(
+        [1, 2, 4, 8, 16, 24, 32],
+        lambda a: (
+            tuple[tuple(MEMBERS[i % 4][0] for i in range(a))],
+            tuple(MEMBERS[i % 4][1] for i in range(a)),
+        ),
+        {},
+    ),
+    # each position multiplies the number of combinations - arities over 12 take
+    # minutes to enumerate (`isvalid` matches tuples position by position instead)
+    "tuple_of_unions_arity": Sweep(
+        list(range(1, 13)),
+        lambda a: (
+            tuple[tuple(int | str for _ in range(a))],
+            (1, "a") * (a // 2) + (1,) * (a % 2),
+        ),
+        {},
+        {"combinations": UNPROPAGATED_UNIONS},
+    ),
+}
+
+TOLERANCE = 0.5
+"""Allowed excess of the degree of the measured growth over the documented one."""
+
+
+def _operations(__type_info: Any, __value: Any) -> dict[str, Callable[[], Any]]:
+    descriptor = Descriptor(__type_info)
+    if not isvalid(__value, __type_info):
+        raise AssertionError(f"`{__value}` is expected to be a valid `{__type_info}`")
+
+    return {
+        "Descriptor": lambda: Descriptor(__type_info),
+        "combinations": descriptor.combinations,
+        "reductions": descriptor.reductions,
+        "isvalid": lambda: isvalid(__value, __type_info),
+    }
+
+
+def run(max_size: int, repeat: int) -> list[ScalingResult]:
+    """Time and operations of `Descriptor(...)`, `combinations()`, `reductions()`
+    and `isvalid` across union width, nesting depth and fixed-tuple arity."""
+    results: list[ScalingResult] = []
+    for name, sweep in SWEEPS.items():
+        for param in sweep.params:
+            for operation, call in _operations(*sweep.case(param)).items():
+                with counters.count() as counts:
+                    call()
+                timing = measure(name, operation, call, param, repeat=repeat)
+                results.append(
+                    ScalingResult(
+                        name,
+                        operation,
+                        param,
+                        timing.best,
+                        counts.descriptors,
+                        counts.combinations,
+                    )
+                )
+
+    return results
+
+
+def check(__results: list[ScalingResult]) -> list[str]:
+    """Returns the curves growing faster than documented (see `Sweep`) - growth of
+    the operations since the first parameter of the sweep is compared with the
+    limit. Operations, unlike timings, are deterministic. Known failures are
+    returned only if they stay within the limits."""
+    violations: list[str] = []
+    for (name, operation), excesses in _excesses(__results).items():
+        issue = SWEEPS[name].known_failures.get(operation)
+        if issue is None:
+            violations.extend(excesses)
+        elif len(excesses) == 0:
+            violations.append(
+                f"{name}/{operation}: known to fail ({issue}), but within the limit "
+                "- remove it from the known failures"
+            )
+
+    return violations
+
+
+def known_failures(__results: list[ScalingResult]) -> list[str]:
+    """Returns the curves growing faster than documented due to known issues, see
+    `Sweep.known_failures`."""
+    return [
+        f"{excesses[-1]} ({SWEEPS[name].known_failures[operation]})"
+        for (name, operation), excesses in _excesses(__results).items()
+        if len(excesses) != 0 and operation in SWEEPS[name].known_failures
+    ]
+
+
+def _excesses(__results: list[ScalingResult]) -> dict[tuple[str, str], list[str]]:
+    """Excesses of the limits by curve (sweep and operation)."""
+    excesses: dict[tuple[str, str], list[str]] = {}
+    curves: dict[tuple[str, str], list[ScalingResult]] = {}
+    for result in __results:
+        curves.setdefault((result.sweep, result.operation), []).append(result)
+
+    for (name, operation), curve in curves.items():
+        base, degree = SWEEPS[name].limits.get(operation, LINEAR)
+        curve.sort(key=lambda r: r.param)
+        # curve starts with the first parameter that takes any operations at all,
+        # e.g. unions of non-subscribed types are validated without any
+        measured = [r for r in curve if r.operations != 0]
+        excesses[name, operation] = []
+        if len(measured) == 0:
+            continue
+
+        first = measured[0]
+        for curr in measured[1:]:
+            limit = base ** (curr.param - first.param) * (curr.param / first.param) ** (
+                degree + TOLERANCE
+            )
+            growth = curr.operations / first.operations
+            if growth > limit:
+                excesses[name, operation].append(
+                    f"{name}/{operation}: operations grew x{growth:.2f} from "
+                    f"{first.param} to {curr.param}, limit is x{limit:.2f}"
+                )
+
+    return excesses
+
+
+def table(__results: list[ScalingResult]) -> str:
+    """Scaling table - time (and operations) of each operation by the swept
+    parameter."""
+    operations = list(dict.fromkeys(r.operation for r in __results))
+    lines: list[str] = []
+    for name in dict.fromkeys(r.sweep for r in __results):
+        rows: dict[int, dict[str, ScalingResult]] = {}
+        for result in __results:
+            if result.sweep == name:
+                rows.setdefault(result.param, {})[result.operation] = result
+
+        lines.append("")
+        lines.append(
+            f"{name:<24}" + "".join(f"{operation:>24}" for operation in operations)
+        )
+        for param, row in rows.items():
+            cells = [
+                (
+                    f"{_format_time(row[op].best)} ({row[op].operations})"
+                    if op in row
+                    else "-"
+                )
+                for op in operations
+            ]
+            lines.append(f"{param:<24}" + "".join(f"{cell:>24}" for cell in cells))
+
+    return "\n".join(lines)
+
+
+def _format_time(__seconds: float) -> str:
+    exponent = min(max(math.floor(math.log10(__seconds)) // 3, -3), 0)
+    unit = {-3: "ns", -2: "us", -1: "ms", 0: "s"}[exponent]
+    return f"{__seconds / 1000 ** exponent:.1f}{unit}"
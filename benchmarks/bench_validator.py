@@ -0,0 +1,32 @@
+from src.pyvalidify.validator import describe_type, isvalid
+
+from .cases import VALUES
+from .harness import Result, measure, sizes
+
+
+def run(max_size: int, repeat: int) -> list[Result]:
+    """`isvalid` and `describe_type` across value sizes and type complexity."""
+    results: list[Result] = []
+    for size in sizes(max_size):
+        for name, (type_info, build) in VALUES.items():
+            value = build(size)
+            results.append(
+                measure(
+                    "isvalid",
+                    name,
+                    lambda: isvalid(value, type_info),
+                    size,
+                    repeat=repeat,
+                )
+            )
+            results.append(
+                measure(
+                    "describe_type",
+                    name,
+                    lambda: describe_type(value),
+                    size,
+                    repeat=repeat,
+                )
+            )
+
+    return results
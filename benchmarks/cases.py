@@ -0,0 +1,42 @@
+from typing import Any, Callable
+
+from src.pyvalidify.descriptor import Descriptor
+
+VALUES: dict[str, tuple[Any, Callable[[int], Any]]] = {
+    # name: (type info, value of the given number of elements)
+    "flat": (list[int], lambda n: list(range(n))),
+    "nested": (
+        list[list[int]],
+        lambda n: [list(range(i, i + 10)) for i in range(0, n, 10)],
+    ),
+    "union": (list[int | str], lambda n: [i if i % 2 else str(i) for i in range(n)]),
+    "optional": (list[int | None], lambda n: [i if i % 2 else None for i in range(n)]),
+    "dict": (dict[str, int], lambda n: {str(i): i for i in range(n)}),
+    "tuple": (tuple[int, ...], lambda n: tuple(range(n))),
+    "fixed_tuple": (
+        tuple[str, list[int]],
+        lambda n: ("", list(range(n))),
+    ),
+    "deep": (
+        dict[str, list[tuple[int, str]]],
+        lambda n: {str(i): [(j, str(j)) for j in range(10)] for i in range(n // 10)},
+    ),
+    "records": (
+        list[dict[str, int | str | None]],
+        lambda n: Descriptor(list[dict[str, int | str | None]]).sample_value(
+            max(n // 10, 1), seed=0, weights={None: 0.1}, inner_size=10
+        ),
+    ),
+}
+"""Values of growing size and type complexity."""
+
+TYPES: dict[str, Any] = {
+    "scalar": int,
+    "flat": list[int],
+    "union": list[int | str | None],
+    "nested": dict[str, list[int]],
+    "tuple": tuple[int, str, list[float]],
+    "nested_union": list[dict[str, int | list[str | float]]],
+    "wide": tuple[int | str, float | None, list[int | str], dict[str, int | bool]],
+}
+"""Types of growing complexity for `Descriptor`."""
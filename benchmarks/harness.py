@@ -0,0 +1,223 @@
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+from src.pyvalidify import counters
+
+
+class Result(NamedTuple):
+    group: str
+    """Benchmarked function, e.g. `"isvalid"`."""
+    name: str
+    """Case, e.g. `"flat"` (see `cases.VALUES`)."""
+    size: Optional[int]
+    """Number of elements of the value, `None` when not applicable."""
+    number: int
+    """Calls per repeat."""
+    best: float
+    """The fastest call in seconds."""
+    mean: float
+    """Mean call time in seconds."""
+
+    @property
+    def key(self) -> str:
+        """Identifies the result across runs."""
+        if self.size is None:
+            return f"{self.group}/{self.name}"
+
+        return f"{self.group}/{self.name}/{self.size}"
+
+    def format(self, baseline: Optional[dict[str, Any]] = None) -> str:
+        line = f"{self.key:<48} {self.best * 1e6:>14.3f} us"
+        if self.size:
+            line += f" {self.best / self.size * 1e9:>10.1f} ns/elem"
+        if baseline is not None:
+            line += f"  x{self.best / baseline['best']:.2f}"
+
+        return line
+
+
+class MemoryResult(NamedTuple):
+    group: str
+    name: str
+    size: Optional[int]
+    payload: int
+    """Memory taken by the value in bytes."""
+    peak: int
+    """Peak memory allocated by the call in bytes, on top of the payload."""
+    retained: int
+    """Memory still allocated after the call in bytes, e.g. by caches."""
+    descriptors: int
+    """`Descriptor` instances created by the call, see `counters`."""
+    nodes: int
+    """Value nodes visited by the call, see `counters`."""
+
+    @property
+    def key(self) -> str:
+        if self.size is None:
+            return f"memory/{self.group}/{self.name}"
+
+        return f"memory/{self.group}/{self.name}/{self.size}"
+
+    @property
+    def ratio(self) -> float:
+        """Peak extra memory relative to the size of the payload."""
+        return self.peak / self.payload if self.payload != 0 else 0.0
+
+    def format(self, baseline: Optional[dict[str, Any]] = None) -> str:
+        line = (
+            f"{self.key:<48} {self.peak / 1024:>12.1f} KiB peak "
+            f"{self.ratio:>8.2f}x payload {self.descriptors:>10} descriptors"
+        )
+        if baseline is not None and baseline["peak"] != 0:
+            line += f"  x{self.peak / baseline['peak']:.2f}"
+
+        return line
+
+
+class ScalingResult(NamedTuple):
+    sweep: str
+    """Swept dimension of the type, e.g. `"union_width"`."""
+    operation: str
+    """Benchmarked operation, e.g. `"combinations"`."""
+    param: int
+    """Value of the swept dimension, e.g. the number of members of the union."""
+    best: float
+    """The fastest call in seconds."""
+    descriptors: int
+    """`Descriptor` instances created by the call, see `counters`."""
+    combinations: int
+    """Combinations enumerated by the call, see `counters`."""
+
+    @property
+    def key(self) -> str:
+        return f"scaling/{self.sweep}/{self.operation}/{self.param}"
+
+    @property
+    def operations(self) -> int:
+        """Deterministic measure of the work done by the call."""
+        return self.descriptors + self.combinations
+
+    def format(self, baseline: Optional[dict[str, Any]] = None) -> str:
+        line = (
+            f"{self.key:<48} {self.best * 1e6:>14.3f} us "
+            f"{self.descriptors:>10} descriptors {self.combinations:>10} combinations"
+        )
+        if baseline is not None:
+            line += f"  x{self.best / baseline['best']:.2f}"
+
+        return line
+
+
+AnyResult = Union[Result, MemoryResult, ScalingResult]
+
+
+def sizes(__max_size: int) -> list[int]:
+    """Powers of ten from 10 up to (and including) `__max_size`."""
+    result: list[int] = []
+    size = 10
+    while size <= __max_size:
+        result.append(size)
+        size *= 10
+
+    return result
+
+
+def measure(
+    __group: str,
+    __name: str,
+    __call: Callable[[], Any],
+    size: Optional[int] = None,
+    *,
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> Result:
+    """Times the call. The number of calls per repeat is picked so that a repeat
+    takes at least `min_time` - calls that take longer are repeated one at a time.
+    """
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            __call()
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10
+
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            __call()
+        timings.append((perf_counter() - start) / number)
+
+    return Result(__group, __name, size, number, min(timings), sum(timings) / repeat)
+
+
+def measure_memory(
+    __group: str,
+    __name: str,
+    __build: Callable[[], Any],
+    __call: Callable[[Any], Any],
+    size: Optional[int] = None,
+) -> MemoryResult:
+    """Traces memory allocated by the call (given the value built by `__build`) with
+    `tracemalloc`, along with the operations counted by the engine. The call is
+    made once beforehand so that the validators are compiled and cached already.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = __build()
+        payload = tracemalloc.get_traced_memory()[0] - before
+
+        __call(value)
+        gc.collect()
+        start = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        with counters.count() as counts:
+            __call(value)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return MemoryResult(
+        __group,
+        __name,
+        size,
+        payload,
+        peak - start,
+        current - start,
+        counts.descriptors,
+        counts.nodes,
+    )
+
+
+def to_json(__results: list[AnyResult], **meta: Any) -> dict[str, Any]:
+    """Results along with the environment they were collected in."""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        **meta,
+        "results": [{"key": r.key, **r._asdict()} for r in __results],
+    }
+
+
+def write_json(__path: str, __results: list[AnyResult], **meta: Any) -> None:
+    with open(__path, "w") as f:
+        json.dump(to_json(__results, **meta), f, indent=2)
+
+
+def read_json(__path: str) -> dict[str, dict[str, Any]]:
+    """Results of a previous run by their keys."""
+    with open(__path) as f:
+        return {result["key"]: result for result in json.load(f)["results"]}
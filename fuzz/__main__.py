@@ -0,0 +1,47 @@
+import argparse
+import sys
+
+from .engines import ENGINES, load
+from .harness import run
+
+
+def main(argv: "list[str] | None" = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m fuzz",
+        description="Compares validation engines with the reference engine on "
+        "random types and values.",
+    )
+    parser.add_argument(
+        "engines",
+        nargs="*",
+        help="alternative engines as `module:function` taking the value and the "
+        "type, the engines of the library by default",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", "-n", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=3, help="nesting of the types")
+    parser.add_argument(
+        "--max-length", type=int, default=4, help="length of the collections"
+    )
+    args = parser.parse_args(argv)
+
+    engines = {spec: load(spec) for spec in args.engines} if args.engines else ENGINES
+    disagreements = run(
+        engines,
+        seed=args.seed,
+        iterations=args.iterations,
+        depth=args.depth,
+        max_length=args.max_length,
+    )
+    for disagreement in disagreements:
+        print(disagreement)
+    print(
+        f"{args.iterations} cases, {len(disagreements)} disagreements "
+        f"(seed {args.seed})"
+    )
+    if len(disagreements) != 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
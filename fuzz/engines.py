@@ -0,0 +1,156 @@
+import functools
+import importlib
+from itertools import chain
+from types import NoneType, UnionType
+from typing import Any, Callable, TypeAlias, Union, get_args, get_origin
+
+from src.pyvalidify.decorators import func
+from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.sampling import SamplingPolicy
+from src.pyvalidify.validator import _compile, isvalid
+
+Engine: TypeAlias = Callable[[Any, Any], bool]
+"""Tells if the value (first argument) is valid for the type info (second)."""
+
+
+def reference(__val: Any, __type_info: Any) -> bool:
+    """Recursive isinstance-style engine, independent of the library. Values match
+    non-subscribed types exactly (`True` is not an `int`), unions member by
+    member, tuples position by position (variadic ones element by element, empty
+    included) and other collections element by element, unless they are empty.
+    Nothing is described, compiled nor cached."""
+    if __type_info is None or __type_info is NoneType:
+        return __val is None
+
+    origin, args = get_origin(__type_info), get_args(__type_info)
+    if origin is None:
+        return type(__val) is __type_info
+    elif origin is Union or origin is UnionType:
+        return any(reference(__val, member) for member in args)
+    elif type(__val) is not origin:
+        return False
+
+    elif origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return all(reference(elem, args[0]) for elem in __val)
+        return len(__val) == len(args) and all(
+            reference(elem, arg) for elem, arg in zip(__val, args)
+        )
+    elif len(__val) == 0:
+        return False
+    elif origin is dict:
+        return all(
+            reference(key, args[0]) and reference(val, args[1])
+            for key, val in __val.items()
+        )
+    return all(reference(elem, args[0]) for elem in __val)
+
+
+def baseline(__val: Any, __type_info: Any) -> bool:
+    """Combination-based engine `isvalid` was before it matched unions, tuples
+    and collections holding tuples directly - value matches the expected type if
+    the actual type (or any of its reductions, with tuples expanded) is one of
+    the combinations of the expected type. Raises `TypeError` for unsupported
+    values and `IndexError` for empty dicts."""
+    expected = Descriptor(__type_info)
+    actual = _describe(__val)
+
+    actual_group = chain.from_iterable(
+        reduction.undefined_tuple_combinations() for reduction in actual.reductions()
+    )
+
+    return len(set(actual_group) & set(expected.combinations())) > 0
+
+
+def _describe(__val: Any) -> Descriptor:
+    base = type(__val)
+    if base in (list, set, frozenset):
+        if len(__val) == 0:
+            return Descriptor(base)
+
+        args = [_describe(elem) for elem in __val]
+        if args[1:] == args[:-1]:
+            return Descriptor(base=base, args=(args[0],))
+        return Descriptor(
+            base=base, args=(Descriptor(base=None, args=tuple(set(args))),)
+        )
+
+    elif base is dict:
+        return Descriptor(
+            base=dict,
+            args=(
+                _describe(list(__val.keys())).args[0],
+                _describe(list(__val.values())).args[0],
+            ),
+        )
+
+    elif base is tuple:
+        return Descriptor(base=tuple, args=tuple(_describe(elem) for elem in __val))
+
+    return Descriptor(base)
+
+
+def compiled(__val: Any, __type_info: Any) -> bool:
+    """Freshly compiled validator, bypassing the cache of `compile_validator`."""
+    return _compile(Descriptor(__type_info))(__val)
+
+
+def _function(__type_info: Any) -> Callable[[Any], Any]:
+    def validated(value):
+        return value
+
+    validated.__annotations__ = {"value": __type_info}
+    return validated
+
+
+def _raises(__func: Callable[[Any], Any], __val: Any) -> bool:
+    try:
+        __func(__val)
+    except TypeError:
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _decorated(__type_info: Any, __specialize: bool) -> Callable[[Any], Any]:
+    # decorated functions are reused across values of the same type, so that
+    # their caches (e.g. call shapes) are exercised as well
+    return func.validate(_function(__type_info), specialize=__specialize)
+
+
+def decorated(__val: Any, __type_info: Any) -> bool:
+    """Generic wrapper of `func.validate`."""
+    return _raises(_decorated(__type_info, False), __val)
+
+
+def specialized(__val: Any, __type_info: Any) -> bool:
+    """Specialized wrapper of `func.validate`."""
+    return _raises(_decorated(__type_info, True), __val)
+
+
+def sampled(__val: Any, __type_info: Any) -> bool:
+    """`func.validate` validating one in two calls - the call that is not
+    validated must pass regardless of the value."""
+    f = func.validate(_function(__type_info), sampling=SamplingPolicy(2))
+    skipped = _raises(f, __val)
+    return _raises(f, __val) and skipped
+
+
+ENGINES: dict[str, Engine] = {
+    "isvalid": isvalid,
+    "compiled": compiled,
+    "func.validate": decorated,
+    "func.validate(specialize=True)": specialized,
+    "func.validate(sampling=2)": sampled,
+}
+"""Engines compared with the `reference` by default."""
+
+
+def load(__spec: str) -> Engine:
+    """Imports an engine given as `module:function`, e.g. `myengine:isvalid`."""
+    module, _, name = __spec.partition(":")
+    if len(name) == 0:
+        raise ValueError(f"Expected `module:function`, got `{__spec}`")
+
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,169 @@
+import functools
+import operator
+from random import Random
+from typing import Any, NamedTuple, get_args, get_origin
+
+from src.pyvalidify.descriptor import Descriptor
+
+SCALARS: dict[Any, list[Any]] = {
+    # non-subscribed type: sample values
+    int: [0, 1, -7, 2**70],
+    str: ["", "a", "validify"],
+    float: [0.0, 1.5, float("inf")],
+    bool: [True, False],
+    bytes: [b"", b"a"],
+    complex: [1j],
+    None: [None],
+}
+"""Leaves of the generated types."""
+
+HASHABLE_SCALARS = [int, str, float, bool, bytes, None]
+CONTAINERS = [list, set, frozenset, dict, tuple, "fixed_tuple"]
+
+
+class Case(NamedTuple):
+    type_info: Any
+    value: Any
+    conforming: bool
+    """Whether the value was generated to conform to the type - the engines are
+    compared with each other rather than with this flag."""
+
+
+def random_type(rng: Random, depth: int = 3, hashable: bool = False) -> Any:
+    """Random supported type hint of up to `depth` levels of containers. Hashable
+    types are used for members of sets and keys of dicts."""
+    roll = rng.random()
+    if depth == 0 or roll < 0.35:
+        return rng.choice(HASHABLE_SCALARS if hashable else list(SCALARS.keys()))
+
+    if roll < 0.5:
+        # union of distinct members, in a reproducible order
+        members = list(
+            dict.fromkeys(
+                random_type(rng, depth - 1, hashable) for _ in range(rng.randint(2, 3))
+            )
+        )
+        return functools.reduce(operator.or_, members)
+
+    container = rng.choice(
+        ["fixed_tuple", frozenset, tuple] if hashable else CONTAINERS
+    )
+    if container in (list, set, frozenset):
+        return container[random_type(rng, depth - 1, container is not list)]
+    elif container is dict:
+        return dict[random_type(rng, depth - 1, True), random_type(rng, depth - 1)]
+    elif container is tuple:
+        return tuple[random_type(rng, depth - 1, hashable), ...]
+    else:
+        return tuple[
+            tuple(
+                random_type(rng, depth - 1, hashable) for _ in range(rng.randint(1, 3))
+            )
+        ]
+
+
+def random_supported_type(rng: Random, depth: int = 3) -> Any:
+    """`random_type` accepted by `Descriptor`."""
+    while True:
+        type_info = random_type(rng, depth)
+        try:
+            Descriptor(type_info)
+        except (TypeError, ValueError):
+            continue
+        return type_info
+
+
+def _members(__type_info: Any) -> tuple[Any, ...]:
+    """Members of the union or the type itself."""
+    origin = get_origin(__type_info)
+    if origin is not None and origin not in CONTAINERS:
+        return get_args(__type_info)
+
+    return (__type_info,)
+
+
+def _is_variadic(__type_info: Any) -> bool:
+    args = get_args(__type_info)
+    return len(args) == 2 and args[1] is Ellipsis
+
+
+def conforming(rng: Random, type_info: Any, max_length: int = 4) -> Any:
+    """Random value of the type. Collections are not empty - an empty collection
+    is described without its arguments, hence does not match subscribed types."""
+    type_info = rng.choice(_members(type_info))
+    if type_info is type(None):
+        type_info = None
+
+    origin, args = get_origin(type_info), get_args(type_info)
+    if origin is None:
+        return rng.choice(SCALARS[type_info])
+
+    length = rng.randint(1, max_length)
+    if origin is list:
+        return [conforming(rng, args[0], max_length) for _ in range(length)]
+    elif origin in (set, frozenset):
+        return origin(conforming(rng, args[0], max_length) for _ in range(length))
+    elif origin is dict:
+        return {
+            conforming(rng, args[0], max_length): conforming(rng, args[1], max_length)
+            for _ in range(length)
+        }
+    elif _is_variadic(type_info):
+        return tuple(conforming(rng, args[0], max_length) for _ in range(length))
+    else:
+        return tuple(conforming(rng, arg, max_length) for arg in args)
+
+
+def _other_scalar(rng: Random, __type_info: Any) -> Any:
+    """Scalar value of a type other than the given one."""
+    others = [t for t in SCALARS.keys() if t is not __type_info]
+    return rng.choice(SCALARS[rng.choice(others)])
+
+
+def nonconforming(rng: Random, type_info: Any, max_length: int = 4) -> Any:
+    """Random value of the type with a part of it (or the whole of it) replaced
+    with a value of a different type, or an empty collection."""
+    value = conforming(rng, type_info, max_length)
+    return _mutate(rng, value)
+
+
+def _mutate(rng: Random, __value: Any) -> Any:
+    is_collection = isinstance(__value, (list, set, frozenset, dict, tuple))
+    if rng.random() < 0.25 or not is_collection:
+        # replace the whole value
+        roll = rng.random()
+        if roll < 0.15 and is_collection:
+            return type(__value)()
+        elif roll < 0.3:
+            return [__value]
+        elif roll < 0.45 and isinstance(__value, tuple):
+            return __value + __value[:1]
+        return _other_scalar(rng, type(__value) if __value is not None else None)
+
+    if isinstance(__value, dict):
+        items = list(__value.items())
+        i = rng.randrange(len(items))
+        items[i] = (items[i][0], _mutate(rng, items[i][1]))
+        return dict(items)
+
+    # iteration order of sets depends on the hash seed
+    elements = (
+        list(__value)
+        if type(__value) is list or type(__value) is tuple
+        else sorted(__value, key=repr)
+    )
+    i = rng.randrange(len(elements))
+    try:
+        elements[i] = _mutate(rng, elements[i])
+        return type(__value)(elements)
+    except TypeError:
+        # mutated element of a set is not hashable
+        return elements
+
+
+def random_case(rng: Random, depth: int = 3, max_length: int = 4) -> Case:
+    type_info = random_supported_type(rng, depth)
+    if rng.random() < 0.5:
+        return Case(type_info, conforming(rng, type_info, max_length), True)
+
+    return Case(type_info, nonconforming(rng, type_info, max_length), False)
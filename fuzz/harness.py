@@ -0,0 +1,217 @@
+from random import Random
+from typing import Any, Callable, Iterator, NamedTuple, get_args, get_origin
+
+from .engines import Engine, baseline, reference
+from .generators import CONTAINERS, Case, random_case
+
+
+def outcome(__engine: Engine, __val: Any, __type_info: Any) -> str:
+    """Result of the engine as a comparable string - raised exceptions are
+    outcomes too."""
+    try:
+        return str(bool(__engine(__val, __type_info)))
+    except Exception as e:
+        return type(e).__name__
+
+
+class Disagreement(NamedTuple):
+    engine: str
+    type_info: Any
+    value: Any
+    expected: str
+    """Outcome of the reference engine."""
+    actual: str
+
+    def __str__(self) -> str:
+        return (
+            f"{self.engine}: isvalid({self.value!r}, {self.type_info}) is "
+            f"{self.actual}, reference engine says {self.expected}"
+        )
+
+
+class KnownIssue(NamedTuple):
+    description: str
+    applies: Callable[[Disagreement], bool]
+    """Tells if the disagreement is caused by the issue."""
+
+
+def _nests_union(__type_info: Any, __collections: int = 0) -> bool:
+    """Whether a union is nested in a collection which itself is in a collection
+    (tuples aside, they are matched position by position)."""
+    origin, args = get_origin(__type_info), get_args(__type_info)
+    if origin is None:
+        return False
+    elif origin not in CONTAINERS:
+        # union
+        return __collections >= 2 or any(
+            _nests_union(member, __collections) for member in args
+        )
+
+    collections = 0 if origin is tuple else __collections + 1
+    return any(_nests_union(arg, collections) for arg in args if arg is not Ellipsis)
+
+
+def _unpropagated_union(__disagreement: Disagreement) -> bool:
+    return (
+        __disagreement.expected == "True"
+        and __disagreement.actual == "False"
+        and _nests_union(__disagreement.type_info)
+        and outcome(baseline, __disagreement.value, __disagreement.type_info) == "False"
+    )
+
+
+KNOWN_ISSUES: list[KnownIssue] = [
+    KnownIssue(
+        "unions are not propagated outward within nested collections, e.g. "
+        "`[[1, 'a'], ['b']]` of `list[list[int | str]]` is rejected (see Known "
+        "Issues in README) - allowed where the `baseline` engine rejects the "
+        "value as well",
+        _unpropagated_union,
+    ),
+]
+"""Disagreements with the reference engine which are not reported."""
+
+
+def explained(__disagreement: Disagreement) -> bool:
+    """Whether the disagreement is caused by one of the `KNOWN_ISSUES`."""
+    return any(issue.applies(__disagreement) for issue in KNOWN_ISSUES)
+
+
+def compare(
+    __case: Case, __engines: dict[str, Engine], reference: Engine = reference
+) -> list[Disagreement]:
+    """Disagreements of the engines with the reference on the case, apart from
+    those caused by the `KNOWN_ISSUES`."""
+    expected = outcome(reference, __case.value, __case.type_info)
+    disagreements: list[Disagreement] = []
+    for name, engine in __engines.items():
+        actual = outcome(engine, __case.value, __case.type_info)
+        if actual != expected:
+            disagreement = Disagreement(
+                name, __case.type_info, __case.value, expected, actual
+            )
+            if not explained(disagreement):
+                disagreements.append(disagreement)
+
+    return disagreements
+
+
+def _shrink_value(__val: Any) -> Iterator[Any]:
+    """Candidates smaller than the value - its parts and the value with parts
+    removed or shrunk."""
+    if isinstance(__val, dict):
+        items = list(__val.items())
+        for i in range(len(items)):
+            yield dict(items[:i] + items[i + 1 :])
+        for i, (key, val) in enumerate(items):
+            yield from (val, key)
+            for smaller in _shrink_value(val):
+                yield dict(items[:i] + [(key, smaller)] + items[i + 1 :])
+
+    elif isinstance(__val, (list, tuple, set, frozenset)):
+        elements = (
+            list(__val) if isinstance(__val, (list, tuple)) else sorted(__val, key=repr)
+        )
+        if len(elements) > 2:
+            half = len(elements) // 2
+            yield from (
+                _rebuild(__val, elements[:half]),
+                _rebuild(__val, elements[half:]),
+            )
+        for i in range(len(elements)):
+            yield _rebuild(__val, elements[:i] + elements[i + 1 :])
+        for i, elem in enumerate(elements):
+            yield elem
+            for smaller in _shrink_value(elem):
+                yield _rebuild(__val, elements[:i] + [smaller] + elements[i + 1 :])
+
+    elif isinstance(__val, (str, bytes)) and len(__val) > 1:
+        yield __val[:1]
+    elif type(__val) is int and __val not in (0, 1):
+        yield 1
+
+
+def _rebuild(__original: Any, __elements: list[Any]) -> Any:
+    try:
+        return type(__original)(__elements)
+    except TypeError:
+        # unhashable element of a set
+        return __elements
+
+
+def _shrink_type(__type_info: Any) -> Iterator[Any]:
+    """Candidates simpler than the type - its members and arguments, and the type
+    with them simplified."""
+    origin, args = get_origin(__type_info), get_args(__type_info)
+    if origin is None:
+        return
+
+    if origin not in CONTAINERS:
+        # union
+        yield from args
+        return
+
+    yield from (arg for arg in args if arg is not Ellipsis)
+    if origin is tuple and Ellipsis not in args and len(args) > 1:
+        for i in range(len(args)):
+            yield tuple[args[:i] + args[i + 1 :]]
+    for i, arg in enumerate(args):
+        for simpler in _shrink_type(arg):
+            yield origin[args[:i] + (simpler,) + args[i + 1 :]]
+
+
+def _size(__type_info: Any, __val: Any) -> int:
+    return len(repr(__type_info)) + len(repr(__val))
+
+
+def shrink(
+    __disagreement: Disagreement, __engine: Engine, reference: Engine = reference
+) -> Disagreement:
+    """Greedily shrinks the type and the value as long as the engines still
+    disagree for a reason other than the `KNOWN_ISSUES`. Each step makes the
+    reproducer strictly smaller, hence it ends."""
+    current = __disagreement
+    shrunk = True
+    while shrunk:
+        shrunk = False
+        candidates = [(t, current.value) for t in _shrink_type(current.type_info)] + [
+            (current.type_info, v) for v in _shrink_value(current.value)
+        ]
+        for type_info, val in candidates:
+            if _size(type_info, val) >= _size(current.type_info, current.value):
+                continue
+            expected = outcome(reference, val, type_info)
+            actual = outcome(__engine, val, type_info)
+            candidate = Disagreement(current.engine, type_info, val, expected, actual)
+            if actual != expected and not explained(candidate):
+                current = candidate
+                shrunk = True
+                break
+
+    return current
+
+
+def run(
+    __engines: dict[str, Engine],
+    *,
+    seed: int = 0,
+    iterations: int = 1000,
+    depth: int = 3,
+    max_length: int = 4,
+) -> list[Disagreement]:
+    """Compares the engines with the reference on random cases. Returns the
+    distinct shrunk disagreements - disagreements of an engine on a type already
+    reported are not shrunk again."""
+    rng = Random(seed)
+    seen: set[tuple[str, str]] = set()
+    found: dict[str, Disagreement] = {}
+    for _ in range(iterations):
+        case = random_case(rng, depth, max_length)
+        for disagreement in compare(case, __engines):
+            key = (disagreement.engine, repr(disagreement.type_info))
+            if key not in seen:
+                seen.add(key)
+                shrunk = shrink(disagreement, __engines[disagreement.engine])
+                found.setdefault(str(shrunk), shrunk)
+
+    return list(found.values())
@@ -1,5 +1,26 @@
+from . import config, counters, hooks, metrics, profiling
 from .descriptor import Descriptor
-from .validator import describe_type, isvalid
-from .decorators import cls, func
+from .validator import compile_validator, describe_type, estimate_cost, isvalid
+from .sampling import SamplingPolicy, get_default_policy, set_default_policy
+from .decorators import ValidationWarning, cls, func
+from .planning import explain
 
-__all__ = ["Descriptor", "describe_type", "isvalid", "cls", "func"]
+__all__ = [
+    "config",
+    "counters",
+    "hooks",
+    "metrics",
+    "profiling",
+    "Descriptor",
+    "describe_type",
+    "isvalid",
+    "compile_validator",
+    "estimate_cost",
+    "SamplingPolicy",
+    "get_default_policy",
+    "set_default_policy",
+    "cls",
+    "func",
+    "ValidationWarning",
+    "explain",
+]
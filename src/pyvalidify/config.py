@@ -0,0 +1,141 @@
+import os
+from typing import Literal, NamedTuple, Optional, TypeAlias
+
+from .sampling import SamplingPolicy, to_policy
+
+
+Mode: TypeAlias = Literal["validate", "sample", "off"]
+"""What the decorators do with the decorated function (or class):
+- `"validate"` - validate every call (unless given a sampling policy)
+- `"sample"` - validate some of the calls, see `SamplingPolicy`
+- `"off"` - return it unchanged, without any overhead
+"""
+
+MODES: tuple[Mode, ...] = ("validate", "sample", "off")
+
+ENV_VAR = "PYVALIDIFY_MODE"
+"""Environment variable configuring the modes - comma-separated rules, each either
+a mode applying to all the modules or `<module prefix>=<mode>`, e.g.
+`"off,myapp.api=validate,myapp.api.hot=sample:100"`. Sampled modes may specify the
+interval after a colon (10 by default)."""
+
+DEFAULT_SAMPLING_INTERVAL = 10
+
+
+class Rule(NamedTuple):
+    mode: Mode
+    sampling: "SamplingPolicy | int | None"
+    """Policy for the `"sample"` mode, applied unless the decorator is given one.
+    Integer `n` gives each of the functions its own policy validating one in `n`
+    calls."""
+
+
+_rules: dict[str, Rule] = {}
+"""Rules set with `set_mode`, by module prefix. Empty prefix applies to all
+modules."""
+
+_decorated: dict[str, Mode] = {}
+
+
+def set_mode(
+    __mode: Mode,
+    module: str = "",
+    *,
+    sampling: "SamplingPolicy | int | None" = None,
+) -> None:
+    """Sets the mode of the decorators for functions and classes defined in the
+    module or package - the most specific (longest) prefix matching the name of
+    the module wins. Takes precedence over the environment variable (`ENV_VAR`)
+    and `__debug__` (decorators are off when Python runs with `-O`). Applies to
+    functions and classes decorated afterwards.
+
+    ### Parameters
+    - `module` - name of the module or package, all of them by default
+    - `sampling` - policy for the `"sample"` mode (integer `n` is a shorthand for
+    `SamplingPolicy(n)`), one in `DEFAULT_SAMPLING_INTERVAL` calls by default
+
+    ### Examples
+    ```
+    set_mode("off", "myapp.hot_path")
+    set_mode("sample", "myapp.api", sampling=100)
+    ```
+
+    ### Raises
+    - `ValueError` when `__mode` is not one of `MODES`
+    """
+    _rules[module] = _rule(__mode, sampling)
+
+
+def reset() -> None:
+    """Removes the rules set with `set_mode` and forgets the decorated functions."""
+    _rules.clear()
+    _decorated.clear()
+
+
+def _rule(__mode: str, __sampling: "SamplingPolicy | int | None" = None) -> Rule:
+    if __mode not in MODES:
+        raise ValueError(f"Expected one of {MODES}, got `{__mode}`")
+
+    if __mode == "sample":
+        # validating the policy right away
+        to_policy(__sampling)
+        return Rule(__mode, __sampling or DEFAULT_SAMPLING_INTERVAL)
+    else:
+        return Rule(__mode, None)  # pyright: ignore
+
+
+def _environment_rules() -> dict[str, Rule]:
+    """Parses the environment variable (`ENV_VAR`).
+
+    ### Raises
+    - `ValueError` when the variable is malformed
+    """
+    rules: dict[str, Rule] = {}
+    for entry in os.environ.get(ENV_VAR, "").split(","):
+        entry = entry.strip()
+        if len(entry) == 0:
+            continue
+
+        module, _, mode = entry.rpartition("=")
+        mode, _, interval = mode.partition(":")
+        try:
+            rules[module.strip()] = _rule(
+                mode.strip(), int(interval) if len(interval) != 0 else None
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid `{ENV_VAR}` entry `{entry}`: {e}") from None
+
+    return rules
+
+
+def _match(__rules: dict[str, Rule], __module: str) -> Optional[Rule]:
+    matching = [
+        prefix
+        for prefix in __rules.keys()
+        if prefix == "" or __module == prefix or __module.startswith(prefix + ".")
+    ]
+    return __rules[max(matching, key=len)] if len(matching) != 0 else None
+
+
+def resolve(__module: str) -> Rule:
+    """Returns the rule applying to the module - set with `set_mode`, the
+    environment variable or, if neither matches, `"validate"` (`"off"` when
+    Python runs with `-O`)."""
+    rule = _match(_rules, __module) or _match(_environment_rules(), __module)
+    if rule is not None:
+        return rule
+
+    return Rule("validate" if __debug__ else "off", None)
+
+
+def register(__qualname: str, __mode: Mode) -> None:
+    """Records the mode the decorated function or class ended up with."""
+    _decorated[__qualname] = __mode
+
+
+def decorated() -> dict[str, Mode]:
+    """Returns the modes of the decorated functions and classes by their fully
+    qualified names (module and qualified name), e.g.
+    `{"myapp.api.Basket.add_item": "validate", "myapp.hot_path.step": "off"}`.
+    Functions without annotated parameters are not wrapped, hence not listed."""
+    return dict(_decorated)
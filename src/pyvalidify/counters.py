@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+
+enabled = False
+"""Whether the engine counts its operations - checked before anything is counted,
+see `count`."""
+
+descriptors = 0
+"""Number of `Descriptor` instances created."""
+nodes = 0
+"""Number of value nodes visited by `describe_type` - the value itself, its
+elements, their elements and so on."""
+combinations = 0
+"""Number of combinations enumerated by `Descriptor.combinations` and
+`Descriptor.undefined_tuple_combinations`, including the nested ones."""
+
+
+class Counts:
+    """Operations counted within `count`."""
+
+    __slots__ = ("descriptors", "nodes", "combinations")
+
+    def __init__(self) -> None:
+        self.descriptors = 0
+        self.nodes = 0
+        self.combinations = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"Counts(descriptors={self.descriptors}, nodes={self.nodes}, "
+            f"combinations={self.combinations})"
+        )
+
+
+@contextmanager
+def count() -> Iterator[Counts]:
+    """Counts operations of the engine within the block. Unlike timings, the counts
+    are deterministic, hence suitable for performance regression tests. Nested
+    blocks add up to the outer ones.
+
+    ### Examples
+    ```
+    with counters.count() as counts:
+        isvalid(list(range(1000)), list[int])
+
+    assert counts.nodes <= 1001
+    ```
+    """
+    global enabled, descriptors, nodes, combinations
+
+    previous = (enabled, descriptors, nodes, combinations)
+    enabled = True
+    descriptors = nodes = combinations = 0
+    counts = Counts()
+    try:
+        yield counts
+    finally:
+        counts.descriptors = descriptors
+        counts.nodes = nodes
+        counts.combinations = combinations
+        enabled = previous[0]
+        descriptors = previous[1] + counts.descriptors
+        nodes = previous[2] + counts.nodes
+        combinations = previous[3] + counts.combinations
@@ -1,31 +1,347 @@
 from copy import deepcopy
+from fnmatch import fnmatchcase
+from dataclasses import MISSING, Field, InitVar, is_dataclass
 import functools
+from time import perf_counter
+import warnings
 from inspect import Parameter, Signature, getmro
-from typing import Any
+from typing import Any, Callable, ClassVar, Iterable, NamedTuple, get_origin
 
-from .validator import describe_type, isvalid
+from . import config as _config
+from . import hooks as _hooks
+from . import metrics as _metrics
+from . import sampling as _sampling
+from .validator import compile_validator, describe_type, estimate_cost, isvalid
 
 
 class cls:
     @staticmethod
-    def setattr_validate(__func, *, annotations: dict[str, Any]):
+    def setattr_validate(
+        __func,
+        *,
+        annotations: dict[str, Any],
+        sampling: "_sampling.SamplingPolicy | int | None" = None,
+        metrics: "_metrics.Metrics | None" = None,
+    ):
+        if metrics is None:
+            metrics = _metrics.Metrics(__func.__qualname__)
+
+        if isinstance(getattr(__func, _MARKER, None), _Validated):
+            # inherited from a validated class, annotations are merged already
+            __func = getattr(__func, _MARKER).func
+
+        _policy = _sampling.to_policy(sampling)
+        validators = {name: _compiled(_type) for name, _type in annotations.items()}
 
         @functools.wraps(__func)
         def wrapper(self, name, val):
 
             if name in annotations.keys():
-                if not isvalid(val, annotations[name]):
-                    raise TypeError(
-                        f"Property `{name}` is not valid. Expected `{annotations[name]}`, "
-                        f"got `{describe_type(annotations[name]).raw}`"
+                metrics.calls += 1
+                policy = _policy if _policy is not None else _sampling._default_policy
+                if policy is None or policy.sample():
+                    hook = (
+                        _hooks.start(
+                            "cls.validate",
+                            annotations[name],
+                            f"{metrics.name}.{name}",
+                            _hooks.size(val),
+                        )
+                        if _hooks.enabled
+                        else None
                     )
+                    start = perf_counter()
+                    valid = None
+                    try:
+                        valid = validators[name](val)
+                        if not valid:
+                            metrics.failed(start)
+                            if policy is not None:
+                                policy.record(False)
+                            raise TypeError(
+                                f"Property `{name}` is not valid. Expected `{annotations[name]}`, "
+                                f"got `{describe_type(val).raw}`"
+                            )
+                        elif policy is not None:
+                            policy.record(True)
+                        metrics.passed(start, _hooks.size(val))
+                    finally:
+                        if hook is not None:
+                            _hooks.end(*hook, valid)
 
             return __func(self, name, val)
 
+        setattr(wrapper, _MARKER, _Validated(__func, False, sampling))
         return wrapper
 
     @staticmethod
-    def validate(__class):
+    def _has_generated_init(__class) -> bool:
+        """Tells if the dataclass uses `__init__` generated by `dataclasses` (or by
+        `cls._dataclass_init`) rather than defined by the user."""
+        init = vars(__class).get("__init__")
+        if (
+            "__dataclass_fields__" not in vars(__class)
+            or not __class.__dataclass_params__.init
+            or init is None
+        ):
+            return False
+        elif getattr(init, _GENERATED_INIT, False):
+            return True
+        elif getattr(
+            init, "__qualname__", None
+        ) != f"{__class.__qualname__}.__init__" or hasattr(init, "__wrapped__"):
+            return False
+
+        code = init.__code__
+        if not hasattr(code, "co_qualname"):
+            # Python 3.10, code objects do not know their qualified names
+            return code.co_filename == "<string>"
+        # `dataclasses` renames the functions it generates, methods defined in the
+        # class body keep the qualified name of their code
+        return code.co_qualname != init.__qualname__
+
+    @staticmethod
+    def _dataclass_init(
+        __class,
+        __setattr: Callable,
+        __policy: "_sampling.SamplingPolicy | None",
+        __metrics: "_metrics.Metrics | None" = None,
+    ) -> "Callable | None":
+        """Generates `__init__` of a dataclass validating each of the fields once,
+        before they are assigned - bypassing `_ValidatedField`s or, for the remaining
+        fields, with the given `__setattr` (not validating). Mirrors the `__init__`
+        generated by `dataclasses` (defaults, default factories, `init=False`
+        fields, `InitVar`, `kw_only` and `__post_init__`). Returns `None` if the
+        dataclass does not use a generated `__init__`.
+        """
+        if not cls._has_generated_init(__class):
+            return None
+
+        init = vars(__class)["__init__"]
+
+        namespace: dict[str, Any] = {
+            "_pyvalidify_setattr": (
+                object.__setattr__ if __class.__dataclass_params__.frozen else __setattr
+            ),
+            "_pyvalidify_missing": _MISSING,
+        }
+        positional: list[str] = []
+        keyword: list[str] = []
+        defaults: list[str] = []
+        checks: list[tuple[str, Any, str]] = []
+        assignments: list[str] = []
+        initvars: list[str] = []
+
+        for i, f in enumerate(__class.__dataclass_fields__.values()):
+            if f.type is ClassVar or get_origin(f.type) is ClassVar:
+                continue
+
+            is_initvar = isinstance(f.type, InitVar) or f.type is InitVar
+            if f.init:
+                if f.default is not MISSING:
+                    namespace[f"_pyvalidify_default_{i}"] = f.default
+                    param = f"{f.name}=_pyvalidify_default_{i}"
+                elif f.default_factory is not MISSING:
+                    namespace[f"_pyvalidify_factory_{i}"] = f.default_factory
+                    param = f"{f.name}=_pyvalidify_missing"
+                    defaults.append(
+                        f"    if {f.name} is _pyvalidify_missing:\n"
+                        f"        {f.name} = _pyvalidify_factory_{i}()\n"
+                    )
+                else:
+                    param = f.name
+
+                (keyword if f.kw_only else positional).append(param)
+
+            elif not is_initvar and f.default is not MISSING:
+                namespace[f"_pyvalidify_default_{i}"] = f.default
+                defaults.append(f"    {f.name} = _pyvalidify_default_{i}\n")
+
+            elif not is_initvar and f.default_factory is not MISSING:
+                namespace[f"_pyvalidify_factory_{i}"] = f.default_factory
+                defaults.append(f"    {f.name} = _pyvalidify_factory_{i}()\n")
+
+            else:
+                # not assigned in __init__
+                continue
+
+            if is_initvar:
+                initvars.append(f.name)
+                if isinstance(f.type, InitVar):
+                    checks.append((f.name, f.type.type, ""))
+            elif isinstance(vars(__class).get(f.name), _ValidatedField):
+                checks.append((f.name, f.type, ""))
+                namespace[f"_pyvalidify_store_{i}"] = vars(__class)[f.name].store
+                assignments.append(
+                    f"    _pyvalidify_store_{i}(_pyvalidify_self, {f.name})\n"
+                )
+            else:
+                checks.append((f.name, f.type, ""))
+                assignments.append(
+                    f"    _pyvalidify_setattr(_pyvalidify_self, {f.name!r}, {f.name})\n"
+                )
+
+        if hasattr(__class, "__post_init__"):
+            assignments.append(
+                f"    _pyvalidify_self.__post_init__({', '.join(initvars)})\n"
+            )
+
+        params = ", ".join(
+            ["_pyvalidify_self", *positional, *(["*", *keyword] if keyword else [])]
+        )
+        source = (
+            f"def __init__({params}):\n"
+            + "".join(defaults)
+            + "".join(
+                _generate_checks(
+                    checks,
+                    namespace,
+                    __policy,
+                    __metrics or _metrics.Metrics(init.__qualname__),
+                    "cls.validate",
+                )
+            )
+            + "".join(assignments or ["    pass\n"])
+        )
+        exec(source, namespace)
+
+        generated = functools.wraps(init)(namespace["__init__"])
+        setattr(generated, _GENERATED_INIT, True)
+        return generated
+
+    @staticmethod
+    def _install_fields(
+        __class,
+        annotations: dict[str, Any],
+        policy: "_sampling.SamplingPolicy | None",
+        max_cost: "int | None" = None,
+        strict: bool = False,
+        metrics: "_metrics.Metrics | None" = None,
+    ) -> dict[str, Any]:
+        """Installs `_ValidatedField` for each of the annotated attributes that can
+        hold one. Returns annotations of the remaining attributes - `__setattr__` is
+        to validate those.
+        """
+        annotations = {
+            name: _type
+            for name, _type in annotations.items()
+            # class variables and init-only pseudo-fields of dataclasses
+            if _type is not ClassVar
+            and get_origin(_type) is not ClassVar
+            and _type is not InitVar
+            and not isinstance(_type, InitVar)
+        }
+        for name, _type in annotations.items():
+            _analyze(f"{__class.__qualname__}.{name}", _type, max_cost, strict)
+
+        if is_dataclass(__class) and __class.__dataclass_params__.frozen:
+            # assignments raise `FrozenInstanceError` anyway, fields are validated
+            # by the generated `__init__`
+            return {}
+
+        remaining: dict[str, Any] = {}
+        for name, _type in annotations.items():
+
+            # class attribute as found by the `getattr`, without invoking descriptors
+            attr = next(
+                (vars(m)[name] for m in getmro(__class) if name in vars(m)), _MISSING
+            )
+            if isinstance(attr, _ValidatedField):
+                # inherited from a validated class
+                field = _ValidatedField(
+                    name, _type, attr.inner, attr.default, policy, metrics
+                )
+            elif hasattr(type(attr), "__set__"):
+                # e.g. property or slot
+                field = _ValidatedField(name, _type, attr, _MISSING, policy, metrics)
+            elif isinstance(attr, Field) or hasattr(type(attr), "__get__"):
+                # dataclass would remove the descriptor and methods are not to be
+                # overwritten
+                remaining[name] = _type
+                continue
+            else:
+                # default value or nothing
+                field = _ValidatedField(name, _type, None, attr, policy, metrics)
+
+            setattr(__class, name, field)
+
+        return remaining
+
+    @staticmethod
+    def _selected(
+        __name: str, include: "Iterable[str] | None", exclude: Iterable[str]
+    ) -> bool:
+        """Tells if the method is to be validated. Hot dunders (`_HOT_DUNDERS`) are
+        only validated if explicitly included."""
+        if any(fnmatchcase(__name, pattern) for pattern in exclude):
+            return False
+        elif include is None:
+            return __name not in _HOT_DUNDERS
+        else:
+            return any(fnmatchcase(__name, pattern) for pattern in include)
+
+    @staticmethod
+    def validate(
+        __class=None,
+        *,
+        sampling: "_sampling.SamplingPolicy | int | None" = None,
+        include: "Iterable[str] | None" = None,
+        exclude: Iterable[str] = (),
+        max_cost: "int | None" = None,
+        strict: bool = False,
+    ):
+        """Validates annotated attributes of the class on assignment and arguments of
+        its methods. Annotated attributes are replaced with data descriptors (see
+        `_ValidatedField`), hence assignments of other attributes are not affected.
+        Dataclasses get `__init__` validating each of the fields once.
+
+        ### Parameters
+        - `sampling` - validate only some of the calls, see `SamplingPolicy`. Integer
+        `n` gives each method its own policy validating one in `n` calls.
+        - `include` - `fnmatch` patterns of names of the methods (including class
+        methods and property setters) to be validated, all of them by default -
+        except for the hot dunders like `__eq__` or `__hash__`, see `_HOT_DUNDERS`
+        - `exclude` - patterns of names of the methods not to be validated, takes
+        precedence over `include`
+        - `max_cost`, `strict` - see `func.validate`, apply to the annotated
+        attributes as well
+
+        Methods without annotated parameters are never wrapped.
+
+        ### Examples
+        ```
+        @cls.validate(include=["add_*", "__init__"], exclude=["add_unchecked"])
+        class Basket: ...
+        ```
+        """
+        if __class is None:
+            return functools.partial(
+                cls.validate,
+                sampling=sampling,
+                include=include,
+                exclude=exclude,
+                max_cost=max_cost,
+                strict=strict,
+            )
+
+        rule = _config.resolve(__class.__module__)
+        _config.register(
+            f"{__class.__module__}.{__class.__qualname__}",
+            "sample" if rule.mode == "validate" and sampling is not None else rule.mode,
+        )
+        if rule.mode == "off":
+            return __class
+        elif sampling is None:
+            sampling = rule.sampling
+
+        include = None if include is None else tuple(include)
+        exclude = tuple(exclude)
+        options: dict[str, Any] = {
+            "sampling": sampling,
+            "max_cost": max_cost,
+            "strict": strict,
+        }
+
         _vars: dict[str, Any] = {}
         for m in getmro(__class):
             if m == object and "__setattr__" not in _vars.keys():
@@ -50,38 +366,77 @@ class cls:
 
         # print(pformat(_vars))
 
+        # dataclass fields are validated once by the generated __init__ instead of
+        # both the validated __init__ and assignments
+        _generate_init = cls._has_generated_init(__class) and cls._selected(
+            "__init__", include, exclude
+        )
+
         for name, value in _vars.items():
-            if name == "__setattr__" and "__annotations__" in _vars.keys():
-                # it's default setter
-                __class.__setattr__ = cls.setattr_validate(
-                    __class.__setattr__, annotations=_vars["__annotations__"]
-                )
+            if name == "__setattr__":
+                # see below
+                continue
+
+            elif not cls._selected(name, include, exclude):
+                continue
+
+            elif name == "__init__" and _generate_init:
+                continue
 
             elif callable(value):
                 # it's callable
-                setattr(__class, name, func.validate(value))
+                _validated = func.validate(value, **options)
+                if _validated is not value:
+                    setattr(__class, name, _validated)
 
             elif isinstance(value, classmethod):
-                setattr(
-                    __class,
-                    name,
-                    classmethod(func.validate(getattr(__class, name).__func__)),
-                )
+                _validated = func.validate(value.__func__, **options)
+                if _validated is not value.__func__:
+                    setattr(__class, name, classmethod(_validated))
 
             elif isinstance(value, property) and value.fset is not None:
                 # it's a property defined with a `property` tag and it has
                 # a setter method linked
+                _validated = func.validate(value.fset, **options)
+                if _validated is value.fset:
+                    continue
+
                 setattr(
                     __class,
                     name,
                     property(
                         fget=value.fget,
-                        fset=func.validate(value.fset),
+                        fset=_validated,
                         fdel=value.fdel,
                         doc=value.__doc__,
                     ),
                 )
 
+        # properties are final at this point, the fields can wrap them
+        _policy = _sampling.to_policy(sampling)
+        _setattr = __class.__setattr__
+        _name = f"{__class.__module__}.{__class.__qualname__}"
+        remaining = cls._install_fields(
+            __class,
+            _vars.get("__annotations__", {}),
+            _policy,
+            max_cost,
+            strict,
+            _metrics.register(_name),
+        )
+        if len(remaining) != 0:
+            __class.__setattr__ = cls.setattr_validate(
+                _setattr,
+                annotations=remaining,
+                sampling=_policy,
+                metrics=_metrics.register(_name),
+            )
+
+        if _generate_init:
+            __class.__init__ = cls._dataclass_init(
+                __class, _setattr, _policy, _metrics.register(f"{_name}.__init__")
+            )
+
         return __class
 
 
@@ -108,32 +463,715 @@ class func:
         return combined_kwargs
 
     @staticmethod
-    def validate(__func):
-        @functools.wraps(__func)
-        def wrapper(*args, **kwargs):
+    def _plan(
+        __func,
+        max_cost: "int | None" = None,
+        strict: bool = False,
+        report: bool = True,
+    ) -> "list[_PlannedParameter]":
+        """Resolves the signature of the function into a list of parameters to be
+        validated. Parameters with non-subscribed types (cheap to check) go first.
+        Annotations are analyzed and compiled right away, see `_analyze`."""
+        try:
             sig = Signature.from_callable(__func)
-            arguments = sig.bind(*args, **kwargs).arguments
-            for key, param in sig.parameters.items():
+        except ValueError:
+            # builtins without signature, e.g. inherited from `object`
+            return []
+
+        keywords = frozenset(
+            key
+            for key, param in sig.parameters.items()
+            if param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        )
+
+        plan: list[_PlannedParameter] = []
+        for i, (key, param) in enumerate(sig.parameters.items()):
+            if key == "self" or param.annotation == Parameter.empty:
+                continue
+
+            if param.kind == Parameter.VAR_POSITIONAL:
+                # *args
+                _type = tuple[param.annotation, ...]
+            elif param.kind == Parameter.VAR_KEYWORD:
+                # **kwargs
+                _type = dict[str, param.annotation]
+            else:
+                _type = param.annotation
+
+            cost = _analyze(
+                f"{__func.__qualname__}({key})", _type, max_cost, strict, report
+            )
+            plan.append(
+                _PlannedParameter(
+                    key,
+                    _type,
+                    _getter(i, key, param.kind, keywords),
+                    _compiled(_type),
+                    # non-subscribed types and unions of those
+                    cost == 1,
+                    cost,
+                )
+            )
+
+        # sort is stable - the order of the signature is kept otherwise
+        plan.sort(key=lambda p: not p.is_scalar)
+        return plan
+
+    @staticmethod
+    def analyze(__func) -> "dict[str, int | None]":
+        """Returns the estimated cost of validating each of the annotated parameters
+        of the function (see `estimate_cost`), `None` for unsupported annotations.
+
+        ### Examples
+        ```
+        def foo(a: int, b: list[int | str], *args: str) -> None: ...
+
+        func.analyze(foo)  # {"a": 1, "b": 5, "args": 2}
+        ```
+        """
+        _validated = getattr(__func, _MARKER, None)
+        if isinstance(_validated, _Validated):
+            __func = _validated.func
+
+        return {p.name: p.cost for p in func._plan(__func, report=False)}
+
+    @staticmethod
+    def _specialize(
+        __func,
+        plan: "list[_PlannedParameter]",
+        policy: "_sampling.SamplingPolicy | None",
+        metrics: "_metrics.Metrics",
+    ):
+        """Generates a wrapper with the exact signature of the function (names,
+        kinds and defaults of the parameters) and the checks inlined into its body.
+        Defaults are substituted in the body, after the checks, hence an argument
+        equal to the default is validated as in the generic wrapper.
+        """
+        sig = Signature.from_callable(__func)
+        namespace: dict[str, Any] = {
+            "_pyvalidify_func": __func,
+            "_pyvalidify_missing": _MISSING,
+        }
+
+        params: list[str] = []
+        call_args: list[str] = []
+        defaults: dict[str, str] = {}
+        kinds = [param.kind for param in sig.parameters.values()]
+        for i, (key, param) in enumerate(sig.parameters.items()):
+            if param.default is not Parameter.empty:
+                defaults[key] = f"_pyvalidify_default_{i}"
+                namespace[defaults[key]] = param.default
+
+            if param.kind == Parameter.VAR_POSITIONAL:
+                params.append(f"*{key}")
+                call_args.append(f"*{key}")
+            elif param.kind == Parameter.VAR_KEYWORD:
+                params.append(f"**{key}")
+                call_args.append(f"**{key}")
+            else:
                 if (
-                    key != "self"
-                    and key in arguments.keys()
-                    and param.annotation != Parameter.empty
+                    param.kind == Parameter.KEYWORD_ONLY
+                    and Parameter.VAR_POSITIONAL not in kinds
+                    and "*" not in params
                 ):
-                    if param.kind == Parameter.VAR_POSITIONAL:
-                        # *args
-                        _type = tuple[param.annotation]
-                    elif param.kind == Parameter.VAR_KEYWORD:
-                        # **kwargs
-                        _type = dict[str, param.annotation]
-                    else:
-                        _type = param.annotation
-
-                    if not isvalid(arguments[key], _type):
-                        raise TypeError(
-                            f"Attribute `{key}` is not valid. Expected `{_type}`, "
-                            f"got `{describe_type(arguments[key]).raw}`"
+                    params.append("*")
+                # the real default is substituted after the checks, so that the
+                # default object passed explicitly is still validated
+                params.append(f"{key}=_pyvalidify_missing" if key in defaults else key)
+                call_args.append(
+                    f"{key}={key}" if param.kind == Parameter.KEYWORD_ONLY else key
+                )
+
+            if param.kind == Parameter.POSITIONAL_ONLY and (
+                i + 1 == len(kinds) or kinds[i + 1] != Parameter.POSITIONAL_ONLY
+            ):
+                params.append("/")
+
+        checks: list[tuple[str, Any, str]] = []
+        for p in plan:
+            if sig.parameters[p.name].kind in (
+                Parameter.VAR_POSITIONAL,
+                Parameter.VAR_KEYWORD,
+            ):
+                # nothing to validate when no extra arguments are given
+                checks.append((p.name, p.type_info, f"{p.name} and "))
+            elif p.name in defaults:
+                # defaults are not validated, same as in the generic wrapper
+                checks.append(
+                    (p.name, p.type_info, f"{p.name} is not _pyvalidify_missing and ")
+                )
+            else:
+                checks.append((p.name, p.type_info, ""))
+
+        source = (
+            f"def _pyvalidify_wrapper({', '.join(params)}):\n"
+            + "".join(_generate_checks(checks, namespace, policy, metrics))
+            + "".join(
+                f"    if {key} is _pyvalidify_missing:\n        {key} = {default}\n"
+                for key, default in defaults.items()
+            )
+            + f"    return _pyvalidify_func({', '.join(call_args)})\n"
+        )
+        exec(source, namespace)
+
+        return functools.wraps(__func)(namespace["_pyvalidify_wrapper"])
+
+    @staticmethod
+    def validate(
+        __func=None,
+        *,
+        specialize: bool = False,
+        sampling: "_sampling.SamplingPolicy | int | None" = None,
+        max_cost: "int | None" = None,
+        strict: bool = False,
+    ):
+        """Validates arguments of the decorated function against its annotations.
+        Annotations are analyzed and compiled when the decorator runs - unsupported
+        ones are reported with `ValidationWarning`.
+
+        ### Parameters
+        - `specialize` - generate the wrapper with the same signature as the
+        function instead of the generic `wrapper(*args, **kwargs)`, sparing the
+        packing of arguments on each call
+        - `sampling` - validate only some of the calls, see `SamplingPolicy`. If not
+        given, the default policy (`set_default_policy`) is used at the time of
+        the call.
+        - `max_cost` - report annotations estimated to cost more (see
+        `estimate_cost`) with `ValidationWarning`
+        - `strict` - raise `TypeError` instead of issuing `ValidationWarning`
+
+        Whether the function is wrapped at all depends on the mode configured for
+        its module, see `config.set_mode`.
+
+        Outcomes of validating parameters with non-subscribed types (and unions of
+        those) are cached by the types of the arguments, repeated calls with the
+        same types skip them - both for valid and (a bounded number of) invalid
+        calls. Other parameters are validated on every call.
+
+        ### Examples
+        ```
+        @func.validate
+        def foo(a: list[int]) -> None: ...
+
+        @func.validate(specialize=True)
+        def bar(a: list[int], b: str = "") -> None: ...
+
+        @func.validate(sampling=100)  # one in 100 calls
+        def baz(a: list[int]) -> None: ...
+        ```
+        """
+        if __func is None:
+            return functools.partial(
+                func.validate,
+                specialize=specialize,
+                sampling=sampling,
+                max_cost=max_cost,
+                strict=strict,
+            )
+
+        _validated = getattr(__func, _MARKER, None)
+        if isinstance(_validated, _Validated):
+            if (_validated.specialize, _validated.sampling) == (specialize, sampling):
+                # e.g. inherited from a validated class
+                return __func
+
+            # different options, wrapping the original function instead
+            __func = _validated.func
+
+        _module = getattr(__func, "__module__", None) or ""
+        _name = f"{_module}.{getattr(__func, '__qualname__', repr(__func))}"
+        rule = _config.resolve(_module)
+        if rule.mode == "off":
+            _config.register(_name, "off")
+            return __func
+
+        _policy = _sampling.to_policy(
+            sampling if sampling is not None else rule.sampling
+        )
+        plan = func._plan(__func, max_cost, strict)
+        if len(plan) == 0:
+            # nothing to validate
+            return __func
+
+        _config.register(_name, "validate" if _policy is None else "sample")
+        metrics = _metrics.register(_name)
+
+        if specialize:
+            wrapper = func._specialize(__func, plan, _policy, metrics)
+            setattr(wrapper, _MARKER, _Validated(__func, specialize, sampling))
+            return wrapper
+
+        scalars = [p for p in plan if p.is_scalar]
+        containers = [p for p in plan if not p.is_scalar]
+        types = {p.name: p.type_info for p in plan}
+        getters = [p.get for p in plan]
+
+        # validity of scalar parameters depends only on the types of the arguments,
+        # hence outcomes are cached by the "shape" of the call. Valid shapes map to
+        # -1, invalid ones to the index of the first invalid parameter.
+        shapes: dict[Any, int] = {}
+        invalid_shapes: dict[Any, int] = {}
+
+        @functools.wraps(__func)
+        def wrapper(*args, **kwargs):
+            metrics.calls += 1
+            policy = _policy if _policy is not None else _sampling._default_policy
+            if policy is None or policy.sample():
+                hook = (
+                    _hooks.start(
+                        "func.validate",
+                        types,
+                        _name,
+                        _largest(*[get(args, kwargs) for get in getters]),
+                    )
+                    if _hooks.enabled
+                    else None
+                )
+                start = perf_counter()
+                # hooks end even if validation raises (e.g. unsupported types)
+                valid = None
+                try:
+                    if len(scalars) != 0:
+                        shape = (
+                            tuple(map(type, args))
+                            if len(kwargs) == 0
+                            else (
+                                tuple(map(type, args)),
+                                *[(k, type(v)) for k, v in kwargs.items()],
+                            )
                         )
+                        invalid = shapes.get(shape)
+                        if invalid is None:
+                            invalid = invalid_shapes.get(shape)
+
+                        if invalid is None:
+                            invalid = _first_invalid(scalars, args, kwargs)
+                            _shapes = shapes if invalid == -1 else invalid_shapes
+                            if len(_shapes) >= (
+                                _SHAPES_MAXSIZE
+                                if invalid == -1
+                                else _INVALID_SHAPES_MAXSIZE
+                            ):
+                                _shapes.clear()
+                            _shapes[shape] = invalid
+
+                        if invalid != -1:
+                            p = scalars[invalid]
+                            valid = False
+                            raise _invalid_argument(
+                                p.name,
+                                p.type_info,
+                                p.get(args, kwargs),
+                                policy,
+                                metrics,
+                                start,
+                            )
+
+                    size = 0
+                    for p in containers:
+                        val = p.get(args, kwargs)
+                        if val is not _MISSING:
+                            if not p.validate(val):
+                                valid = False
+                                raise _invalid_argument(
+                                    p.name, p.type_info, val, policy, metrics, start
+                                )
+                            size = max(size, _hooks.size(val))
+
+                    if policy is not None:
+                        policy.record(True)
+                    metrics.passed(start, size)
+                    valid = True
+                finally:
+                    if hook is not None:
+                        _hooks.end(*hook, valid)
 
             return __func(*args, **kwargs)
 
+        setattr(wrapper, _MARKER, _Validated(__func, specialize, sampling))
         return wrapper
+
+
+_SHAPES_MAXSIZE = 64
+"""Number of valid call shapes cached per function, see `func.validate`."""
+_INVALID_SHAPES_MAXSIZE = 16
+"""Number of invalid call shapes cached per function, see `func.validate`."""
+
+
+def _first_invalid(
+    __plan: "list[_PlannedParameter]", __args: tuple, __kwargs: dict[str, Any]
+) -> int:
+    """Returns the index of the first invalid parameter in the plan or -1."""
+    for i, p in enumerate(__plan):
+        val = p.get(__args, __kwargs)
+        if val is not _MISSING and not p.validate(val):
+            return i
+
+    return -1
+
+
+def _compiled(__type_info: Any) -> Callable[[Any], bool]:
+    """Compiled validator of the type, see `compile_validator`. Unsupported types
+    (reported when the decorator runs) are left to `isvalid` to raise on each
+    validation."""
+    try:
+        return compile_validator(__type_info)
+    except TypeError:
+        return lambda val: isvalid(val, __type_info)
+
+
+def _largest(*__vals: Any) -> int:
+    """Size of the biggest argument passed to the hooks."""
+    return max(map(_hooks.size, __vals), default=0)
+
+
+def _invalid_argument(
+    __key: str,
+    __type_info: Any,
+    __val: Any,
+    __policy: "_sampling.SamplingPolicy | None" = None,
+    __metrics: "_metrics.Metrics | None" = None,
+    __start: float = 0.0,
+) -> TypeError:
+    """Records the failure and returns the error to be raised."""
+    if __metrics is not None:
+        __metrics.failed(__start)
+    if __policy is not None:
+        __policy.record(False)
+
+    return TypeError(
+        f"Attribute `{__key}` is not valid. Expected `{__type_info}`, "
+        f"got `{describe_type(__val).raw}`"
+    )
+
+
+class ValidationWarning(UserWarning):
+    """Issued by the decorators for annotations that cannot be validated or are
+    expensive to validate, see `func.validate`."""
+
+
+def _analyze(
+    __where: str,
+    __type_info: Any,
+    __max_cost: "int | None",
+    __strict: bool,
+    __report: bool = True,
+) -> "int | None":
+    """Compiles the validator for the annotation ahead of the first call and
+    estimates the cost of validation. Unsupported annotations (returning `None`)
+    and annotations more expensive than `__max_cost` are reported - with
+    `ValidationWarning` or, if `__strict`, `TypeError`.
+    """
+    try:
+        compile_validator(__type_info)
+        cost = estimate_cost(__type_info)
+    except TypeError:
+        message = f"`{__where}` is annotated with unsupported type `{__type_info}`"
+        cost = None
+    else:
+        if __max_cost is None or cost <= __max_cost:
+            return cost
+        message = (
+            f"Estimated cost of validating `{__where}` against `{__type_info}` "
+            f"is {cost}, above {__max_cost}"
+        )
+
+    if __strict:
+        raise TypeError(message)
+    elif __report:
+        warnings.warn(message, ValidationWarning, stacklevel=4)
+
+    return cost
+
+
+def _generate_checks(
+    __checks: list[tuple[str, Any, str]],
+    __namespace: dict[str, Any],
+    __policy: "_sampling.SamplingPolicy | None",
+    __metrics: "_metrics.Metrics",
+    __source: str = "func.validate",
+) -> list[str]:
+    """Generates the body of a validating function (see `func._specialize`) for the
+    given checks - name of the variable, its type info and a condition guarding
+    the check (e.g. `"a is not None and "`). Validators are compiled up front,
+    unless the type is unsupported - then `isvalid` raises at the time of the call
+    like in the generic wrapper. Whatever is referenced by the source is added to
+    the namespace. Hooks are reported the `__source` and the name of the metrics.
+    """
+    if len(__checks) == 0:
+        return []
+
+    __namespace.update(
+        {
+            "_pyvalidify_error": _invalid_argument,
+            "_pyvalidify_policy": __policy,
+            "_pyvalidify_sampling": _sampling,
+            "_pyvalidify_metrics": __metrics,
+            "_pyvalidify_perf_counter": perf_counter,
+            "_pyvalidify_size": _hooks.size,
+            "_pyvalidify_hooks": _hooks,
+            "_pyvalidify_largest": _largest,
+            "_pyvalidify_source": __source,
+            "_pyvalidify_types": {name: _type for name, _type, _ in __checks},
+        }
+    )
+
+    lines = [
+        # same sampling logic and metrics as in the generic wrapper
+        "    _pyvalidify_metrics.calls += 1\n",
+        "    _pyvalidify_p = _pyvalidify_policy if _pyvalidify_policy is not None "
+        "else _pyvalidify_sampling._default_policy\n",
+        "    if _pyvalidify_p is None or _pyvalidify_p.sample():\n",
+        "        _pyvalidify_h = _pyvalidify_hooks.start(_pyvalidify_source, "
+        "_pyvalidify_types, _pyvalidify_metrics.name, "
+        f"_pyvalidify_largest({', '.join(name for name, _, _ in __checks)})) "
+        "if _pyvalidify_hooks.enabled else None\n",
+        "        _pyvalidify_t = _pyvalidify_perf_counter()\n",
+        "        _pyvalidify_s = 0\n",
+        "        _pyvalidify_v = None\n",
+        "        try:\n",
+    ]
+    for i, (name, _type, guard) in enumerate(__checks):
+        __namespace[f"_pyvalidify_validator_{i}"] = _compiled(_type)
+        __namespace[f"_pyvalidify_type_{i}"] = _type
+        lines.append(
+            f"            if {guard}not _pyvalidify_validator_{i}({name}):\n"
+            "                _pyvalidify_v = False\n"
+            f"                raise _pyvalidify_error({name!r}, _pyvalidify_type_{i}, "
+            f"{name}, _pyvalidify_p, _pyvalidify_metrics, _pyvalidify_t)\n"
+        )
+        try:
+            is_scalar = estimate_cost(_type) == 1
+        except TypeError:
+            is_scalar = False
+        if not is_scalar:
+            lines.append(
+                f"            _pyvalidify_s = max(_pyvalidify_s, _pyvalidify_size({name}))\n"
+            )
+
+    lines.extend(
+        [
+            "            if _pyvalidify_p is not None:\n",
+            "                _pyvalidify_p.record(True)\n",
+            "            _pyvalidify_metrics.passed(_pyvalidify_t, _pyvalidify_s)\n",
+            "            _pyvalidify_v = True\n",
+            # hooks end even if validation raises (e.g. unsupported types)
+            "        finally:\n",
+            "            if _pyvalidify_h is not None:\n",
+            "                _pyvalidify_hooks.end(*_pyvalidify_h, _pyvalidify_v)\n",
+        ]
+    )
+    return lines
+
+
+_HOT_DUNDERS = frozenset(
+    {
+        "__repr__",
+        "__str__",
+        "__format__",
+        "__hash__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__bool__",
+        "__len__",
+        "__iter__",
+        "__next__",
+        "__contains__",
+        "__getattr__",
+        "__getattribute__",
+        "__getitem__",
+        "__del__",
+        "__sizeof__",
+        "__reduce__",
+        "__reduce_ex__",
+        "__getstate__",
+        "__init_subclass__",
+        "__subclasshook__",
+        "__class_getitem__",
+    }
+)
+"""Methods called implicitly and often (e.g. by dicts and sets), not validated by
+`cls.validate` unless explicitly included."""
+
+
+_MARKER = "__pyvalidify__"
+"""Attribute marking validating wrappers, see `_Validated`."""
+_GENERATED_INIT = "__pyvalidify_init__"
+"""Attribute marking `__init__` generated by `cls._dataclass_init`."""
+
+
+class _Validated(NamedTuple):
+    """Marks wrappers created by the decorators so that they are not wrapped again,
+    e.g. when inherited by another validated class."""
+
+    func: Callable
+    """Original (wrapped) function."""
+    specialize: bool
+    sampling: Any
+
+
+_MISSING: Any = object()
+"""Placeholder for parameters that were not given - see `_getter`."""
+
+
+class _PlannedParameter(NamedTuple):
+    name: str
+    type_info: Any
+    """Expected type, `*args` and `**kwargs` converted to `tuple` and `dict`."""
+    get: Callable[[tuple, dict[str, Any]], Any]
+    """Extracts the value from call arguments, see `_getter`."""
+    validate: Callable[[Any], bool]
+    """Compiled validator of the type, see `_compiled`."""
+    is_scalar: bool
+    """Non-subscribed type (or union of those), cheap to validate."""
+    cost: "int | None"
+    """Estimated cost of validation, `None` for unsupported types."""
+
+
+def _getter(
+    __index: int, __name: str, __kind: Any, __keywords: frozenset[str]
+) -> Callable[[tuple, dict[str, Any]], Any]:
+    """Returns a function that extracts the value of the parameter from positional
+    and keyword arguments of a call - without binding them to the signature.
+    Returns `_MISSING` if the parameter has not been given.
+    """
+    if __kind == Parameter.POSITIONAL_ONLY:
+        return lambda args, kwargs: args[__index] if __index < len(args) else _MISSING
+
+    elif __kind == Parameter.POSITIONAL_OR_KEYWORD:
+        return lambda args, kwargs: (
+            args[__index] if __index < len(args) else kwargs.get(__name, _MISSING)
+        )
+
+    elif __kind == Parameter.VAR_POSITIONAL:
+        # *args follow all the positional parameters
+        return lambda args, kwargs: (
+            args[__index:] if __index < len(args) else _MISSING
+        )
+
+    elif __kind == Parameter.KEYWORD_ONLY:
+        return lambda args, kwargs: kwargs.get(__name, _MISSING)
+
+    else:
+        # **kwargs - anything not matching the named parameters
+        def _get_var_keyword(args: tuple, kwargs: dict[str, Any]) -> Any:
+            _kwargs = {k: v for k, v in kwargs.items() if k not in __keywords}
+            return _kwargs if len(_kwargs) != 0 else _MISSING
+
+        return _get_var_keyword
+
+
+class _ValidatedField:
+    """Data descriptor validating assignments of an annotated attribute, installed
+    by `cls.validate`. The value is kept in the instance's `__dict__` or, if the
+    attribute has already been a data descriptor (e.g. a slot or a property), it is
+    delegated to it.
+    """
+
+    __slots__ = (
+        "name",
+        "type_info",
+        "inner",
+        "default",
+        "policy",
+        "metrics",
+        "validator",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        type_info: Any,
+        inner: Any,
+        default: Any,
+        policy: "_sampling.SamplingPolicy | None",
+        metrics: "_metrics.Metrics | None" = None,
+    ) -> None:
+        self.name = name
+        self.type_info = type_info
+        self.inner = inner
+        """Data descriptor the value is delegated to."""
+        self.default = default
+        """Class attribute value, `_MISSING` if there is none."""
+        self.policy = policy
+        self.metrics = metrics or _metrics.Metrics(name)
+
+        self.validator = _compiled(type_info)
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            if self.inner is not None:
+                return self.inner.__get__(None, owner)
+            elif self.default is not _MISSING:
+                return self.default
+            # no default, as if the attribute did not exist (e.g. for dataclasses)
+            raise AttributeError(self.name)
+
+        if self.inner is not None:
+            return self.inner.__get__(instance, owner)
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            if self.default is not _MISSING:
+                return self.default
+            raise AttributeError(
+                f"'{type(instance).__name__}' object has no attribute '{self.name}'"
+            ) from None
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.metrics.calls += 1
+        policy = self.policy if self.policy is not None else _sampling._default_policy
+        if policy is None or policy.sample():
+            hook = (
+                _hooks.start(
+                    "cls.validate",
+                    self.type_info,
+                    f"{self.metrics.name}.{self.name}",
+                    _hooks.size(value),
+                )
+                if _hooks.enabled
+                else None
+            )
+            start = perf_counter()
+            valid = None
+            try:
+                valid = self.validator(value)
+                if not valid:
+                    self.metrics.failed(start)
+                    if policy is not None:
+                        policy.record(False)
+                    raise TypeError(
+                        f"Property `{self.name}` is not valid. Expected "
+                        f"`{self.type_info}`, got `{describe_type(value).raw}`"
+                    )
+                elif policy is not None:
+                    policy.record(True)
+                self.metrics.passed(start, _hooks.size(value))
+            finally:
+                # hooks end even if validation raises (e.g. unsupported types)
+                if hook is not None:
+                    _hooks.end(*hook, valid)
+
+        self.store(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        if self.inner is not None:
+            self.inner.__delete__(instance)
+            return
+
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def store(self, instance: Any, value: Any) -> None:
+        """Assigns the value without validating it."""
+        if self.inner is not None:
+            self.inner.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
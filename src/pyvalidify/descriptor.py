@@ -1,14 +1,20 @@
+import functools
 from itertools import chain, combinations, product
-from types import EllipsisType, GenericAlias, NoneType, UnionType
+import operator
+from random import Random
+from types import EllipsisType, NoneType
 from typing import (
+    Any,
+    Iterator,
     Literal,
+    Mapping,
     TypeAlias,
-    get_origin,
-    get_args,
     overload,
     cast,
 )
 
+from . import counters as _counters
+from . import hooks as _hooks
 from .type_hints import (
     SingleTypeInfo,
     SupportedBaseType,
@@ -17,10 +23,13 @@ from .type_hints import (
     is_subscriptable_base_type,
     is_supported_base_type,
     is_type_info,
-    is_union,
+    normalize_type_info,
+    TypeNode,
 )
 
 _ArgsTuple: TypeAlias = "tuple[Descriptor, ...]"
+_UNRENDERED: Any = object()
+"""Placeholder for `raw` and string representation not rendered yet."""
 _RawArgs: TypeAlias = (
     "tuple[TypeInfo | Descriptor, ...] | tuple[TypeInfo | Descriptor, EllipsisType]"
 )
@@ -51,6 +60,11 @@ class Descriptor:
     _raw: SingleTypeInfo | WithUnion
     _length: int | Literal["undefined"]
     _str: str
+    _depth: int
+    _is_union: bool
+    _has_nested_union: bool
+    _leaf_types: frozenset[SupportedBaseType]
+    _is_fixed_tuple: bool
     parent: "Descriptor | None"
 
     @overload
@@ -115,6 +129,9 @@ class Descriptor:
         """
 
         self.parent = _parent
+        # rendered on first access, see `raw` and `_get_str()`
+        self._raw = _UNRENDERED
+        self._str = _UNRENDERED
 
         if (
             __type_info in [None, NoneType]
@@ -124,47 +141,15 @@ class Descriptor:
             # expression of `None`
             self._base = None
             self._args = tuple()
-            self._raw = None
-            self._str = "None"
+            _variadic = False
 
         elif __type_info is not None:
             # infer from the TypeInfo
-            if is_type_info(__type_info):
+            _node = normalize_type_info(__type_info)
+            if _node is not None:
                 # valid TypeInfo
-                if isinstance(__type_info, GenericAlias):
-                    self._base = get_origin(__type_info)
-                    self._args = tuple(
-                        [
-                            Descriptor(arg, _parent=self)
-                            for arg in get_args(__type_info)
-                            if arg != Ellipsis
-                        ]
-                    )
-                    self._str = str(__type_info)
-                    self._raw = __type_info
-
-                elif isinstance(__type_info, (UnionType, tuple)):
-                    self._base = None
-                    _raw_args = (
-                        __type_info
-                        if isinstance(__type_info, tuple)
-                        else get_args(__type_info)
-                    )
-                    self._args = tuple(
-                        [Descriptor(arg, _parent=self) for arg in _raw_args]
-                    )
-                    self._str = " | ".join(arg._str for arg in self._args)
-                    self._raw = eval(self._str)
-
-                else:
-                    # it's SupportedBaseType
-                    self._base = __type_info
-                    self._args = tuple()
-                    # the inline if-stmt below mostly to satisfy pyright
-                    self._str = (
-                        __type_info.__name__ if __type_info is not None else "None"
-                    )
-                    self._raw = __type_info
+                self._set_from_node(_node)
+                _variadic = _node.is_variadic
 
             else:
                 _msg = f"Invalid type of __type_info={__type_info}: `{type(__type_info).__name__}`."
@@ -185,6 +170,7 @@ class Descriptor:
 
         elif base is not None or args is not None:
             # use provided base and args
+            _variadic = args is not None and ... in args
             if base is None or is_supported_base_type(base):
                 self._base = base
 
@@ -196,9 +182,6 @@ class Descriptor:
             if args is None or (isinstance(args, tuple) and len(args) == 0):
                 # non-subscribed
                 self._args = tuple()
-                self._raw = base
-                # the inline if-stmt below mostly to satisfy pyright
-                self._str = base.__name__ if base is not None else "None"
 
             elif isinstance(args, tuple):
                 # union (if base=None) or any other subscribed generic
@@ -234,8 +217,6 @@ class Descriptor:
                         if len(self._args) == 1:
                             self._base = self._args[0].base
                             self._args = self._args[0].args
-                            self._raw = self._args[0].raw
-                            self._str = self._args[0]._str
                             # self._args = tuple()
                             # raise ValueError(
                             #     f"Only one unique argument, {self._args[0]}, found in the given {len(args)} args while base suggests the Descriptor is a union."
@@ -247,34 +228,6 @@ class Descriptor:
                         f" type. Got tuple[{', '.join(type(arg).__name__ for arg in args)}]"
                     )
 
-                # set `raw` based on given base and args
-                if base is None:
-                    # union
-                    self._str = " | ".join(
-                        cast(Descriptor, arg)._str for arg in self._args
-                    )
-                    self._raw = eval(self._str)
-
-                else:
-                    # generic
-                    if ... in args:
-                        # tuple with undefined number of elements
-                        self._raw = base[  # pyright: ignore [-reportGeneralTypeIssues]
-                            self._args[0].raw, ...
-                        ]
-                        # due to some formatting issues have to do that string separately
-                        self._str = f"tuple[{self._args[0]._str}, ...]"
-
-                    else:
-                        # general case - using self._args as it avoids dealing with different input types
-                        self._raw = base[  # pyright: ignore [reportGeneralTypeIssues]
-                            tuple(
-                                arg.raw if isinstance(arg, Descriptor) else ...
-                                for arg in self._args
-                            )
-                        ]
-                        self._str = str(self._raw)
-
             else:
                 raise TypeError(f"`args` must be a tuple or None. Got {type(args)}")
 
@@ -284,23 +237,11 @@ class Descriptor:
                 "The input must be either type info or base and/or args, not both."
             )
 
+        self._set_structure()
+
         if _length is None:
             # determine length based on the base and args
-            if (
-                self.base == tuple
-                and len(self._args) != 0
-                and (... not in args if args is not None else True)
-                and (
-                    ... not in get_args(__type_info)
-                    if __type_info is not None
-                    else True
-                )
-            ):
-                self._length = len(self.args)
-            elif not is_subscriptable_base_type(self.base) or self.is_union:
-                self._length = 1
-            else:
-                self._length = "undefined"
+            self._length = self._default_length(_variadic)
 
         else:
             if _length == "undefined":
@@ -323,10 +264,7 @@ class Descriptor:
                         f"Length can only be a defined integer for a tuple-based Descriptor, unions or non-subscriptables. Go"
                     )
 
-                elif self.base == tuple and (
-                    (args is not None and ... in args)
-                    or (__type_info is not None and ... in get_args(__type_info))
-                ):
+                elif self.base == tuple and _variadic:
                     raise ValueError(
                         f"Setting _length to a number (given: {_length}) while an ellipsis is within given arguments is not allowed."
                     )
@@ -346,10 +284,161 @@ class Descriptor:
             # no errors raised
             self._length = _length
 
+        self._is_fixed_tuple = self._base == tuple and self._length != "undefined"
+
+    @classmethod
+    def _from_node(
+        cls, __node: TypeNode, *, _parent: "Descriptor | None" = None
+    ) -> "Descriptor":
+        """Creates instance from already validated `TypeNode`, skipping the validation
+        of `__init__`."""
+        self = cls.__new__(cls)
+        self.parent = _parent
+        self._set_from_node(__node)
+        self._set_structure()
+        self._length = self._default_length(__node.is_variadic)
+        self._is_fixed_tuple = self._base == tuple and self._length != "undefined"
+        return self
+
+    @classmethod
+    def _trusted(
+        cls,
+        base: SupportedBaseType,
+        args: _ArgsTuple = (),
+        *,
+        _parent: "Descriptor | None" = None,
+        _length: int | Literal["undefined"] | None = None,
+    ) -> "Descriptor":
+        """Fast factory for instances created by the engine itself. Members of `args`
+        must already be `Descriptor` instances and `_length` (if given) must be
+        consistent with them - nothing is validated. `raw` and the string
+        representation are rendered only when accessed.
+        """
+        if base is None and len(args) != 0:
+            # ensure that unions don't have muliple same arguments
+            args = tuple(set(args))
+            if len(args) == 1:
+                # single element union is the element itself
+                return cls._trusted(
+                    args[0]._base,
+                    args[0]._args,
+                    _parent=_parent,
+                    _length=args[0]._length,
+                )
+
+        self = cls.__new__(cls)
+        self.parent = _parent
+        self._base = base
+        self._args = args
+        self._raw = _UNRENDERED
+        self._str = _UNRENDERED
+        self._set_structure()
+        self._length = self._default_length(False) if _length is None else _length
+        self._is_fixed_tuple = self._base == tuple and self._length != "undefined"
+        return self
+
+    def _render_raw(self) -> SingleTypeInfo | WithUnion:
+        """Builds the type hint from base, args and length."""
+        if self._is_union:
+            return functools.reduce(operator.or_, (arg.raw for arg in self._args))
+
+        elif len(self._args) == 0:
+            return self._base
+
+        elif self._base == tuple and self._length == "undefined":
+            # tuple with undefined number of elements
+            return tuple[self._args[0].raw, ...]
+
+        else:
+            return self._base[  # pyright: ignore [reportIndexIssue]
+                tuple(arg.raw for arg in self._args)
+            ]
+
+    def _render_str(self) -> str:
+        """Builds the string representation from base, args and length - without
+        building the type hint itself."""
+        if self._is_union:
+            return " | ".join(arg._get_str() for arg in self._args)
+
+        elif len(self._args) == 0:
+            # the inline if-stmt below mostly to satisfy pyright
+            return self._base.__name__ if self._base is not None else "None"
+
+        elif self._base == tuple and self._length == "undefined":
+            # tuple with undefined number of elements
+            return f"tuple[{self._args[0]._get_str()}, ...]"
+
+        else:
+            _args_str = ", ".join(arg._get_str() for arg in self._args)
+            return f"{self._base.__name__}[{_args_str}]"
+
+    def _get_str(self) -> str:
+        """String representation of the type, e.g. `list[str | int]`. Rendered on
+        first access."""
+        if self._str is _UNRENDERED:
+            self._str = self._render_str()
+        return self._str
+
+    def _set_from_node(self, __node: TypeNode) -> None:
+        """Sets base, args, raw and string representation from `TypeNode`. Args are
+        created from the children of the node, hence the type hint is not walked
+        again for each of them."""
+        self._base = __node.base
+        self._args = tuple(
+            Descriptor._from_node(arg, _parent=self) for arg in __node.args
+        )
+
+        self._str = _UNRENDERED
+        if isinstance(__node.hint, tuple):
+            # tuple of type hints, rendered as a union on first access
+            self._raw = _UNRENDERED
+        else:
+            # `NoneType` hint is represented by `None`
+            self._raw = __node.base if len(__node.args) == 0 else __node.hint
+
+    def _default_length(self, __variadic: bool) -> int | Literal["undefined"]:
+        """Length inferred from the base and args. `__variadic` tells if the tuple has
+        undefined number of elements, e.g. `tuple[str, ...]`."""
+        if self._base == tuple and len(self._args) != 0 and not __variadic:
+            return len(self._args)
+        elif not is_subscriptable_base_type(self._base) or self._is_union:
+            return 1
+        else:
+            return "undefined"
+
+    def _set_structure(self) -> None:
+        """Computes structural metadata from the (already initialised) base and args.
+        Args are `Descriptor` instances themselves, so each node only looks at its
+        direct children instead of walking the whole subtree.
+        """
+        if _counters.enabled:
+            _counters.descriptors += 1
+
+        self._is_union = self._base is None and len(self._args) != 0
+
+        if len(self._args) == 0:
+            self._depth = 0
+            self._has_nested_union = False
+            self._leaf_types = frozenset((self._base,))
+
+        else:
+            # union is treated as if it was multi-base Descriptor, hence no +1 for it
+            self._depth = max(arg._depth for arg in self._args) + (
+                0 if self._is_union else 1
+            )
+            self._has_nested_union = self._is_union or any(
+                arg._has_nested_union for arg in self._args
+            )
+            self._leaf_types = frozenset(
+                chain.from_iterable(arg._leaf_types for arg in self._args)
+            )
+
     @property
     def raw(self) -> SingleTypeInfo | WithUnion:
         """Type info (with tuples converted to unions).
         E.g. list[tuple[str, int] | dict[str, int]]"""
+        if self._raw is _UNRENDERED:
+            self._raw = self._render_raw()
         return self._raw
 
     @property
@@ -378,7 +467,7 @@ class Descriptor:
         Descriptor(None).no_args.raw is None
         ```
         """
-        return Descriptor(self.base) if not self.is_union else None
+        return Descriptor._trusted(self.base) if not self.is_union else None
 
     @property
     def depth(self) -> int:
@@ -394,32 +483,7 @@ class Descriptor:
         ```
         """
 
-        if len(self.args) == 0:
-            # no args = no depth
-            return 0
-
-        else:
-            # aggregate all args across unions etc. E.g. (str, float | int) -> (str, float, int)
-            _aggr_args: list[Descriptor] = []
-            for arg in self.args:
-                # skip ellipsis
-                if arg is not ...:
-                    if arg.is_union:
-                        _aggr_args += [a for a in arg.args if a is not ...]
-
-                    else:
-                        _aggr_args.append(arg)
-
-            # get depth for each argument
-            _arg_depths = [arg.depth for arg in _aggr_args]
-
-            if self.is_union:
-                # union is treated as if it was multi-base Descriptor
-                return max(_arg_depths)
-
-            else:
-                # adding 1 to account for the base
-                return max(_arg_depths) + 1
+        return self._depth
 
     @property
     def length(self) -> int | Literal["undefined"]:
@@ -428,7 +492,25 @@ class Descriptor:
     @property
     def is_union(self) -> bool:
         """Union type. When this is True, other flags (`is_*`) are False."""
-        return is_union(self.raw)
+        return self._is_union
+
+    @property
+    def has_nested_union(self) -> bool:
+        """Is the type a union or has a union somewhere within itself.
+        E.g. `list[str | int] -> True`, `list[tuple[str, int]] -> False`."""
+        return self._has_nested_union
+
+    @property
+    def leaf_types(self) -> frozenset[SupportedBaseType]:
+        """Base types of the most inner (non-subscribed) members of the type.
+        E.g. `dict[str, list[int] | None] -> {str, int, None}`."""
+        return self._leaf_types
+
+    @property
+    def is_fixed_tuple(self) -> bool:
+        """Tuple with a defined number of elements. E.g. `tuple[str, int] -> True`,
+        `tuple[str, ...] -> False`, `tuple -> False`."""
+        return self._is_fixed_tuple
 
     def _remove_inner(
         self,
@@ -452,7 +534,7 @@ class Descriptor:
             parent_args: list[Descriptor] = []
             remainder = []
             for arg in self.args:
-                if getattr(arg, "depth", None) == max_depth:
+                if arg.depth == max_depth:
                     p, r = arg._remove_inner()
                     parent_args.append(p)
                     remainder += list(r)
@@ -464,17 +546,19 @@ class Descriptor:
                 # generics to a union of two alike arguments. E.g.:
                 # tuple[str, int] | tuple[int] --> tuple | tuple
                 # The above we want to convert to a single type description
-                td = Descriptor(base=parent_args[0].base, args=parent_args[0].args)
+                td = Descriptor._trusted(parent_args[0].base, parent_args[0].args)
 
             else:
-                td = Descriptor(base=self.base, args=tuple(parent_args))
+                td = Descriptor._trusted(self.base, tuple(parent_args))
 
             return td, tuple(remainder)
 
     def reductions(self) -> "list[Descriptor]":
         reductions: list[Descriptor] = [self]
-        while reductions[-1] != reductions[-1]._remove_inner()[0]:
-            reductions.append(reductions[-1]._remove_inner()[0])
+        reduced = self._remove_inner()[0]
+        while reductions[-1] != reduced:
+            reductions.append(reduced)
+            reduced = reduced._remove_inner()[0]
         return reductions
 
     def _group_args(self) -> "list[tuple[tuple[Descriptor, ...], ...]]":
@@ -567,7 +651,9 @@ class Descriptor:
                         or (self.base == tuple and self.length != "undefined")
                     ):
                         # transform to a proper union
-                        sub_unif.append(Descriptor(args=cmb, _parent=self.parent))
+                        sub_unif.append(
+                            Descriptor._trusted(None, cmb, _parent=self.parent)
+                        )
                 else:
                     # non-union, pull out of the tuple
                     sub_unif.append(cmb[0])
@@ -606,17 +692,32 @@ class Descriptor:
         #       Descriptor( tuple[list[str | int], str] )
         #   ]
         return [
-            Descriptor(base=self.base, args=p, _parent=self.parent, _length=self.length)
+            Descriptor._trusted(self.base, p, _parent=self.parent, _length=self.length)
             for p in product(*unified)
         ]
 
     def combinations(self) -> "list[Descriptor]":
+        if not _hooks.enabled:
+            return self._combinations()
+
+        event, start = _hooks.start("combinations", self)
+        try:
+            return self._combinations()
+        finally:
+            _hooks.end(event, start)
+
+    def _combinations(self) -> "list[Descriptor]":
 
         if self.is_union and self.parent is None:
             # self is a union that has no parent
             # 1. find combinations of each member of the union
             # 2. flatten the iterable into a list of all possible combinations
-            return list(chain.from_iterable(a.combinations() for a in self.args))
+            _total_combinations = list(
+                chain.from_iterable(a._combinations() for a in self.args)
+            )
+            if _counters.enabled:
+                _counters.combinations += len(_total_combinations)
+            return _total_combinations
 
         elif len(self.args) > 0:
             # self might be a union with a parent or any other type description
@@ -634,10 +735,10 @@ class Descriptor:
                         # skip one level up
                         sub_cmb_groups.append(
                             [
-                                Descriptor(args=p, _parent=self.parent)
+                                Descriptor._trusted(None, p, _parent=self.parent)
                                 for p in product(
                                     *[
-                                        union_member.combinations()
+                                        union_member._combinations()
                                         for union_member in cmb_arg.args
                                     ]
                                 )
@@ -645,20 +746,24 @@ class Descriptor:
                         )
 
                     else:
-                        sub_cmb_groups.append(cmb_arg.combinations())
+                        sub_cmb_groups.append(cmb_arg._combinations())
 
                 # same as the last expression in _transformed_groupd()
                 _total_combinations += [
-                    Descriptor(
-                        base=self.base, args=p, _parent=self.parent, _length=self.length
+                    Descriptor._trusted(
+                        self.base, p, _parent=self.parent, _length=self.length
                     )
                     for p in product(*sub_cmb_groups)
                 ]
 
+            if _counters.enabled:
+                _counters.combinations += len(_total_combinations)
             return _total_combinations
 
         else:
             # self has no arguments, therefore, has no combinations
+            if _counters.enabled:
+                _counters.combinations += 1
             return [self]
 
     def _set_tuple_undefined(self) -> "Descriptor":
@@ -668,11 +773,11 @@ class Descriptor:
                 _args = tuple(set(self.args))
             else:
                 # non-homogenous e.g. tuple[int, int, str]
-                _args = (Descriptor(args=tuple(set(self.args))),)
+                _args = (Descriptor._trusted(None, tuple(set(self.args))),)
         else:
             _args = self.args
 
-        return Descriptor(base=self.base, args=_args, _parent=self.parent)
+        return Descriptor._trusted(self.base, _args, _parent=self.parent)
 
     def undefined_tuple_combinations(self) -> "list[Descriptor]":
         modified_base_td: list[Descriptor] = [self, self._set_tuple_undefined()]
@@ -683,13 +788,100 @@ class Descriptor:
                     _args_as_list = list(base_td.args)
                     _args_as_list[j] = cmb
                     modified_args.append(
-                        Descriptor(
-                            base=base_td.base,
-                            args=tuple(_args_as_list),
+                        Descriptor._trusted(
+                            base_td.base,
+                            tuple(_args_as_list),
                             _parent=base_td.parent,
                         )
                     )
-        return list(set(modified_base_td).union(set(modified_args)))
+        _combinations = list(set(modified_base_td).union(set(modified_args)))
+        if _counters.enabled:
+            _counters.combinations += len(_combinations)
+        return _combinations
+
+    def sample_value(
+        self,
+        size: int = 3,
+        *,
+        seed: int | None = None,
+        weights: "Mapping[Any, float] | None" = None,
+        inner_size: int = 3,
+        valid: bool = True,
+        mismatch_at: int = -1,
+        mismatch_depth: int | None = None,
+    ) -> Any:
+        """Generates a value of the type, e.g. for benchmarks and load tests. Scalars
+        are distinct (hence sets and dicts are of the requested size, unless their
+        members are `bool` or `None`), collections are never empty. Collections
+        nested in a collection hold the same members of unions (see Known Issues
+        in README) - unless they are lost to duplicate `bool` or `None` keys, in
+        which case `isvalid` may reject the value for the same reason.
+
+        ### Parameters
+        - `size` - number of elements of the outermost collection (ignored by
+        fixed-length tuples)
+        - `seed` - seed of the random generator, makes the value reproducible
+        - `weights` - distribution of the branches of unions, by their members,
+        e.g. `{int: 9, None: 1}` - members not given weigh 1
+        - `inner_size` - number of elements of the nested collections
+        - `valid` - generate a value of the type (`True`) or one deliberately
+        mismatching it
+        - `mismatch_at` - index of the invalid element of the outermost collection
+        (position of a fixed-length tuple), the last one by default
+        - `mismatch_depth` - how many levels below the invalid element the mismatch
+        is, the deepest level by default; `0` replaces the element itself
+
+        ### Examples
+        ```
+        Descriptor(list[int | None]).sample_value(5, seed=1, weights={None: 0})
+        # [2, 3, 4, 5, 6]
+        Descriptor(list[list[int]]).sample_value(2, valid=False, mismatch_at=0)
+        # [[2, 3, 's4'], [5, 6, 7]]
+        ```
+
+        ### Raises
+        - `ValueError` when `size` or `inner_size` is lower than 1, or `mismatch_at`
+        is out of range
+        """
+        sampler = _Sampler(seed, weights, inner_size)
+        if valid:
+            return sampler.value(self, size)
+
+        return sampler.invalid(self, size, mismatch_at, mismatch_depth)
+
+    def sample_elements(
+        self,
+        size: int = 3,
+        *,
+        seed: int | None = None,
+        weights: "Mapping[Any, float] | None" = None,
+        inner_size: int = 3,
+        valid: bool = True,
+        mismatch_at: int = -1,
+        mismatch_depth: int | None = None,
+    ) -> Iterator[Any]:
+        """Generates elements of a collection of the type one by one (key-value
+        pairs for dicts), e.g. to stream values of millions of elements. Parameters
+        are the same as for `sample_value`.
+
+        ### Examples
+        ```
+        with open("payload.jsonl", "w") as f:
+            for elem in Descriptor(list[dict[str, int]]).sample_elements(10_000_000):
+                f.write(json.dumps(elem) + "\n")
+        ```
+
+        ### Raises
+        - `TypeError` when the type is not a subscribed collection
+        - `ValueError` like `sample_value`
+        """
+        if self.is_union or len(self.args) == 0:
+            raise TypeError(f"Expected a subscribed collection, got `{self}`")
+
+        sampler = _Sampler(seed, weights, inner_size)
+        return sampler.elements(
+            self, size, mismatch_at if not valid else None, mismatch_depth
+        )
 
     def __hash__(self) -> int:
         if self.is_union:
@@ -703,4 +895,187 @@ class Descriptor:
         return False
 
     def __repr__(self) -> str:
-        return f"Descriptor( {self._str} )"
+        return f"Descriptor( {self._get_str()} )"
+
+
+_MISMATCHING_BASES: tuple[SupportedBaseType, ...] = (str, int, float, bytes, None)
+"""Types of scalars replacing the mismatched parts of sampled values - the first
+one not accepted is used, a bare `object()` if all of them are."""
+
+
+class _Sampler:
+    """State of `Descriptor.sample_value` - the random generator, the weights of
+    union members, the members picked for each union and a counter making the
+    scalars distinct.
+
+    Combinations do not propagate unions outward (see Known Issues in README),
+    e.g. `[[1, "a"], ["b"]]` is not a valid `list[list[int | str]]`. Hence each
+    union picks its members ("palette") once and every collection it is an
+    argument of holds all of them - `[[1, "a"], ["b", 2]]`.
+    """
+
+    def __init__(
+        self,
+        seed: int | None,
+        weights: "Mapping[Any, float] | None",
+        inner_size: int,
+    ) -> None:
+        if inner_size < 1:
+            raise ValueError("`inner_size` must be a positive integer")
+
+        self.rng = Random(seed)
+        self.weights = weights or {}
+        self.inner_size = inner_size
+        self.counter = 1
+        self.palettes: dict[int, list[Descriptor]] = {}
+
+    def scalar(self, __base: SupportedBaseType) -> Any:
+        self.counter += 1
+        i = self.counter
+        if __base is None or __base is NoneType:
+            return None
+        elif __base is bool:
+            return self.rng.random() < 0.5
+        elif __base is int:
+            # counter starts at 2, so that ints never equal True or False
+            return i
+        elif __base is float:
+            return i + 0.5
+        elif __base is str:
+            return f"s{i}"
+        elif __base is bytes:
+            return f"b{i}".encode()
+        elif __base is bytearray:
+            return bytearray(f"b{i}".encode())
+        elif __base is memoryview:
+            return memoryview(f"m{i}".encode())
+        elif __base is complex:
+            return complex(i, 1)
+        elif __base is range:
+            return range(i)
+        else:
+            # non-subscribed collection
+            return __base()
+
+    def weight(self, __member: Descriptor) -> float:
+        return self.weights.get(__member.raw, 1.0)
+
+    def palette(self, __union: Descriptor, __size: int) -> list[Descriptor]:
+        """Members of the union picked for collections of `__size` elements -
+        weighted sample of up to `__size` of them, the same for each collection."""
+        palette = self.palettes.get(id(__union))
+        if palette is None:
+            members = [m for m in __union.args if self.weight(m) > 0] or list(
+                __union.args
+            )
+            palette = []
+            while len(palette) < min(len(members), __size):
+                remaining = [m for m in members if m not in palette]
+                palette.append(
+                    self.rng.choices(
+                        remaining, [self.weight(m) or 1.0 for m in remaining]
+                    )[0]
+                )
+            self.palettes[id(__union)] = palette
+
+        return palette
+
+    def member(self, __arg: Descriptor, __i: int, __size: int) -> Descriptor:
+        """Type of the `__i`-th element of a collection of `__size` elements -
+        members of the palette first, then any of them."""
+        if not __arg.is_union:
+            return __arg
+
+        palette = self.palette(__arg, __size)
+        if __i < len(palette):
+            return palette[__i]
+        return self.rng.choices(palette, [self.weight(m) or 1.0 for m in palette])[0]
+
+    def value(self, __descriptor: Descriptor, __size: int) -> Any:
+        if __descriptor.is_union:
+            # e.g. position of a fixed-length tuple, picks the same member always
+            return self.value(self.palette(__descriptor, 1)[0], __size)
+        elif len(__descriptor.args) == 0:
+            return self.scalar(__descriptor.base)
+
+        return self.collect(__descriptor, self.elements(__descriptor, __size))
+
+    def collect(self, __descriptor: Descriptor, __elements: Iterator[Any]) -> Any:
+        return cast(Any, __descriptor.base)(__elements)
+
+    def elements(
+        self,
+        __descriptor: Descriptor,
+        __size: int,
+        __mismatch_at: int | None = None,
+        __mismatch_depth: int | None = None,
+    ) -> Iterator[Any]:
+        """Elements of the collection, the one at `__mismatch_at` (if given)
+        invalid. Members of unions are taken from their palettes, except for
+        positions of fixed-length tuples which always hold the same member."""
+        args = __descriptor.args
+        if __descriptor.is_fixed_tuple:
+            __size = len(args)
+        elif __size < 1:
+            raise ValueError("`size` must be a positive integer")
+
+        if __mismatch_at is not None:
+            if not -__size <= __mismatch_at < __size:
+                raise ValueError(
+                    f"`mismatch_at` must be within the {__size} elements, "
+                    f"got {__mismatch_at}"
+                )
+            __mismatch_at %= __size
+
+        def _element(__arg: Descriptor, __i: int) -> Any:
+            if __i != __mismatch_at:
+                if not __descriptor.is_fixed_tuple:
+                    __arg = self.member(__arg, __i, __size)
+                return self.value(__arg, self.inner_size)
+            elif __mismatch_depth is None:
+                return self.invalid(__arg, self.inner_size, -1, None)
+            return self.invalid(__arg, self.inner_size, -1, __mismatch_depth - 1)
+
+        def _elements() -> Iterator[Any]:
+            for i in range(__size):
+                if __descriptor.base == dict:
+                    yield (
+                        self.value(self.member(args[0], i, __size), self.inner_size),
+                        _element(args[1], i),
+                    )
+                elif __descriptor.is_fixed_tuple:
+                    yield _element(args[i], i)
+                else:
+                    yield _element(args[0], i)
+
+        # not a generator itself, so that the arguments are checked right away
+        return _elements()
+
+    def invalid(
+        self,
+        __descriptor: Descriptor,
+        __size: int,
+        __mismatch_at: int,
+        __mismatch_depth: int | None,
+    ) -> Any:
+        if (
+            __mismatch_depth is not None and __mismatch_depth < 0
+        ) or __descriptor.depth == 0:
+            # unions are replaced as a whole - a mismatched member could still
+            # match any of the other ones
+            accepted = {
+                member.base
+                for member in (
+                    __descriptor.args if __descriptor.is_union else (__descriptor,)
+                )
+            }
+            base = next((b for b in _MISMATCHING_BASES if b not in accepted), None)
+            return object() if base is None else self.scalar(base)
+
+        if __descriptor.is_union:
+            return self.invalid(__descriptor, __size, __mismatch_at, -1)
+
+        return self.collect(
+            __descriptor,
+            self.elements(__descriptor, __size, __mismatch_at, __mismatch_depth),
+        )
@@ -0,0 +1,105 @@
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Optional, TypeAlias
+
+
+class Event(NamedTuple):
+    """Passed to the hooks, see `add`."""
+
+    source: str
+    """What is being timed - `"isvalid"`, `"describe_type"`, `"combinations"`
+    (`Descriptor.combinations`), `"func.validate"` (arguments of a decorated
+    function) or `"cls.validate"` (assignment of an annotated attribute)."""
+    type_info: Any
+    """Expected type, for decorated functions - types of the parameters by their
+    names, for `describe_type` - `None`."""
+    name: Optional[str]
+    """Fully qualified name of the decorated function (or attribute)."""
+    size: int
+    """Size (`len`) of the value, for decorated functions - of the biggest argument,
+    0 if it has no length."""
+
+
+OnStart: TypeAlias = Callable[[Event], Any]
+OnEnd: TypeAlias = Callable[[Event, float, Optional[bool]], Any]
+"""Called with the event, duration in seconds and the outcome - `None` unless
+validating or if validation raised. Each started event is ended, even if
+validation raises."""
+
+
+_on_start: list[OnStart] = []
+_on_end: list[OnEnd] = []
+
+enabled = False
+"""Whether any hook has been added - checked before anything else is done, hence
+hooks cost nothing unless added."""
+
+
+def add(
+    on_start: Optional[OnStart] = None, on_end: Optional[OnEnd] = None
+) -> Callable[[], None]:
+    """Adds hooks called before and after validation (and the underlying
+    `describe_type` and `Descriptor.combinations`). Returns a function removing
+    them. Exceptions raised by the hooks are propagated.
+
+    ### Examples
+    ```
+    def on_end(event: Event, duration: float, valid: bool | None) -> None:
+        tracer.record(event.source, event.name, duration)
+
+    remove = hooks.add(on_end=on_end)
+    ...
+    remove()
+    ```
+    """
+    global enabled
+
+    if on_start is not None:
+        _on_start.append(on_start)
+    if on_end is not None:
+        _on_end.append(on_end)
+    enabled = len(_on_start) + len(_on_end) != 0
+
+    def remove() -> None:
+        global enabled
+
+        if on_start is not None and on_start in _on_start:
+            _on_start.remove(on_start)
+        if on_end is not None and on_end in _on_end:
+            _on_end.remove(on_end)
+        enabled = len(_on_start) + len(_on_end) != 0
+
+    return remove
+
+
+def clear() -> None:
+    """Removes all the hooks."""
+    global enabled
+
+    _on_start.clear()
+    _on_end.clear()
+    enabled = False
+
+
+def start(
+    __source: str, __type_info: Any, name: Optional[str] = None, size: int = 0
+) -> tuple[Event, float]:
+    """Calls the `on_start` hooks. Returns the event and the start time to be passed
+    to `end`."""
+    event = Event(__source, __type_info, name, size)
+    for hook in _on_start:
+        hook(event)
+
+    return event, perf_counter()
+
+
+def end(__event: Event, __start: float, valid: Optional[bool] = None) -> None:
+    """Calls the `on_end` hooks."""
+    duration = perf_counter() - __start
+    for hook in _on_end:
+        hook(__event, duration, valid)
+
+
+def size(__val: Any) -> int:
+    """Size of the value passed to the hooks (and recorded in the metrics), 0 if it
+    has no length."""
+    return len(__val) if hasattr(__val, "__len__") else 0
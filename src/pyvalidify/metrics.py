@@ -0,0 +1,160 @@
+from time import perf_counter
+from typing import Union
+
+
+class Metrics:
+    """Counters collected by a decorated function (or, for assignments of its
+    annotated attributes, class). Updated by the wrappers, see `register`."""
+
+    __slots__ = (
+        "name",
+        "calls",
+        "validated",
+        "failures",
+        "total_time",
+        "max_time",
+        "max_size",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        """Number of calls (or assignments) - validated or not."""
+        self.validated = 0
+        """Number of validated calls, see `SamplingPolicy`."""
+        self.failures = 0
+        """Number of validated calls that turned out to be invalid."""
+        self.total_time = 0.0
+        """Cumulative validation time in seconds."""
+        self.max_time = 0.0
+        """The longest validation in seconds."""
+        self.max_size = 0
+        """The biggest size (`len`) of a validated argument."""
+
+    def passed(self, __start: float, __size: int = 0) -> None:
+        """Records a valid call validated since `__start` (`time.perf_counter`)."""
+        duration = perf_counter() - __start
+        self.validated += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        if __size > self.max_size:
+            self.max_size = __size
+
+    def failed(self, __start: float) -> None:
+        """Records an invalid call validated since `__start`."""
+        self.passed(__start)
+        self.failures += 1
+
+    def to_dict(self) -> dict[str, Union[int, float]]:
+        return {
+            "calls": self.calls,
+            "validated": self.validated,
+            "failures": self.failures,
+            "failure_rate": (
+                self.failures / self.validated if self.validated != 0 else 0.0
+            ),
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            "max_size": self.max_size,
+        }
+
+    def __repr__(self) -> str:
+        return f"Metrics({self.name!r}, {self.to_dict()})"
+
+
+_registry: dict[str, Metrics] = {}
+
+
+def register(__name: str) -> Metrics:
+    """Returns metrics of the decorated function (or class) of the given fully
+    qualified name, creating them if needed."""
+    metrics = _registry.get(__name)
+    if metrics is None:
+        metrics = _registry[__name] = Metrics(__name)
+
+    return metrics
+
+
+def get(__name: str) -> "Metrics | None":
+    return _registry.get(__name)
+
+
+def reset() -> None:
+    """Zeroes the counters of all the decorated functions."""
+    for metrics in _registry.values():
+        metrics.reset()
+
+
+def collect() -> dict[str, dict[str, Union[int, float]]]:
+    """Returns the counters of all the decorated functions by their fully qualified
+    names.
+
+    ### Examples
+    ```
+    {
+        "myapp.api.handler": {
+            "calls": 120,
+            "validated": 12,
+            "failures": 1,
+            "failure_rate": 0.083,
+            "total_time": 0.0021,
+            "max_time": 0.0004,
+            "max_size": 1500,
+        },
+        ...
+    }
+    ```
+    """
+    return {name: metrics.to_dict() for name, metrics in _registry.items()}
+
+
+_PROMETHEUS_METRICS: list[tuple[str, str, str, str]] = [
+    # name, type, help, attribute
+    ("calls_total", "counter", "Calls of the decorated function.", "calls"),
+    ("validated_total", "counter", "Validated calls.", "validated"),
+    ("failures_total", "counter", "Validated calls found invalid.", "failures"),
+    (
+        "validation_seconds_total",
+        "counter",
+        "Cumulative validation time.",
+        "total_time",
+    ),
+    ("validation_seconds_max", "gauge", "The longest validation.", "max_time"),
+    (
+        "argument_size_max",
+        "gauge",
+        "The biggest size of a validated argument.",
+        "max_size",
+    ),
+]
+
+
+def _escape(__label: str) -> str:
+    return __label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def to_prometheus(prefix: str = "pyvalidify") -> str:
+    """Returns the counters in the Prometheus text exposition format, labeled with
+    the names of the functions (`function`)."""
+    lines: list[str] = []
+    for name, _type, _help, attr in _PROMETHEUS_METRICS:
+        lines.append(f"# HELP {prefix}_{name} {_help}")
+        lines.append(f"# TYPE {prefix}_{name} {_type}")
+        for metrics in _registry.values():
+            lines.append(
+                f'{prefix}_{name}{{function="{_escape(metrics.name)}"}} '
+                f"{getattr(metrics, attr)}"
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(__path: str, prefix: str = "pyvalidify") -> None:
+    """Writes the counters to the file in the Prometheus text format, e.g. for the
+    textfile collector of the node exporter."""
+    with open(__path, "w") as f:
+        f.write(to_prometheus(prefix))
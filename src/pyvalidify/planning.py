@@ -0,0 +1,403 @@
+from time import perf_counter
+from typing import Any, NamedTuple, Optional, cast
+
+from . import counters as _counters
+from .descriptor import Descriptor
+from .type_hints import TypeInfo
+from .validator import (
+    _element_wise,
+    _holds_tuple,
+    compile_validator,
+    describe_type,
+    estimate_cost,
+)
+
+
+_MANY_VARIANTS = 16
+"""Number of distinct types of elements from which the description of a value
+is a hot spot."""
+_MANY_COMBINATIONS = 64
+
+_EXPANSION_WEIGHT = 0.65
+"""Cost of reducing and expanding the description of a value, per squared node of
+the description, relative to describing a single node of the value. Fitted on lists
+of tuples of mixed lengths and members."""
+
+_unit_time: Optional[float] = None
+
+
+class Work(NamedTuple):
+    """Work done for each element of a generic matched by its combinations."""
+
+    type_info: str
+    nodes: int
+    """Value nodes described per element (key-value pair for dicts), assuming
+    nested collections of one element."""
+    variants: int
+    """Distinct types an element may have."""
+
+    def __str__(self) -> str:
+        return (
+            f"`{self.type_info}` - {self.nodes} value "
+            f"node{'s' if self.nodes != 1 else ''} described per element, up to "
+            f"{self.variants} distinct types"
+        )
+
+
+class Measurement(NamedTuple):
+    """Predicted and measured cost of validating a value, see `explain`."""
+
+    valid: bool
+    nodes: int
+    """Nodes of the value matched by combinations - the value itself, its elements,
+    their elements and so on."""
+    described: int
+    """Nodes of the descriptions of those values - grows with the number of
+    distinct types of their elements."""
+    predicted: float
+    """Predicted cost in units of describing a single value node."""
+    predicted_time: float
+    measured_time: float
+    counts: _counters.Counts
+    """Operations counted while validating the value."""
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"  valid: {self.valid}",
+                f"  value nodes described: {self.nodes}, nodes of the "
+                f"descriptions: {self.described}",
+                f"  predicted: {self.predicted:.0f} units "
+                f"(~{_format_time(self.predicted_time)})",
+                f"  measured: {_format_time(self.measured_time)} "
+                f"({self.counts.nodes} value nodes, {self.counts.descriptors} "
+                f"descriptors, {self.counts.combinations} combinations)",
+            ]
+        )
+
+
+class Plan:
+    """How values of a type are validated and what it costs, see `explain`."""
+
+    __slots__ = (
+        "type_info",
+        "tree",
+        "cost",
+        "combinations",
+        "work",
+        "fast_paths",
+        "notes",
+        "measurement",
+    )
+
+    def __init__(self, __type_info: TypeInfo) -> None:
+        self.type_info = __type_info
+        self.tree: list[str] = []
+        """Lines of the normalized type tree, each node with the way it is matched."""
+        self.cost = estimate_cost(__type_info)
+        """See `estimate_cost`."""
+        self.combinations = 0
+        """Combinations computed (once per type) for the generics matched by them."""
+        self.work: list[Work] = []
+        self.fast_paths: list[str] = []
+        self.notes: list[str] = []
+        """Hot spots of the type and how to avoid them."""
+        self.measurement: Optional[Measurement] = None
+
+    def __str__(self) -> str:
+        expected = Descriptor(self.type_info)._get_str()
+        lines = [f"Plan of `{expected}`", "", "Type tree:"]
+        lines += [f"  {line}" for line in self.tree]
+        lines += [
+            "",
+            f"Estimated cost: {self.cost} (see `estimate_cost`)",
+            f"Combinations: {self.combinations}",
+        ]
+        for title, items in [
+            ("Per element", self.work),
+            ("Fast paths", self.fast_paths),
+            ("Notes", self.notes),
+        ]:
+            if len(items) != 0:
+                lines += ["", f"{title}:"] + [f"  - {item}" for item in items]
+        if self.measurement is not None:
+            lines += ["", "Value:", str(self.measurement)]
+
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"Plan({self.type_info!r})"
+
+
+def _format_time(__seconds: float) -> str:
+    if __seconds >= 1:
+        return f"{__seconds:.2f}s"
+    elif __seconds >= 1e-3:
+        return f"{__seconds * 1e3:.2f}ms"
+    return f"{__seconds * 1e6:.2f}us"
+
+
+def _nodes(__expected: Descriptor) -> int:
+    if __expected.is_union:
+        return max(_nodes(member) for member in __expected.args)
+    return 1 + sum(_nodes(arg) for arg in __expected.args)
+
+
+def _variants(__expected: Descriptor) -> int:
+    """Distinct types of values of a type matched by combinations - hence without
+    tuples."""
+    if __expected.is_union:
+        return sum(_variants(member) for member in __expected.args)
+
+    elif len(__expected.args) == 0:
+        return 1
+
+    # collections of mixed elements are distinct from the uniform ones
+    product = 1
+    for arg in __expected.args:
+        product *= 2 ** _variants(arg) - 1
+    return product
+
+
+def _plan(__plan: Plan, __expected: Descriptor, __level: int) -> None:
+    """Walks the type the way `_compile` does."""
+    name = __expected._get_str()
+    indent = "  " * __level
+    if __expected.is_union:
+        if all(len(member.args) == 0 for member in __expected.args):
+            __plan.tree.append(f"{indent}{name} - type looked up in a set")
+            __plan.fast_paths.append(f"`{name}` - single lookup in a set of types")
+            return
+
+        __plan.tree.append(f"{indent}{name} - any of the members, in order")
+        for member in __expected.args:
+            _plan(__plan, member, __level + 1)
+
+    elif len(__expected.args) == 0:
+        __plan.tree.append(f"{indent}{name} - type check")
+
+    elif __expected.base == tuple:
+        if __expected.is_fixed_tuple:
+            __plan.tree.append(f"{indent}{name} - length, then position by position")
+            __plan.fast_paths.append(
+                f"`{name}` - length checked before the elements, no combinations"
+            )
+        else:
+            __plan.tree.append(f"{indent}{name} - each element")
+            __plan.fast_paths.append(
+                f"`{name}` - elements checked one by one, no combinations"
+            )
+        for arg in __expected.args:
+            _plan(__plan, arg, __level + 1)
+
+    elif _element_wise(__expected):
+        reason = "holds tuples" if _holds_tuple(__expected) else "no unions"
+        __plan.tree.append(f"{indent}{name} - each element ({reason})")
+        __plan.fast_paths.append(
+            f"`{name}` - {reason}, elements checked one by one, no combinations"
+        )
+        for arg in __expected.args:
+            _plan(__plan, arg, __level + 1)
+
+    else:
+        combinations = len(__expected.combinations())
+        __plan.combinations += combinations
+        __plan.tree.append(
+            f"{indent}{name} - value described, matched by {combinations} "
+            f"combination{'s' if combinations != 1 else ''}"
+        )
+        _described(__plan, __expected, __level + 1)
+        __plan.fast_paths.append(
+            f"`{name}` - values other than `{cast(type, __expected.base).__name__}` "
+            "rejected without describing them"
+        )
+
+        work = Work(
+            name,
+            sum(_nodes(arg) for arg in __expected.args),
+            sum(_variants(arg) for arg in __expected.args),
+        )
+        __plan.work.append(work)
+        if work.variants > _MANY_VARIANTS:
+            __plan.notes.append(
+                f"`{name}` - elements of distinct types are described as a union of "
+                "all of them, which is then reduced and expanded as a whole - the "
+                "cost grows with the square of the number of distinct types found "
+                "in the value."
+            )
+        if combinations > _MANY_COMBINATIONS:
+            __plan.notes.append(
+                f"`{name}` has {combinations} combinations - exponential in the "
+                "width of the unions within collections, computed once per type."
+            )
+
+
+def _described(__plan: Plan, __expected: Descriptor, __level: int) -> None:
+    """Nodes within a generic matched by combinations, described with the value."""
+    for arg in __expected.args:
+        __plan.tree.append("  " * __level + arg._get_str())
+        if arg.is_union or len(arg.args) != 0:
+            _described(__plan, arg, __level + 1)
+
+
+def _value_nodes(__val: Any) -> int:
+    if type(__val) in (list, set, frozenset, tuple):
+        return 1 + sum(_value_nodes(elem) for elem in __val)
+    elif type(__val) is dict:
+        return 1 + sum(_value_nodes(k) + _value_nodes(v) for k, v in __val.items())
+    return 1
+
+
+def _shape(__val: Any) -> Any:
+    """Hashable equivalent of `describe_type(__val)`, cheaper to compute."""
+    _type = type(__val)
+    if _type in (list, set, frozenset):
+        return (_type, frozenset(map(_shape, __val))) if len(__val) != 0 else _type
+    elif _type is dict:
+        return (
+            (
+                dict,
+                frozenset(map(_shape, __val)),
+                frozenset(map(_shape, __val.values())),
+            )
+            if len(__val) != 0
+            else dict
+        )
+    elif _type is tuple:
+        return (tuple, tuple(map(_shape, __val)))
+    return _type
+
+
+def _shape_size(__shape: Any) -> int:
+    """Nodes of the description of a value of the shape."""
+    if type(__shape) is not tuple:
+        return 1
+    elif __shape[0] is tuple:
+        return 1 + sum(map(_shape_size, __shape[1]))
+
+    size = 1
+    for elements in __shape[1:]:
+        sizes = [_shape_size(elem) for elem in elements]
+        # elements of distinct types are described as a union
+        size += sizes[0] if len(sizes) == 1 else 1 + sum(sizes)
+    return size
+
+
+def _predict(__expected: Descriptor, __val: Any) -> tuple[int, int, float]:
+    """Value nodes described, nodes of the descriptions and the predicted cost of
+    validating the value, following `_compile`."""
+    if __expected.is_union:
+        if all(len(member.args) == 0 for member in __expected.args):
+            return 0, 0, 1.0
+        predictions = [_predict(member, __val) for member in __expected.args]
+        return (
+            sum(p[0] for p in predictions),
+            sum(p[1] for p in predictions),
+            sum(p[2] for p in predictions),
+        )
+
+    elif len(__expected.args) == 0:
+        return 0, 0, 1.0
+
+    elif type(__val) is not __expected.base:
+        return 0, 0, 1.0
+
+    elif __expected.base == tuple or _element_wise(__expected):
+        # matched element by element
+        args = __expected.args
+        if __expected.is_fixed_tuple:
+            if len(__val) != __expected.length:
+                return 0, 0, 1.0
+            pairs = list(zip(args, __val))
+        elif __expected.base == dict:
+            pairs = [(args[0], key) for key in __val]
+            pairs += [(args[1], value) for value in __val.values()]
+        else:
+            pairs = [(args[0], elem) for elem in __val]
+        predictions = [_predict(arg, elem) for arg, elem in pairs]
+        return (
+            sum(p[0] for p in predictions),
+            sum(p[1] for p in predictions),
+            1.0 + sum(p[2] for p in predictions),
+        )
+
+    nodes, described = _value_nodes(__val), _shape_size(_shape(__val))
+    return nodes, described, nodes + _EXPANSION_WEIGHT * described**2
+
+
+def _get_unit_time() -> float:
+    """Time of describing a single value node on this machine, measured once."""
+    global _unit_time
+
+    if _unit_time is None:
+        val = list(range(1000))
+        best = float("inf")
+        for _ in range(3):
+            start = perf_counter()
+            describe_type(val)
+            best = min(best, perf_counter() - start)
+        _unit_time = best / 1001
+
+    return _unit_time
+
+
+_NO_VALUE: Any = object()
+
+
+def explain(__type_info: TypeInfo, value: Any = _NO_VALUE) -> Plan:
+    """Explains how values of the type are validated and what it costs - the
+    normalized type tree with the way each node is matched, the combinations
+    computed for the generics matched by them, the work done per element, fast
+    paths and hot spots of the type. Given a value (`None` is a value too), the plan
+    also compares the predicted cost of validating it with the measured one. Print
+    the plan to read it.
+
+    ### Examples
+    ```
+    print(explain(list[int | str | float | bytes | None]))
+    # ...
+    # Combinations: 31
+    #
+    # Per element:
+    #   - `list[int | str | float | bytes | None]` - 1 value node described per element, up to 5 distinct types
+    # ...
+
+    explain(list[int | str], [1, "a"]).measurement.measured_time
+    ```
+
+    ### Raises
+    - `TypeError` when `__type_info` is not valid TypeInfo type
+    """
+    plan = Plan(__type_info)
+    expected = Descriptor(__type_info)
+    _plan(plan, expected, 0)
+
+    if expected.has_nested_union:
+        plan.notes.append(
+            "Compiled validators of types with nested unions are reused only for "
+            "the very same object - define the type once (e.g. as a module-level "
+            "alias) rather than inline in a loop."
+        )
+    else:
+        plan.fast_paths.append("validator compiled once and cached by the type")
+
+    if value is not _NO_VALUE:
+        validator = compile_validator(__type_info)
+        start = perf_counter()
+        valid = validator(value)
+        measured_time = perf_counter() - start
+        with _counters.count() as counts:
+            validator(value)
+
+        nodes, described, predicted = _predict(expected, value)
+        plan.measurement = Measurement(
+            valid,
+            nodes,
+            described,
+            predicted,
+            predicted * _get_unit_time(),
+            measured_time,
+            counts,
+        )
+
+    return plan
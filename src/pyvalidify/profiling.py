@@ -0,0 +1,182 @@
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from . import counters as _counters
+
+
+PHASES: tuple[str, ...] = (
+    "Descriptor",
+    "combinations",
+    "describe_type",
+    "reductions",
+    "undefined_tuple_combinations",
+    "intersection",
+)
+"""Phases of `isvalid` in the order they run. The expected type is described
+(`Descriptor`) and its combinations enumerated once per type - validators are
+cached, see `compile_validator`. Collections with unions nested in them (unless
+they hold tuples) then describe each value (`describe_type`), reduce the description (`reductions`), expand tuples of
+the reductions (`undefined_tuple_combinations`) and look them up among the
+combinations (`intersection`)."""
+
+enabled = False
+"""Whether `isvalid` is being profiled, see `profile`."""
+uncached = False
+"""Whether validators are compiled on each call of `isvalid`, see `profile`."""
+
+
+class Phase:
+    """Time spent in a phase of `isvalid` and the number of objects it handled -
+    descriptors created (`Descriptor`), value nodes visited (`describe_type`),
+    descriptors returned (`combinations`, `reductions`,
+    `undefined_tuple_combinations`) or looked up (`intersection`)."""
+
+    __slots__ = ("calls", "time", "objects")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+        self.objects = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"Phase(calls={self.calls}, time={self.time:.6f}, "
+            f"objects={self.objects})"
+        )
+
+
+class Profile:
+    """Phases of `isvalid` aggregated within `profile`."""
+
+    __slots__ = ("calls", "time", "phases")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        """Number of `isvalid` calls."""
+        self.time = 0.0
+        """Time spent in `isvalid` in seconds, phases included."""
+        self.phases: dict[str, Phase] = {name: Phase() for name in PHASES}
+
+    @property
+    def other(self) -> float:
+        """Time of `isvalid` spent outside of the phases - compiling and calling the
+        validators, matching unions, tuples, collections matched element by
+        element and non-subscribed types."""
+        return max(self.time - sum(phase.time for phase in self.phases.values()), 0.0)
+
+    def merge(self, __other: "Profile") -> None:
+        self.calls += __other.calls
+        self.time += __other.time
+        for name, phase in __other.phases.items():
+            merged = self.phases[name]
+            merged.calls += phase.calls
+            merged.time += phase.time
+            merged.objects += phase.objects
+
+    def table(self) -> str:
+        """Phases formatted as a table - calls, total time, time per call, share of
+        the time of `isvalid` and objects handled.
+
+        ### Examples
+        ```
+        phase                         calls     time  per call  share   objects
+        Descriptor                        1   0.03ms   31.04us   0.0%         3
+        combinations                      1   0.05ms   50.13us   0.0%         3
+        describe_type                  1000  95.21ms   95.21us  71.2%   1001000
+        ...
+        other                                  3.87ms             2.9%
+        isvalid                        1000 133.70ms  133.70us 100.0%
+        ```
+        """
+        header = (
+            f"{'phase':<29} {'calls':>6} {'time':>10} {'per call':>10} "
+            f"{'share':>6} {'objects':>9}"
+        )
+        lines = [header]
+        for name, phase in self.phases.items():
+            lines.append(
+                f"{name:<29} {phase.calls:>6} {_format(phase.time):>10} "
+                f"{_format(phase.time / phase.calls if phase.calls else 0.0):>10} "
+                f"{self._share(phase.time):>6} {phase.objects:>9}"
+            )
+        lines.append(
+            f"{'other':<29} {'':>6} {_format(self.other):>10} {'':>10} "
+            f"{self._share(self.other):>6}"
+        )
+        lines.append(
+            f"{'isvalid':<29} {self.calls:>6} {_format(self.time):>10} "
+            f"{_format(self.time / self.calls if self.calls else 0.0):>10} "
+            f"{self._share(self.time):>6}"
+        )
+
+        return "\n".join(lines)
+
+    def _share(self, __time: float) -> str:
+        return f"{__time / self.time:.1%}" if self.time > 0 else "-"
+
+    def __repr__(self) -> str:
+        return (
+            f"Profile(calls={self.calls}, time={self.time:.6f}, phases={self.phases})"
+        )
+
+
+def _format(__seconds: float) -> str:
+    if __seconds >= 1:
+        return f"{__seconds:.2f}s"
+    elif __seconds >= 1e-3:
+        return f"{__seconds * 1e3:.2f}ms"
+    return f"{__seconds * 1e6:.2f}us"
+
+
+_profile: Optional[Profile] = None
+
+
+def record(__phase: str, __time: float, __objects: int = 0) -> None:
+    """Adds a run of the phase (`"isvalid"` for the whole call) to the current
+    profile. Called by the engine only if `enabled`."""
+    assert _profile is not None
+    if __phase == "isvalid":
+        _profile.calls += 1
+        _profile.time += __time
+        return
+
+    phase = _profile.phases[__phase]
+    phase.calls += 1
+    phase.time += __time
+    phase.objects += __objects
+
+
+@contextmanager
+def profile(cached: bool = True) -> Iterator[Profile]:
+    """Profiles `isvalid` within the block - time and objects of each of its phases
+    (see `PHASES`), aggregated over all the calls. Nested blocks add up to the outer
+    ones. Profiling adds overhead of its own, compare the shares of the phases
+    rather than absolute times with unprofiled runs.
+
+    ### Parameters
+    - `cached` - reuse the compiled validators as `isvalid` does (`Descriptor` and
+    `combinations` then run once per type), `False` compiles a validator on each
+    call, showing the cost of validating a type seen for the first time
+
+    ### Examples
+    ```
+    with profiling.profile() as profile:
+        for payload in payloads:
+            isvalid(payload, list[dict[str, int | str]])
+
+    print(profile.table())
+    ```
+    """
+    global enabled, uncached, _profile
+
+    previous = (enabled, uncached, _profile)
+    current = Profile()
+    enabled, uncached, _profile = True, not cached, current
+    try:
+        # counts of descriptors and value nodes come from the counters
+        with _counters.count():
+            yield current
+    finally:
+        enabled, uncached, _profile = previous
+        if _profile is not None:
+            _profile.merge(current)
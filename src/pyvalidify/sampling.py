@@ -0,0 +1,143 @@
+from typing import Optional
+
+
+class SamplingPolicy:
+    """Decides which calls of a decorated function are validated. Calls that are
+    not selected only increment a counter.
+
+    ### Parameters
+    - `every` - validate one in `every` calls, `1` validates all of them
+    - `adaptive` - adjust the interval at runtime: validate every call after a
+    failure and double the interval (up to `max_every`) after `backoff_after`
+    consecutive valid calls
+    - `max_every` - the longest interval an adaptive policy backs off to, defaults
+    to `16 * every`
+    - `backoff_after` - number of consecutive valid calls after which an adaptive
+    policy doubles the interval
+
+    ### Examples
+    ```
+    @func.validate(sampling=SamplingPolicy(100))
+    def foo(a: list[int]) -> None: ...
+
+    # or for all the decorated functions without their own policy
+    set_default_policy(SamplingPolicy(10, adaptive=True))
+    ```
+
+    ### Raises
+    - `ValueError` when `every`, `max_every` or `backoff_after` is lower than 1,
+    or `max_every` is lower than `every`
+    """
+
+    def __init__(
+        self,
+        every: int = 1,
+        *,
+        adaptive: bool = False,
+        max_every: Optional[int] = None,
+        backoff_after: int = 1000,
+    ) -> None:
+        if max_every is None:
+            max_every = 16 * every
+
+        if every < 1 or max_every < 1 or backoff_after < 1:
+            raise ValueError(
+                "`every`, `max_every` and `backoff_after` must be positive integers"
+            )
+        elif max_every < every:
+            raise ValueError("`max_every` must not be lower than `every`")
+
+        self.every = every
+        self.adaptive = adaptive
+        self.max_every = max_every
+        self.backoff_after = backoff_after
+
+        self._interval = every
+        self._skipped = 0
+        self._streak = 0
+        self._validated = 0
+        self._failures = 0
+
+    @property
+    def interval(self) -> int:
+        """Current interval - differs from `every` for adaptive policies."""
+        return self._interval
+
+    @property
+    def validated(self) -> int:
+        """Number of calls selected for validation."""
+        return self._validated
+
+    @property
+    def failures(self) -> int:
+        """Number of validated calls that turned out to be invalid."""
+        return self._failures
+
+    def sample(self) -> bool:
+        """Tells if the current call is to be validated."""
+        self._skipped += 1
+        if self._skipped < self._interval:
+            return False
+
+        self._skipped = 0
+        self._validated += 1
+        return True
+
+    def record(self, __valid: bool) -> None:
+        """Records the outcome of a validated call."""
+        if __valid:
+            self._streak += 1
+            if (
+                self.adaptive
+                and self._streak >= self.backoff_after
+                and self._interval < self.max_every
+            ):
+                # long clean streak, back off
+                self._interval = min(2 * self._interval, self.max_every)
+                self._streak = 0
+        else:
+            self._failures += 1
+            self._streak = 0
+            if self.adaptive:
+                # recent failure, validate every call until the streak builds up
+                self._interval = 1
+                self._skipped = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SamplingPolicy(every={self.every}, adaptive={self.adaptive}, "
+            f"max_every={self.max_every}, backoff_after={self.backoff_after})"
+        )
+
+
+_default_policy: Optional[SamplingPolicy] = None
+
+
+def get_default_policy() -> Optional[SamplingPolicy]:
+    """Policy used by decorated functions that have not been given their own.
+    `None` (the default) means that every call is validated."""
+    return _default_policy
+
+
+def set_default_policy(__policy: "SamplingPolicy | int | None") -> None:
+    """Sets the policy shared by decorated functions that have not been given their
+    own. Integer `n` is a shorthand for `SamplingPolicy(n)`, `None` restores
+    validating every call."""
+    global _default_policy
+    _default_policy = to_policy(__policy)
+
+
+def to_policy(__policy: "SamplingPolicy | int | None") -> Optional[SamplingPolicy]:
+    """Converts the `sampling` argument of the decorators into a policy.
+
+    ### Raises
+    - `TypeError` when `__policy` is neither `SamplingPolicy`, `int` nor `None`
+    """
+    if __policy is None or isinstance(__policy, SamplingPolicy):
+        return __policy
+    elif isinstance(__policy, int) and not isinstance(__policy, bool):
+        return SamplingPolicy(__policy)
+    else:
+        raise TypeError(
+            f"Expected `SamplingPolicy`, `int` or `None`, got `{type(__policy)}`"
+        )
@@ -1,32 +1,36 @@
 from types import GenericAlias, NoneType, UnionType
-from typing import Any, TypeAlias, TypeGuard, get_origin, get_args
-
-
-SUPPORTED_BASE_TYPES = [
-    str,
-    int,
-    float,
-    complex,
-    range,
-    list,
-    tuple,
-    dict,
-    set,
-    frozenset,
-    bool,
-    bytes,
-    bytearray,
-    memoryview,
-    NoneType,  # type(NoneType) = type
-    None,  # type(None) = NoneType
-]
-SUBSCRIPTABLE_BASE_TYPE = [
-    list,
-    tuple,
-    dict,
-    set,
-    frozenset,
-]
+from typing import Any, NamedTuple, TypeAlias, TypeGuard, get_origin, get_args
+
+
+SUPPORTED_BASE_TYPES = frozenset(
+    [
+        str,
+        int,
+        float,
+        complex,
+        range,
+        list,
+        tuple,
+        dict,
+        set,
+        frozenset,
+        bool,
+        bytes,
+        bytearray,
+        memoryview,
+        NoneType,  # type(NoneType) = type
+        None,  # type(None) = NoneType
+    ]
+)
+SUBSCRIPTABLE_BASE_TYPE = frozenset(
+    [
+        list,
+        tuple,
+        dict,
+        set,
+        frozenset,
+    ]
+)
 
 SupportedBaseType: TypeAlias = type | NoneType
 """Anything described by `SUPPORTED_BASE_TYPES`."""
@@ -61,18 +65,154 @@ TypeInfo: TypeAlias = (
 )
 
 
+class TypeNode(NamedTuple):
+    """Normalized `TypeInfo` - result of `normalize_type_info`. Every node of the
+    type hint is validated and classified exactly once.
+    """
+
+    hint: Any
+    """The type hint the node was created from (member of `TypeInfo`)."""
+    base: SupportedBaseType
+    """E.g. `list[str] -> list`, `str -> str`, `str | int -> None`, `None -> None`."""
+    args: "tuple[TypeNode, ...]"
+    """Arguments without ellipsis. E.g. `tuple[str, ...] -> (TypeNode(str),)`."""
+    is_union: bool
+    """`UnionType` or tuple of type hints."""
+    is_variadic: bool
+    """Tuple with undefined number of elements, e.g. `tuple[str, ...]`."""
+    has_union: bool
+    """The node is a union or has a union somewhere within itself."""
+
+
+def _normalize(__val: Any) -> TypeNode | None:
+    """Single pass over the type hint. Returns `None` as soon as any of its
+    members turns out not to be supported."""
+    if isinstance(__val, GenericAlias):
+        _origin = get_origin(__val)
+        if not is_supported_base_type(_origin):
+            return None
+
+        _raw_args = get_args(__val)
+        _is_variadic = (
+            _origin is tuple and len(_raw_args) == 2 and _raw_args[1] is Ellipsis
+        )
+        if _is_variadic:
+            _raw_args = _raw_args[:1]
+
+        _args = []
+        for arg in _raw_args:
+            # tuples of type hints are only allowed at the top level
+            _node = None if isinstance(arg, tuple) else _normalize(arg)
+            if _node is None:
+                return None
+            _args.append(_node)
+
+        return TypeNode(
+            __val,
+            _origin,
+            tuple(_args),
+            False,
+            _is_variadic,
+            any(arg.has_union for arg in _args),
+        )
+
+    elif isinstance(__val, UnionType):
+        _args = []
+        for arg in get_args(__val):
+            _node = _normalize(arg)
+            if _node is None:
+                return None
+            _args.append(_node)
+
+        return TypeNode(__val, None, tuple(_args), True, False, True)
+
+    elif is_supported_base_type(__val):
+        return TypeNode(
+            __val, None if __val is NoneType else __val, (), False, False, False
+        )
+
+    else:
+        return None
+
+
+def _normalize_top_level(__val: Any) -> TypeNode | None:
+    """Same as `_normalize`, but additionally accepts tuples of type hints."""
+    if isinstance(__val, tuple):
+        # tuple of type hints - equivalent of a union
+        _args = []
+        for arg in __val:
+            _node = None if isinstance(arg, tuple) else _normalize(arg)
+            if _node is None:
+                return None
+            _args.append(_node)
+
+        if len(_args) == 0:
+            return None
+
+        return TypeNode(__val, None, tuple(_args), True, False, True)
+
+    return _normalize(__val)
+
+
+_NORMALIZED_CACHE: dict[Any, TypeNode] = {}
+_NORMALIZED_CACHE_MAXSIZE = 1024
+
+
+def normalize_type_info(__val: Any) -> TypeNode | None:
+    """Validates and classifies every node of the given type hint in one pass.
+    Results are cached by the type hint. Returns `None` when the value is not
+    a valid `TypeInfo`.
+
+    ### Examples
+    ```
+    normalize_type_info(list[str]) == TypeNode(
+        list[str], list, (TypeNode(str, str, (), False, False, False),),
+        False, False, False
+    )
+    normalize_type_info(list[Any]) is None
+    ```
+    """
+    try:
+        _node = _NORMALIZED_CACHE.get(__val)
+    except TypeError:
+        # unhashable, cannot be a type hint
+        return None
+
+    # Unions compare equal regardless of the order of their members (and to
+    # `typing.Union`), while the order is reflected in the node. Hence, hints with
+    # unions are only reused for the very same object.
+    if _node is not None and (_node.hint is __val or not _node.has_union):
+        return _node
+
+    _node = _normalize_top_level(__val)
+    if _node is not None:
+        if len(_NORMALIZED_CACHE) >= _NORMALIZED_CACHE_MAXSIZE:
+            _NORMALIZED_CACHE.clear()
+        _NORMALIZED_CACHE[__val] = _node
+
+    return _node
+
+
 def is_supported_base_type(__val: Any) -> TypeGuard[SupportedBaseType]:
     """Validate if the given value is `SupportedBaseType`. I.e. checks
-    if it is in the `SUPPORTED_BASE_TYPES` list.
+    if it is in the `SUPPORTED_BASE_TYPES` set.
     """
-    return __val in SUPPORTED_BASE_TYPES
+    try:
+        return __val in SUPPORTED_BASE_TYPES
+    except TypeError:
+        # unhashable
+        return False
 
 
 def is_subscriptable_base_type(__val: Any) -> TypeGuard[SubscriptableBaseType]:
     """Validate if the given value is `SubscriptableBaseType`. I.e. checks
-    if it is in the `SUBSCRIPTABLE_BASE_TYPE` list.
+    if it is in the `SUBSCRIPTABLE_BASE_TYPE` set.
     """
-    return __val in SUBSCRIPTABLE_BASE_TYPE
+    try:
+        return __val in SUBSCRIPTABLE_BASE_TYPE
+    except TypeError:
+        # unhashable
+        return False
 
 
 def is_non_union_generic(__val: Any) -> TypeGuard[NonUnionGeneric]:
@@ -80,14 +220,8 @@ def is_non_union_generic(__val: Any) -> TypeGuard[NonUnionGeneric]:
     it is `GenericAlias` not containing unions within itself.
     """
     if isinstance(__val, GenericAlias):
-        _valid_origin = get_origin(__val) in SUPPORTED_BASE_TYPES
-        _valid_args = all(
-            is_non_union_generic(v)
-            or (v == ... and get_origin(__val) == tuple)
-            or is_supported_base_type(v)
-            for v in get_args(__val)
-        )
-        return _valid_origin and _valid_args
+        _node = normalize_type_info(__val)
+        return _node is not None and not _node.has_union
 
     return False
 
@@ -104,14 +238,9 @@ def is_with_union(__val: Any) -> TypeGuard[WithUnion]:
     type of supported types or generic aliases or a generic alias that has
     a union somewhere within itself.
     """
-    if isinstance(__val, UnionType):
-        return all(
-            is_single_type_info(arg) or is_with_union(arg) for arg in get_args(__val)
-        )
-    elif isinstance(__val, GenericAlias):
-        return is_supported_base_type(get_origin(__val)) and any(
-            is_with_union(arg) for arg in get_args(__val)
-        )
+    if isinstance(__val, (UnionType, GenericAlias)):
+        _node = normalize_type_info(__val)
+        return _node is not None and _node.has_union
     else:
         return False
 
@@ -124,7 +253,4 @@ def is_type_info(__val: Any) -> TypeGuard[TypeInfo]:
     """Validate if the given value is `TypeInfo` - type/union/generic
     made of types specified in `SUPPORTED_BASE_TYPES`.
     """
-    if isinstance(__val, tuple):
-        return all(is_single_type_info(v) or is_with_union(v) for v in __val)
-    else:
-        return is_single_type_info(__val) or is_with_union(__val)
+    return normalize_type_info(__val) is not None
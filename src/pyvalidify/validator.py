@@ -1,24 +1,43 @@
 from itertools import chain
-from typing import Any
+from time import perf_counter
+from types import NoneType
+from typing import Any, Callable, Iterator, TypeAlias
+from . import counters as _counters
+from . import hooks as _hooks
+from . import profiling as _profiling
 from .type_hints import TypeInfo
 from .descriptor import Descriptor
 
 
 def describe_type(__value: Any) -> Descriptor:
+    if not _hooks.enabled:
+        return _describe_type(__value)
+
+    event, start = _hooks.start("describe_type", None, size=_hooks.size(__value))
+    try:
+        return _describe_type(__value)
+    finally:
+        _hooks.end(event, start)
+
+
+def _describe_type(__value: Any) -> Descriptor:
+    if _counters.enabled:
+        _counters.nodes += 1
+
     _base_type = type(__value)
     if _base_type in [list, set, frozenset]:
         # single arg
         if len(__value) != 0:
             # has elements
-            _args_types = [describe_type(elem) for elem in __value]
+            _args_types = [_describe_type(elem) for elem in __value]
             if _args_types[1:] == _args_types[:-1]:
                 # uniform-type collection
-                return Descriptor(base=_base_type, args=(_args_types[0],))
+                return Descriptor._trusted(_base_type, (_args_types[0],))
             else:
                 # multiple different types present in the collection
-                return Descriptor(
-                    base=_base_type,
-                    args=(Descriptor(base=None, args=tuple(set(_args_types))),),
+                return Descriptor._trusted(
+                    _base_type,
+                    (Descriptor._trusted(None, tuple(set(_args_types))),),
                 )
         else:
             # empty collection
@@ -26,36 +45,308 @@ def describe_type(__value: Any) -> Descriptor:
 
     elif _base_type == dict:
         # two args
+        if len(__value) == 0:
+            # empty collection
+            return Descriptor(dict)
 
         # I'm pretending here that dict_keys and dict_values are just regular
         # lists of values. This way I can easily get their TypeDescription
         # by extracting args from the result.
-        return Descriptor(
-            base=dict,
-            args=(
-                describe_type(list(__value.keys())).args[0],
-                describe_type(list(__value.values())).args[0],
+        return Descriptor._trusted(
+            dict,
+            (
+                _describe_type(list(__value.keys())).args[0],
+                _describe_type(list(__value.values())).args[0],
             ),
         )
 
     elif _base_type == tuple:
-        return Descriptor(
-            base=tuple, args=tuple([describe_type(elem) for elem in __value])
+        return Descriptor._trusted(
+            tuple, tuple([_describe_type(elem) for elem in __value])
         )
 
     else:
         return Descriptor(_base_type)
 
 
-def isvalid(__val: Any, __type_info: TypeInfo) -> bool:
+Validator: TypeAlias = Callable[[Any], bool]
+"""Function telling if the given value is valid, see `compile_validator`."""
+
+
+def _combinations_match(__val: Any, __expected: frozenset[Descriptor]) -> bool:
+    """Matches the value against the expected type by comparing its combinations
+    (given) with reductions of the actual type."""
+    if _profiling.enabled:
+        return _profiled_combinations_match(__val, __expected)
+
+    try:
+        actual = describe_type(__val)
+    except TypeError:
+        # unsupported element, e.g. `object()` - invalid, as at the top level
+        return False
+
+    actual_group = chain.from_iterable(
+        [_td.undefined_tuple_combinations() for _td in actual.reductions()]
+    )
+
+    return not __expected.isdisjoint(actual_group)
+
+
+def _profiled_combinations_match(__val: Any, __expected: frozenset[Descriptor]) -> bool:
+    """`_combinations_match` recording its phases, see `profiling.profile`."""
+    start, nodes = perf_counter(), _counters.nodes
+    try:
+        actual = describe_type(__val)
+    except TypeError:
+        return False
+    _profiling.record("describe_type", perf_counter() - start, _counters.nodes - nodes)
+
+    start = perf_counter()
+    reductions = actual.reductions()
+    _profiling.record("reductions", perf_counter() - start, len(reductions))
+
+    # the group is generated lazily, as in `_combinations_match` - its time is
+    # subtracted from the time of the intersection
+    expanded = [0.0, 0]
+
+    def _actual_group() -> Iterator[Descriptor]:
+        for _td in reductions:
+            start = perf_counter()
+            group = _td.undefined_tuple_combinations()
+            duration = perf_counter() - start
+            _profiling.record("undefined_tuple_combinations", duration, len(group))
+            expanded[0] += duration
+            for td in group:
+                expanded[1] += 1
+                yield td
+
+    start = perf_counter()
+    matched = not __expected.isdisjoint(_actual_group())
+    _profiling.record(
+        "intersection", perf_counter() - start - expanded[0], int(expanded[1])
+    )
+
+    return matched
+
+
+def _compile_tuple(__expected: Descriptor) -> Validator:
+    """Tuples are matched position by position, without describing the whole
+    tuple first. Fixed-length tuples are checked for length before any of their
+    elements.
+    """
+    if len(__expected.args) == 0:
+        # non-subscribed tuple
+        return lambda __val: type(__val) is tuple
+
+    elif __expected.is_fixed_tuple:
+        # E.g. tuple[int, str]
+        _length = __expected.length
+        _args = tuple(_compile(arg) for arg in __expected.args)
+
+        def _validator(__val: Any) -> bool:
+            return (
+                type(__val) is tuple
+                and len(__val) == _length
+                and all(arg(elem) for arg, elem in zip(_args, __val))
+            )
+
+        return _validator
+
+    else:
+        # E.g. tuple[int, ...]
+        _arg = _compile(__expected.args[0])
+        return lambda __val: type(__val) is tuple and all(map(_arg, __val))
 
-    expected = Descriptor(__type_info)
-    actual = describe_type(__val)
 
-    actual_group = list(
-        chain.from_iterable(
-            [_td.undefined_tuple_combinations() for _td in actual.reductions()]
+def _holds_tuple(__expected: Descriptor) -> bool:
+    """Is a subscribed tuple anywhere within the arguments (or members) of the
+    type."""
+    return any(
+        (arg.base == tuple and len(arg.args) != 0) or _holds_tuple(arg)
+        for arg in __expected.args
+    )
+
+
+def _element_wise(__expected: Descriptor) -> bool:
+    """Whether the collection is matched element by element (see
+    `_compile_collection`) rather than by combinations - it holds tuples, or no
+    unions, hence its only combination is the type itself."""
+    return _holds_tuple(__expected) or not __expected.has_nested_union
+
+
+def _compile_collection(__expected: Descriptor) -> Validator:
+    """Collections holding tuples are matched element by element, so that the
+    tuples follow the rules of `_compile_tuple` at any depth. So are collections
+    without unions, sparing the description of the value. As with combinations,
+    empty collections do not match subscribed types."""
+    _base = __expected.base
+    if _base == dict:
+        _key, _value = _compile(__expected.args[0]), _compile(__expected.args[1])
+        return lambda __val: (
+            type(__val) is dict
+            and len(__val) != 0
+            and all(map(_key, __val))
+            and all(map(_value, __val.values()))
         )
+
+    _arg = _compile(__expected.args[0])
+    return (
+        lambda __val: type(__val) is _base and len(__val) != 0 and all(map(_arg, __val))
     )
 
-    return len(set(actual_group).intersection(set(expected.combinations()))) > 0
+
+def _compile(__expected: Descriptor) -> Validator:
+    """Builds a validator specialised for the expected type."""
+    if __expected.is_union:
+        if all(len(member.args) == 0 for member in __expected.args):
+            # union of non-subscribed types, e.g. str | int | None
+            _types = frozenset(
+                NoneType if member.base is None else member.base
+                for member in __expected.args
+            )
+            return lambda __val: type(__val) in _types
+
+        # value matches a union if it matches any of its members
+        _members = tuple(_compile(member) for member in __expected.args)
+        return lambda __val: any(member(__val) for member in _members)
+
+    elif len(__expected.args) == 0:
+        # non-subscribed type, only the type of the value matters
+        _type = NoneType if __expected.base is None else __expected.base
+        return lambda __val: type(__val) is _type
+
+    elif __expected.base == tuple:
+        return _compile_tuple(__expected)
+
+    elif _element_wise(__expected):
+        return _compile_collection(__expected)
+
+    else:
+        # combinations are all based on the same type, hence values of any other
+        # type can be rejected without describing them
+        _base = __expected.base
+        if _profiling.enabled:
+            start = perf_counter()
+            _combinations = frozenset(__expected.combinations())
+            _profiling.record(
+                "combinations", perf_counter() - start, len(_combinations)
+            )
+        else:
+            _combinations = frozenset(__expected.combinations())
+        return lambda __val: type(__val) is _base and _combinations_match(
+            __val, _combinations
+        )
+
+
+_VALIDATORS: dict[Any, tuple[Any, Descriptor, Validator]] = {}
+_VALIDATORS_MAXSIZE = 1024
+
+
+def compile_validator(__type_info: TypeInfo) -> Validator:
+    """Returns a function validating values against the given type info. Everything
+    that depends only on the type (its `Descriptor`, combinations, etc.) is computed
+    once - validators are cached by the type info.
+
+    ### Examples
+    ```
+    validator = compile_validator(list[int | str])
+    validator([1, "2"])  # True
+    validator((1, "2"))  # False
+    ```
+
+    ### Raises
+    - `TypeError` when `__type_info` is not valid TypeInfo type
+    """
+    try:
+        _entry = _VALIDATORS.get(__type_info)
+    except TypeError:
+        # unhashable, let the Descriptor raise
+        _entry = None
+
+    # see `normalize_type_info` for the reason unions are only reused for the
+    # very same object
+    if (
+        _entry is not None
+        and (_entry[0] is __type_info or not _entry[1].has_nested_union)
+        and not _profiling.uncached
+    ):
+        return _entry[2]
+
+    if _profiling.enabled:
+        start, descriptors = perf_counter(), _counters.descriptors
+        _expected = Descriptor(__type_info)
+        _profiling.record(
+            "Descriptor", perf_counter() - start, _counters.descriptors - descriptors
+        )
+    else:
+        _expected = Descriptor(__type_info)
+    _validator = _compile(_expected)
+
+    if len(_VALIDATORS) >= _VALIDATORS_MAXSIZE:
+        _VALIDATORS.clear()
+    _VALIDATORS[__type_info] = (__type_info, _expected, _validator)
+
+    return _validator
+
+
+def _estimate_cost(__expected: Descriptor) -> int:
+    if __expected.is_union:
+        if all(len(member.args) == 0 for member in __expected.args):
+            return 1
+        return sum(_estimate_cost(member) for member in __expected.args)
+
+    elif len(__expected.args) == 0:
+        return 1
+
+    elif __expected.base == tuple or _element_wise(__expected):
+        return 1 + sum(_estimate_cost(arg) for arg in __expected.args)
+
+    else:
+        # describing the value plus matching it against the combinations
+        return 1 + __expected.depth + len(__expected.combinations())
+
+
+def estimate_cost(__type_info: TypeInfo) -> int:
+    """Estimates the relative cost of validating a value against the type - in
+    units of a single type check, assuming collections of one element each. The
+    cost of collections with unions nested in them (unless they hold tuples) grows
+    with the number of combinations of the type (see `Descriptor.combinations`).
+
+    ### Examples
+    ```
+    estimate_cost(int | str)  # 1
+    estimate_cost(tuple[int, str])  # 3
+    estimate_cost(list[int])  # 2
+    estimate_cost(list[int | str])  # 5
+    ```
+
+    ### Raises
+    - `TypeError` when `__type_info` is not valid TypeInfo type
+    """
+    return _estimate_cost(Descriptor(__type_info))
+
+
+def _profiled_isvalid(__val: Any, __type_info: TypeInfo) -> bool:
+    start = perf_counter()
+    try:
+        return compile_validator(__type_info)(__val)
+    finally:
+        _profiling.record("isvalid", perf_counter() - start)
+
+
+def isvalid(__val: Any, __type_info: TypeInfo) -> bool:
+    if not (_hooks.enabled or _profiling.enabled):
+        return compile_validator(__type_info)(__val)
+    elif not _hooks.enabled:
+        return _profiled_isvalid(__val, __type_info)
+
+    event, start = _hooks.start("isvalid", __type_info, size=_hooks.size(__val))
+    valid = None
+    try:
+        if _profiling.enabled:
+            valid = _profiled_isvalid(__val, __type_info)
+        else:
+            valid = compile_validator(__type_info)(__val)
+        return valid
+    finally:
+        _hooks.end(event, start, valid)
@@ -0,0 +1,107 @@
+import os
+import unittest
+from unittest.mock import patch
+from parameterized import parameterized
+
+from src.pyvalidify import config
+from src.pyvalidify.config import Rule
+from src.pyvalidify.decorators import cls, func
+from src.pyvalidify.sampling import SamplingPolicy
+
+
+class TestConfig(unittest.TestCase):
+    def tearDown(self) -> None:
+        config.reset()
+
+    def test_resolve_default(self) -> None:
+        self.assertEqual(config.resolve("myapp"), Rule("validate", None))
+
+    @parameterized.expand(
+        [
+            ("myapp", "validate"),
+            ("myapp.api", "sample"),
+            ("myapp.api.hot", "off"),
+            ("myapp.apis", "validate"),
+            ("other", "off"),
+        ]
+    )
+    def test_resolve_longest_prefix(self, module: str, expected: str) -> None:
+        config.set_mode("off")
+        config.set_mode("validate", "myapp")
+        config.set_mode("sample", "myapp.api")
+        config.set_mode("off", "myapp.api.hot")
+        self.assertEqual(config.resolve(module).mode, expected)
+
+    def test_set_mode_sampling(self) -> None:
+        policy = SamplingPolicy(5)
+        config.set_mode("sample", "a")
+        config.set_mode("sample", "b", sampling=100)
+        config.set_mode("sample", "c", sampling=policy)
+        self.assertEqual(config.resolve("a").sampling, config.DEFAULT_SAMPLING_INTERVAL)
+        self.assertEqual(config.resolve("b").sampling, 100)
+        self.assertIs(config.resolve("c").sampling, policy)
+
+    def test_set_mode_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            config.set_mode("fast")  # pyright: ignore
+
+    def test_environment_variable(self) -> None:
+        with patch.dict(
+            os.environ, {config.ENV_VAR: "off, myapp=validate,myapp.api=sample:100"}
+        ):
+            self.assertEqual(config.resolve("other"), Rule("off", None))
+            self.assertEqual(config.resolve("myapp.x"), Rule("validate", None))
+            self.assertEqual(config.resolve("myapp.api"), Rule("sample", 100))
+
+            # set_mode takes precedence
+            config.set_mode("off", "myapp.api")
+            self.assertEqual(config.resolve("myapp.api"), Rule("off", None))
+
+    def test_environment_variable_invalid(self) -> None:
+        with patch.dict(os.environ, {config.ENV_VAR: "myapp=fast"}):
+            with self.assertRaises(ValueError):
+                config.resolve("myapp")
+
+    def test_decorators_off(self) -> None:
+        def _func(a: int) -> int:
+            return a
+
+        class Cls:
+            a: int
+
+        config.set_mode("off", __name__)
+        self.assertIs(func.validate(_func), _func)
+        self.assertIs(cls.validate(Cls), Cls)
+        self.assertNotIn("a", vars(Cls))
+        self.assertEqual(_func("a"), "a")  # pyright: ignore
+
+    def test_decorators_sample(self) -> None:
+        config.set_mode("sample", __name__, sampling=2)
+
+        @func.validate
+        def _func(a: int) -> int:
+            return a
+
+        _func("a")  # pyright: ignore
+        with self.assertRaises(TypeError):
+            _func("a")  # pyright: ignore
+
+    def test_decorated(self) -> None:
+        def _func(a: int) -> int:
+            return a
+
+        def _unannotated(a):
+            return a
+
+        func.validate(_func)
+        func.validate(_unannotated)
+        func.validate(_func, sampling=5)
+        self.assertEqual(
+            config.decorated(), {f"{__name__}.{_func.__qualname__}": "sample"}
+        )
+
+        config.set_mode("off", __name__)
+        func.validate(_func)
+        self.assertEqual(
+            config.decorated(), {f"{__name__}.{_func.__qualname__}": "off"}
+        )
@@ -0,0 +1,129 @@
+import unittest
+from typing import Any, Callable
+
+from parameterized import parameterized
+
+from src.pyvalidify import counters
+from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.validator import describe_type, isvalid
+
+
+class TestCounters(unittest.TestCase):
+    def test_count(self) -> None:
+        with counters.count() as outer:
+            Descriptor(int)
+            with counters.count() as inner:
+                Descriptor(int)
+
+        self.assertEqual(inner.descriptors, 1)
+        self.assertEqual(outer.descriptors, 2)
+        self.assertFalse(counters.enabled)
+
+    def test_disabled(self) -> None:
+        before = counters.descriptors
+        Descriptor(list[int])
+        self.assertEqual(counters.descriptors, before)
+
+
+class TestOperationBounds(unittest.TestCase):
+    """Upper bounds on the work done by the engine. Counts are deterministic,
+    hence a change making validation of a value superlinear in its size (or the
+    combinations of a type dependent on the value) fails here regardless of the
+    machine the tests run on."""
+
+    @parameterized.expand(
+        [
+            # type info, value of n elements, value nodes per element,
+            # descriptors per element, combinations (independent of n)
+            (list[int], lambda n: list(range(n)), 1, 1, 4),
+            (
+                list[int | str],
+                lambda n: [i if i % 2 else str(i) for i in range(n)],
+                1,
+                1,
+                12,
+            ),
+            (dict[str, int], lambda n: {str(i): i for i in range(n)}, 2, 2, 6),
+            (list[list[int]], lambda n: [[i] for i in range(n)], 2, 2, 11),
+            (tuple[str, list[int]], lambda n: ("", list(range(n))), 1, 1, 4),
+            (tuple[int, ...], lambda n: tuple(range(n)), 0, 0, 0),
+        ]
+    )
+    def test_isvalid(
+        self,
+        type_info: Any,
+        build: Callable[[int], Any],
+        nodes: int,
+        descriptors: int,
+        combinations: int,
+    ) -> None:
+        for n in (10, 1000):
+            value = build(n)
+            isvalid(value, type_info)  # validator compiled and cached
+
+            with counters.count() as counts:
+                self.assertTrue(isvalid(value, type_info))
+
+            self.assertLessEqual(counts.nodes, nodes * n + 3)
+            self.assertLessEqual(counts.descriptors, descriptors * n + 30)
+            self.assertLessEqual(counts.combinations, combinations)
+
+    @parameterized.expand(
+        [
+            (list[int], [1, 2, 3]),
+            (dict[str, int], {"a": 1}),
+            (list[dict[str, set[int]]], [{"a": {1}}, {"b": {2, 3}}]),
+            (frozenset[str] | None, frozenset({"a"})),
+        ]
+    )
+    def test_isvalid_without_unions_describes_nothing(
+        self, type_info: Any, value: Any
+    ) -> None:
+        isvalid(value, type_info)  # validator compiled and cached
+
+        with counters.count() as counts:
+            self.assertTrue(isvalid(value, type_info))
+            self.assertFalse(isvalid(type(value)(), type_info))
+
+        # matched element by element, the value is not described
+        self.assertEqual(counts.nodes, 0)
+        self.assertEqual(counts.descriptors, 0)
+        self.assertEqual(counts.combinations, 0)
+
+    @parameterized.expand(
+        [
+            (list[int], lambda n: list(range(n))),
+            (list[list[int]], lambda n: [list(range(10))] * (n // 10)),
+            (dict[str, list[int]], lambda n: {str(i): [i] for i in range(n)}),
+        ]
+    )
+    def test_describe_type(self, _: Any, build: Callable[[int], Any]) -> None:
+        with counters.count() as small:
+            describe_type(build(100))
+        with counters.count() as big:
+            describe_type(build(10_000))
+
+        self.assertLessEqual(big.nodes, 101 * small.nodes)
+        self.assertLessEqual(big.descriptors, 101 * small.descriptors)
+
+    @parameterized.expand(
+        [
+            (int, 1, 1),
+            (list[int], 4, 2),
+            (list[int | str | None], 30, 20),
+            (dict[str, list[int | str]], 40, 30),
+            (
+                tuple[int | str, float | None, list[int | str], dict[str, int | bool]],
+                130,
+                120,
+            ),
+        ]
+    )
+    def test_combinations(
+        self, type_info: Any, descriptors: int, combinations: int
+    ) -> None:
+        with counters.count() as counts:
+            Descriptor(type_info).combinations()
+
+        self.assertLessEqual(counts.descriptors, descriptors)
+        self.assertLessEqual(counts.combinations, combinations)
@@ -1,21 +1,35 @@
 import asyncio
-from dataclasses import dataclass, make_dataclass
-from typing import Any, Generator
+import inspect
+from dataclasses import FrozenInstanceError, InitVar, dataclass, field, make_dataclass
+from typing import Any, ClassVar, Generator
 import unittest
+import warnings
 from unittest.mock import patch
+from parameterized import parameterized
 
-from src.pyvalidify.decorators import cls, func
+from src.pyvalidify.decorators import ValidationWarning, _ValidatedField, cls, func
+from src.pyvalidify.sampling import SamplingPolicy, set_default_policy
 
 
 class TestCaseWithMocks(unittest.TestCase):
+    mock_compiled: ClassVar[bool] = True
+    """Whether the validators compiled by the decorators delegate to the mocked
+    `isvalid`."""
+
     @classmethod
     def setUpClass(cls) -> None:
         # start up patchers
         cls.is_valid_patcher = patch("src.pyvalidify.decorators.isvalid")
         cls.describe_type_patcher = patch("src.pyvalidify.decorators.describe_type")
+        cls.compile_validator_patcher = patch(
+            "src.pyvalidify.decorators.compile_validator",
+            lambda type_info: lambda val: cls.is_valid_mock(val, type_info),
+        )
 
         cls.is_valid_mock = cls.is_valid_patcher.start()
         cls.describe_type_mock = cls.describe_type_patcher.start()
+        if cls.mock_compiled:
+            cls.compile_validator_patcher.start()
 
     def setUp(self) -> None:
         self.is_valid_mock.reset_mock()
@@ -33,6 +47,8 @@ class TestCaseWithMocks(unittest.TestCase):
     def tearDownClass(cls) -> None:
         cls.is_valid_patcher.stop()
         cls.describe_type_patcher.stop()
+        if cls.mock_compiled:
+            cls.compile_validator_patcher.stop()
 
 
 class TestDecoratorsFunc(TestCaseWithMocks):
@@ -403,6 +419,34 @@ class TestDecoratorsFunc(TestCaseWithMocks):
         with self.assertRaises(TypeError):
             _func(foo="a", bar=2, baz="c")  # pyright: ignore
 
+    def test_validate_func_scalar_parameters_validated_first(self) -> None:
+
+        @func.validate
+        def _func(foo: list[int], bar: int, *, baz: str) -> None:
+            pass
+
+        self.is_valid_mock.side_effect = lambda val, _: True
+        _func([1, 2], 1, baz="a")
+        self.assertEqual(
+            [call.args[1] for call in self.is_valid_mock.call_args_list],
+            [int, str, list[int]],
+        )
+
+    def test_validate_func_implicit_kwargs_exclude_named_parameters(self) -> None:
+
+        @func.validate
+        def _func(foo: int, **kwargs: str) -> None:
+            pass
+
+        self.is_valid_mock.side_effect = lambda val, _: True
+        _func(foo=1, bar="a")
+        self.is_valid_mock.assert_any_call({"bar": "a"}, dict[str, str])
+
+        # no implicit kwargs given, nothing to validate
+        self.is_valid_mock.reset_mock()
+        _func(1)
+        self.is_valid_mock.assert_called_once_with(1, int)
+
     def test_validate_instance_method(self) -> None:
 
         class Cls:
@@ -614,8 +658,213 @@ class TestDecoratorsFunc(TestCaseWithMocks):
             asyncio.run(_func([1, 2, 3]))  # pyright: ignore
 
 
+class TestDecoratorsShapeCache(TestCaseWithMocks):
+
+    def test_repeated_shape_not_revalidated(self) -> None:
+
+        @func.validate
+        def _func(a: int, b: str | None = None, *, c: bool = False) -> None:
+            pass
+
+        _func(1, "b", c=True)
+        self.assertEqual(self.is_valid_mock.call_count, 3)
+
+        _func(2, "bb", c=False)
+        self.assertEqual(self.is_valid_mock.call_count, 3)
+
+        # different shape
+        _func(2, c=False)
+        self.assertEqual(self.is_valid_mock.call_count, 5)
+
+    def test_repeated_invalid_shape_rejected(self) -> None:
+
+        @func.validate
+        def _func(a: int, b: str) -> None:
+            pass
+
+        for _ in range(3):
+            with self.assertRaisesRegex(TypeError, "`b`"):
+                _func(1, 2)  # pyright: ignore
+
+        self.assertEqual(self.is_valid_mock.call_count, 2)
+
+    def test_containers_always_validated(self) -> None:
+
+        @func.validate
+        def _func(a: int, b: list[int]) -> None:
+            pass
+
+        self.is_valid_mock.side_effect = lambda val, _type: (
+            isinstance(val, int)
+            if _type is int
+            else all(isinstance(v, int) for v in val)
+        )
+
+        _func(1, [1])
+        with self.assertRaises(TypeError):
+            _func(1, ["1"])  # pyright: ignore
+
+        # `a` validated once, `b` on every call
+        self.assertEqual(self.is_valid_mock.call_count, 3)
+
+
+class TestDecoratorsSampling(TestCaseWithMocks):
+
+    def test_func_validate_one_in_every(self) -> None:
+
+        @func.validate(sampling=3)
+        def _func(a: int) -> int:
+            return a
+
+        for _ in range(2):
+            _func("a")  # pyright: ignore
+
+        self.assertEqual(self.is_valid_mock.call_count, 0)
+
+        with self.assertRaises(TypeError):
+            _func("a")  # pyright: ignore
+
+    def test_func_validate_default_policy(self) -> None:
+
+        @func.validate
+        def _func(a: int) -> int:
+            return a
+
+        try:
+            set_default_policy(SamplingPolicy(2))
+            _func("a")  # pyright: ignore
+            with self.assertRaises(TypeError):
+                _func("a")  # pyright: ignore
+        finally:
+            set_default_policy(None)
+
+        with self.assertRaises(TypeError):
+            _func("a")  # pyright: ignore
+
+    def test_func_validate_specialized_records_outcome(self) -> None:
+        policy = SamplingPolicy(adaptive=True)
+
+        @func.validate(specialize=True, sampling=policy)
+        def _func(a: int) -> int:
+            return a
+
+        _func(1)
+        with self.assertRaises(TypeError):
+            _func("a")  # pyright: ignore
+
+        self.assertEqual(policy.validated, 2)
+        self.assertEqual(policy.failures, 1)
+
+    def test_cls_validate_policy_per_method(self) -> None:
+
+        @cls.validate(sampling=2)
+        class Cls:
+            a: int
+
+            def foo(self, a: int) -> None:
+                pass
+
+            def bar(self, a: int) -> None:
+                pass
+
+        inst = Cls()
+        inst.foo(1)
+        inst.bar(1)
+        self.assertEqual(self.is_valid_mock.call_count, 0)
+        inst.foo(1)
+        inst.bar(1)
+        self.assertEqual(self.is_valid_mock.call_count, 2)
+
+        inst.a = "a"  # pyright: ignore
+        with self.assertRaises(TypeError):
+            inst.a = "a"  # pyright: ignore
+
+
+class TestDecoratorsFuncSpecialized(unittest.TestCase):
+    # not using mocks - the specialized wrapper calls compiled validators directly
+
+    def test_signature_preserved(self) -> None:
+        def _func(a: int, /, b: list[str], *args: int, c: bool = False, **kw: str):
+            return a, b, args, c, kw
+
+        wrapper = func.validate(specialize=True)(_func)
+
+        self.assertEqual(inspect.signature(_func), inspect.signature(wrapper))
+        self.assertEqual(_func.__name__, wrapper.__name__)
+        self.assertEqual(
+            wrapper(1, ["b"], 2, 3, c=True, d="d"),
+            (1, ["b"], (2, 3), True, {"d": "d"}),
+        )
+
+    @parameterized.expand(
+        [
+            ("positional_only", ("1", ["b"]), {}),
+            ("positional_or_keyword", (1,), {"b": [2]}),
+            ("implicit_args", (1, ["b"], 2, "3"), {}),
+            ("keyword_only", (1, ["b"]), {"c": 1}),
+            ("implicit_kwargs", (1, ["b"]), {"d": "d", "e": 5}),
+        ]
+    )
+    def test_invalid_arguments(
+        self, _: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        @func.validate(specialize=True)
+        def _func(a: int, /, b: list[str], *args: int, c: bool = False, **kw: str):
+            pass
+
+        with self.assertRaises(TypeError):
+            _func(*args, **kwargs)
+
+    def test_defaults_not_validated(self) -> None:
+        @func.validate(specialize=True)
+        def _func(a: int | None = None, *, b: str = None) -> tuple:  # type: ignore
+            return a, b
+
+        self.assertEqual(_func(), (None, None))
+        self.assertEqual(_func(1, b="b"), (1, "b"))
+
+        with self.assertRaises(TypeError):
+            _func(b=1)  # pyright: ignore
+
+    def test_default_passed_explicitly_validated(self) -> None:
+        def _func(a: int = None) -> Any:  # type: ignore
+            return a
+
+        generic = func.validate(_func)
+        specialized = func.validate(specialize=True)(_func)
+
+        self.assertIsNone(generic())
+        self.assertIsNone(specialized())
+        for wrapper in [generic, specialized]:
+            with self.assertRaises(TypeError):
+                wrapper(None)
+        self.assertEqual(inspect.signature(specialized), inspect.signature(_func))
+
+    def test_unannotated_and_self_skipped(self) -> None:
+        class Cls:
+            @func.validate(specialize=True)
+            def method(self, a, b: int) -> tuple:
+                return a, b
+
+        self.assertEqual(Cls().method("a", 1), ("a", 1))
+
+        with self.assertRaises(TypeError):
+            Cls().method("a", "b")
+
+
 class TestDecoratorsCls(TestCaseWithMocks):
 
+    def test_setattr_validate_error_describes_value(self) -> None:
+        class Cls:
+            pass
+
+        Cls.__setattr__ = cls.setattr_validate(  # type: ignore
+            object.__setattr__, annotations={"a": int}
+        )
+
+        with self.assertRaisesRegex(TypeError, "got `<class 'str'>`"):
+            Cls().a = "s"
+
     def test_validate_child_class_with_owned_and_inherited_instance_method(self):
         class Parent:
             "Parent"
@@ -794,3 +1043,400 @@ class TestDecoratorsCls(TestCaseWithMocks):
 
         with self.assertRaises(TypeError):
             Child(5, "5")  # pyright: ignore
+
+
+class TestDecoratorsClsDataclass(TestCaseWithMocks):
+    # fields are validated by the real compiled validators
+    mock_compiled = False
+
+    def test_fields_validated_once(self) -> None:
+        @cls.validate
+        @dataclass
+        class Cls:
+            a: int
+            b: list[str]
+
+        inst = Cls(1, ["b"])
+        self.assertEqual((inst.a, inst.b), (1, ["b"]))
+        # validated by __init__, not by the (mocked) __setattr__ hook
+        self.assertEqual(self.is_valid_mock.call_count, 0)
+
+        with self.assertRaises(TypeError):
+            Cls(1, [2])  # pyright: ignore
+
+        # assignments outside of __init__ are still validated
+        with self.assertRaises(TypeError):
+            inst.a = "a"  # pyright: ignore
+
+    def test_defaults_factories_and_kw_only(self) -> None:
+        @cls.validate
+        @dataclass
+        class Cls:
+            a: int
+            b: str = "b"
+            c: list[int] = field(default_factory=lambda: [0])
+            d: int = field(default=0, init=False)
+            e: bool = field(default=False, kw_only=True)
+
+        inst = Cls(1)
+        self.assertEqual(
+            (inst.a, inst.b, inst.c, inst.d, inst.e), (1, "b", [0], 0, False)
+        )
+        self.assertIsNot(inst.c, Cls(1).c)
+        self.assertEqual(Cls(1, "x", [2], e=True).c, [2])
+        self.assertEqual(inspect.signature(Cls).parameters.keys(), {"a", "b", "c", "e"})
+
+        with self.assertRaises(TypeError):
+            Cls(1, "x", [2], True)  # pyright: ignore
+
+        with self.assertRaises(TypeError):
+            Cls(1, e=1)  # pyright: ignore
+
+        with self.assertRaises(TypeError):
+            Cls(1, c=["1"])  # pyright: ignore
+
+    def test_init_var_and_post_init(self) -> None:
+        @cls.validate
+        @dataclass
+        class Cls:
+            a: int
+            b: InitVar[int]
+            c: ClassVar[str] = "c"
+
+            def __post_init__(self, b: int) -> None:
+                object.__setattr__(self, "total", self.a + b)
+
+        self.assertEqual(Cls(1, 2).total, 3)  # type: ignore
+
+        with self.assertRaises(TypeError):
+            Cls(1, "2")  # pyright: ignore
+
+    def test_frozen(self) -> None:
+        @cls.validate
+        @dataclass(frozen=True)
+        class Cls:
+            a: int
+
+        self.assertEqual(Cls(1).a, 1)
+
+        with self.assertRaises(TypeError):
+            Cls("1")  # pyright: ignore
+
+        with self.assertRaises(FrozenInstanceError):
+            Cls(1).a = 2  # pyright: ignore
+
+        # the dataclass raises before anything is validated
+        with self.assertRaises(FrozenInstanceError):
+            Cls(1).a = "s"  # pyright: ignore
+
+    def test_user_defined_init_kept(self) -> None:
+        @cls.validate
+        @dataclass
+        class Cls:
+            a: int
+
+            def __init__(self, a: int) -> None:
+                self.a = a * 2
+
+        self.assertEqual(Cls(1).a, 2)
+
+        with self.assertRaises(TypeError):
+            Cls("1")  # pyright: ignore
+
+    def test_user_defined_init_from_exec_kept(self) -> None:
+        namespace: dict[str, Any] = {}
+        exec("def __init__(self, a):\n    self.a = a * 2\n", namespace)
+
+        @cls.validate
+        @dataclass
+        class Cls:
+            a: int
+            __init__ = namespace["__init__"]
+
+        self.assertEqual(Cls(1).a, 2)
+
+    def test_excluded_init_not_generated(self) -> None:
+        @dataclass
+        class Cls:
+            a: int
+
+        init = Cls.__init__
+        cls.validate(exclude=["__init__"])(Cls)
+
+        self.assertIs(Cls.__init__, init)
+        # the fields are still validated on assignment
+        with self.assertRaises(TypeError):
+            Cls("1")  # pyright: ignore
+
+
+class TestDecoratorsClsFields(TestCaseWithMocks):
+    # fields are validated by the real compiled validators
+    mock_compiled = False
+
+    def test_annotated_attributes_replaced_with_descriptors(self) -> None:
+        @cls.validate
+        class Cls:
+            a: int
+            b: str = "b"
+
+        self.assertIsInstance(vars(Cls)["a"], _ValidatedField)
+        self.assertEqual(Cls.b, "b")
+        self.assertEqual(Cls().b, "b")
+        self.assertNotIn("__setattr__", vars(Cls))
+
+        inst = Cls()
+        inst.a = 1
+        inst.c = "c"  # pyright: ignore
+        self.assertEqual(vars(inst), {"a": 1, "c": "c"})
+
+        with self.assertRaises(AttributeError):
+            Cls().a
+
+        with self.assertRaisesRegex(TypeError, "Property `a`"):
+            inst.a = "a"  # pyright: ignore
+
+        del inst.a
+        with self.assertRaises(AttributeError):
+            inst.a
+
+    def test_slots(self) -> None:
+        @cls.validate
+        class Cls:
+            __slots__ = ("a", "b")
+            a: int
+            b: list[int]
+
+        inst = Cls()
+        inst.a, inst.b = 1, [1]
+        self.assertEqual((inst.a, inst.b), (1, [1]))
+        self.assertFalse(hasattr(inst, "__dict__"))
+
+        with self.assertRaises(TypeError):
+            inst.b = ["1"]  # pyright: ignore
+
+    def test_dataclass_with_slots(self) -> None:
+        @cls.validate
+        @dataclass(slots=True)
+        class Cls:
+            a: int
+            b: str = "b"
+
+        self.assertEqual((Cls(1).a, Cls(1).b), (1, "b"))
+
+        with self.assertRaises(TypeError):
+            Cls("1")  # pyright: ignore
+
+        with self.assertRaises(TypeError):
+            Cls(1).b = 2  # pyright: ignore
+
+    def test_validated_before_dataclass(self) -> None:
+        @dataclass
+        @cls.validate
+        class Cls:
+            a: int
+            b: str = "b"
+            c: list[int] = field(default_factory=lambda: [0])
+
+        # fields with `field()` defaults are removed by the dataclass, hence
+        # validated by __setattr__ (with mocked `isvalid`)
+        self.assertNotIn("c", vars(Cls))
+        self.is_valid_mock.side_effect = lambda val, _: all(
+            isinstance(v, int) for v in val
+        )
+
+        self.assertEqual((Cls(1).a, Cls(1).b, Cls(1).c), (1, "b", [0]))
+
+        for args in [("1",), (1, 2), (1, "b", ["1"])]:
+            with self.assertRaises(TypeError):
+                Cls(*args)  # pyright: ignore
+
+    def test_property_setter(self) -> None:
+        @cls.validate
+        class Cls:
+            a: int
+
+            @property
+            def a(self) -> int:
+                return self._a
+
+            @a.setter
+            def a(self, val: int) -> None:
+                self._a = val
+
+        inst = Cls()
+        inst.a = 1
+        self.assertEqual(inst.a, 1)
+        self.assertEqual(inst._a, 1)
+
+        with self.assertRaises(TypeError):
+            inst.a = "1"  # pyright: ignore
+
+    def test_inherited_fields(self) -> None:
+        @cls.validate
+        class Parent:
+            a: int = 0
+
+        @cls.validate
+        class Child(Parent):
+            b: str
+
+        inst = Child()
+        inst.a, inst.b = 1, "b"
+        self.assertEqual((Child().a, inst.a, inst.b), (0, 1, "b"))
+
+        with self.assertRaises(TypeError):
+            inst.a = "a"  # pyright: ignore
+
+
+class TestDecoratorsClsSelectiveWrapping(TestCaseWithMocks):
+
+    def test_unannotated_methods_and_hot_dunders_not_wrapped(self) -> None:
+        class Parent:
+            def parent_meth(self, a):
+                return a
+
+        @cls.validate
+        class Cls(Parent):
+            def __eq__(self, other: "Cls") -> bool:
+                return True
+
+            def __hash__(self) -> int:
+                return 0
+
+            def meth(self, a):
+                return a
+
+        self.assertFalse(hasattr(Cls.__eq__, "__wrapped__"))
+        self.assertFalse(hasattr(Cls.__hash__, "__wrapped__"))
+        self.assertFalse(hasattr(Cls.meth, "__wrapped__"))
+        self.assertNotIn("parent_meth", vars(Cls))
+
+        self.assertEqual(Cls(), 1)
+        self.assertEqual(len({Cls(), Cls()}), 1)
+
+    @parameterized.expand(
+        [
+            ("include", {"include": ["add_*"]}, {"add_item"}),
+            ("exclude", {"exclude": ["add_*"]}, {"remove_item"}),
+            (
+                "include_and_exclude",
+                {"include": ["*_item", "__eq__"], "exclude": ["remove_*"]},
+                {"add_item", "__eq__"},
+            ),
+        ]
+    )
+    def test_include_and_exclude(
+        self, _: str, patterns: dict[str, list[str]], expected: set[str]
+    ) -> None:
+        @cls.validate(**patterns)
+        class Cls:
+            def add_item(self, a: int) -> None: ...
+
+            def remove_item(self, a: int) -> None: ...
+
+            def __eq__(self, other: int) -> bool:
+                return True
+
+        self.assertEqual(
+            {
+                name
+                for name in ["add_item", "remove_item", "__eq__"]
+                if hasattr(vars(Cls)[name], "__wrapped__")
+            },
+            expected,
+        )
+
+
+class TestDecoratorsDoubleWrapping(TestCaseWithMocks):
+
+    def test_func_validate_not_nested(self) -> None:
+        def _func(a: int) -> int:
+            return a
+
+        wrapper = func.validate(_func)
+        self.assertIs(func.validate(wrapper), wrapper)
+        self.assertIs(wrapper.__wrapped__, _func)  # type: ignore
+
+        # different options wrap the original function
+        specialized = func.validate(wrapper, specialize=True)
+        self.assertIsNot(specialized, wrapper)
+        self.assertIs(specialized.__wrapped__, _func)  # type: ignore
+
+    def test_decorated_hierarchy_validates_once(self) -> None:
+        @cls.validate
+        class Parent:
+            def meth(self, a: int, b: list[int]) -> None:
+                pass
+
+        @cls.validate
+        class Child(Parent):
+            pass
+
+        @cls.validate
+        class GrandChild(Child):
+            pass
+
+        self.assertIs(GrandChild.meth, Parent.meth)
+        self.is_valid_mock.side_effect = lambda val, _: True
+
+        GrandChild().meth(1, [1])
+        self.assertEqual(self.is_valid_mock.call_count, 2)
+
+    def test_setattr_not_nested(self) -> None:
+        @dataclass
+        @cls.validate
+        class Parent:
+            a: list[int] = field(default_factory=lambda: [0])
+
+        @dataclass
+        @cls.validate
+        class Child(Parent):
+            b: list[int] = field(default_factory=lambda: [0])
+
+        self.assertIs(Child.__setattr__.__wrapped__, object.__setattr__)  # type: ignore
+
+
+class TestDecoratorsAnalysis(TestCaseWithMocks):
+
+    def test_analyze(self) -> None:
+        def _func(a: int, b: list[int | str], *args: str, c: Generator) -> None: ...
+
+        self.assertEqual(func.analyze(_func), {"a": 1, "b": 5, "args": 2, "c": None})
+        with self.assertWarns(ValidationWarning):
+            wrapper = func.validate(_func)
+        self.assertEqual(func.analyze(wrapper), func.analyze(_func))
+
+    def test_unsupported_annotation(self) -> None:
+        def _func(a: int, b: Generator) -> None: ...
+
+        with self.assertWarnsRegex(ValidationWarning, "unsupported type"):
+            func.validate(_func)
+
+        with self.assertRaisesRegex(TypeError, "unsupported type"):
+            func.validate(_func, strict=True)
+
+    def test_max_cost(self) -> None:
+        def _func(a: int, b: list[dict[str | bytes, int | float]]) -> None: ...
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            func.validate(_func, max_cost=100)
+
+        with self.assertWarnsRegex(ValidationWarning, "`b`|\\(b\\)"):
+            func.validate(_func, max_cost=5)
+
+        with self.assertRaises(TypeError):
+            func.validate(_func, max_cost=5, strict=True)
+
+    def test_cls_validate_fields_and_methods(self) -> None:
+        with self.assertRaisesRegex(TypeError, "Cls.a"):
+
+            @cls.validate(max_cost=1, strict=True)
+            class Cls:
+                a: list[int]
+
+        with self.assertRaisesRegex(TypeError, "meth"):
+
+            @cls.validate(max_cost=1, strict=True)
+            class Cls:
+                def meth(self, a: list[int]) -> None: ...
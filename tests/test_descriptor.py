@@ -3,7 +3,7 @@ from typing import Literal, cast
 import unittest
 
 from parameterized import parameterized
-from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.descriptor import _UNRENDERED, Descriptor
 from src.pyvalidify.type_hints import (
     SingleTypeInfo,
     SupportedBaseType,
@@ -650,6 +650,30 @@ class TestDescriptor(unittest.TestCase):
             Descriptor(raw_type).depth,
         )
 
+    @parameterized.expand(
+        [
+            (str, False, {str}, False),
+            (list[str], False, {str}, False),
+            (list[str | int], True, {str, int}, False),
+            (list[str] | list[int], True, {str, int}, False),
+            (tuple[str, ...], False, {str}, False),
+            (tuple[str, list[int]], False, {str, int}, True),
+            (tuple, False, {tuple}, False),
+            (dict[str, list[int] | None], True, {str, int, None}, False),
+        ]
+    )
+    def test_structural_metadata(
+        self,
+        raw_type: SingleTypeInfo | WithUnion,
+        has_nested_union: bool,
+        leaf_types: set[SupportedBaseType],
+        is_fixed_tuple: bool,
+    ) -> None:
+        td = Descriptor(raw_type)
+        self.assertEqual(has_nested_union, td.has_nested_union)
+        self.assertEqual(leaf_types, td.leaf_types)
+        self.assertEqual(is_fixed_tuple, td.is_fixed_tuple)
+
     @parameterized.expand(
         [
             (str, str, ()),
@@ -1156,3 +1180,138 @@ class TestDescriptor(unittest.TestCase):
             set(actual),
             {"given": given, "actual": actual, "expected": expected},
         )
+
+    @parameterized.expand(
+        [
+            ({"base": str}, str),
+            ({"base": list, "args": (Descriptor(str),)}, list[str]),
+            (
+                {"base": None, "args": (Descriptor(str), Descriptor(int))},
+                str | int,
+            ),
+            (
+                {"base": tuple, "args": (Descriptor(str), Descriptor(int | None))},
+                tuple[str, int | None],
+            ),
+            (
+                {"base": tuple, "args": (Descriptor(str),), "_length": "undefined"},
+                tuple[str, ...],
+            ),
+            # duplicates removed from unions
+            (
+                {"base": None, "args": (Descriptor(str), Descriptor(str))},
+                str,
+            ),
+        ]
+    )
+    def test__trusted(self, kwargs: dict, _type: TypeInfo) -> None:
+        td = Descriptor._trusted(**kwargs)
+        self.assertEqual(Descriptor(_type), td)
+        self.assertEqual(Descriptor(_type).length, td.length)
+        self.assertEqual(_type, td.raw)
+
+    def test_raw_and_str_are_rendered_on_first_access(self) -> None:
+        combinations = Descriptor(
+            list[int | str] | tuple[int | str, int]
+        ).combinations()
+        self.assertTrue(all(td._raw is _UNRENDERED for td in combinations))
+        self.assertTrue(all(td._str is _UNRENDERED for td in combinations))
+
+        td = combinations[combinations.index(Descriptor(tuple[str, int]))]
+        self.assertEqual(tuple[str, int], td.raw)
+        self.assertEqual("Descriptor( tuple[str, int] )", repr(td))
+
+    def test_raw_of_union_reduced_to_single_argument(self) -> None:
+        td = Descriptor(args=(Descriptor(list[int]), Descriptor(list[int])))
+        self.assertEqual(list[int], td.raw)
+        self.assertEqual("Descriptor( list[int] )", repr(td))
+
+    @parameterized.expand(
+        [
+            (int,),
+            (list[int],),
+            (list[int | str | None],),
+            (list[list[int | str]],),
+            (dict[str, list[int | str]],),
+            (set[frozenset[int | str]],),
+            (tuple[int, str | None, list[float]],),
+            (list[tuple[int | str, int]],),
+            (dict[int | str, int | str] | None,),
+        ]
+    )
+    def test_sample_value(self, _type: TypeInfo) -> None:
+        from src.pyvalidify.validator import isvalid
+
+        td = Descriptor(_type)
+        for seed in range(20):
+            self.assertTrue(isvalid(td.sample_value(seed=seed), _type))
+            self.assertTrue(isvalid(td.sample_value(5, seed=seed, inner_size=1), _type))
+            self.assertFalse(isvalid(td.sample_value(seed=seed, valid=False), _type))
+            self.assertFalse(
+                isvalid(
+                    td.sample_value(seed=seed, valid=False, mismatch_depth=0), _type
+                )
+            )
+
+    def test_sample_value_reproducible_with_seed(self) -> None:
+        td = Descriptor(list[dict[str, int | float | None]])
+        self.assertEqual(td.sample_value(10, seed=3), td.sample_value(10, seed=3))
+
+    def test_sample_value_sizes(self) -> None:
+        val = Descriptor(dict[str, set[int]]).sample_value(100, inner_size=7)
+        self.assertEqual(100, len(val))
+        self.assertTrue(all(len(v) == 7 for v in val.values()))
+        self.assertEqual(3, len(Descriptor(tuple[int, int, int]).sample_value(100)))
+
+    def test_sample_value_weights(self) -> None:
+        val = Descriptor(list[int | str | None]).sample_value(
+            1000, seed=0, weights={str: 0, None: 1, int: 9}
+        )
+        self.assertNotIn(str, map(type, val))
+        self.assertGreater(val.count(None), 50)
+        self.assertGreater(sum(type(v) is int for v in val), 700)
+
+    @parameterized.expand(
+        [
+            (list[list[int]], {"mismatch_at": 0}, [[2, 3, "s4"], [5, 6, 7]]),
+            (list[list[int]], {"mismatch_depth": 0}, [[2, 3, 4], "s5"]),
+            (list[int | str], {"mismatch_at": 0}, [2.5, 3]),
+            (tuple[int, str], {"mismatch_at": 0}, ("s2", "s3")),
+        ]
+    )
+    def test_sample_value_mismatch(
+        self, _type: TypeInfo, kwargs: dict, expected: object
+    ) -> None:
+        val = Descriptor(_type).sample_value(
+            2, seed=0, weights={str: 0}, valid=False, **kwargs
+        )
+        self.assertEqual(expected, val)
+
+    def test_sample_elements_streams(self) -> None:
+        elements = Descriptor(list[dict[str, int]]).sample_elements(10**12)
+        self.assertEqual(
+            [{"s2": 3, "s4": 5, "s6": 7}, {"s8": 9, "s10": 11, "s12": 13}],
+            [next(elements), next(elements)],
+        )
+        self.assertEqual(
+            [("s2", 3), ("s4", 5)],
+            list(Descriptor(dict[str, int]).sample_elements(2)),
+        )
+
+    @parameterized.expand(
+        [
+            ({"size": 0}, ValueError),
+            ({"inner_size": 0}, ValueError),
+            ({"valid": False, "mismatch_at": 3}, ValueError),
+        ]
+    )
+    def test_sample_value_raises(self, kwargs: dict, exc: type[Exception]) -> None:
+        with self.assertRaises(exc):
+            Descriptor(list[int]).sample_value(**kwargs)
+        with self.assertRaises(exc):
+            Descriptor(list[int]).sample_elements(**kwargs)
+
+    @parameterized.expand([(int,), (int | list[int],)])
+    def test_sample_elements_of_non_collection(self, _type: TypeInfo) -> None:
+        with self.assertRaises(TypeError):
+            Descriptor(_type).sample_elements()
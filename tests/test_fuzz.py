@@ -0,0 +1,93 @@
+import unittest
+from random import Random
+from typing import Any
+
+from parameterized import parameterized
+
+from fuzz.engines import ENGINES, baseline, reference
+from fuzz.generators import Case, conforming, random_case, random_supported_type
+from fuzz.harness import Disagreement, compare, explained, outcome, run, shrink
+from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.validator import isvalid
+
+
+def _mixed_lists_inverted(val: Any, type_info: Any) -> bool:
+    """Engine getting lists of mixed items wrong."""
+    if type(val) is list and len(set(map(type, val))) > 1:
+        return not isvalid(val, type_info)
+    return isvalid(val, type_info)
+
+
+class TestFuzz(unittest.TestCase):
+    def test_engines_agree(self) -> None:
+        disagreements = run(ENGINES, seed=13, iterations=300)
+        self.assertEqual(disagreements, [], "\n".join(map(str, disagreements)))
+
+    def test_generated_types_supported(self) -> None:
+        rng = Random(0)
+        for _ in range(100):
+            Descriptor(random_supported_type(rng))
+
+    def test_conforming_values_mostly_valid(self) -> None:
+        rng = Random(0)
+        types = [random_supported_type(rng, 2) for _ in range(100)]
+        valid = [reference(conforming(rng, t), t) for t in types]
+        self.assertGreater(sum(valid), 80)
+
+    def test_random_case_reproducible(self) -> None:
+        self.assertEqual(
+            repr([random_case(Random(5)) for _ in range(20)]),
+            repr([random_case(Random(5)) for _ in range(20)]),
+        )
+
+    @parameterized.expand(
+        [
+            ([(1, 2, 3)], list[tuple[int]], False),
+            ({"a": (1, 2)}, dict[str, tuple[int]], False),
+            ([()], list[tuple[int, ...]], True),
+            ([object()], list[int], False),
+            ({}, dict[str, int], False),
+            ([True], list[int], False),
+            ([[1, "a"], ["b"]], list[list[int | str]], True),
+        ]
+    )
+    def test_reference(self, val: Any, type_info: Any, valid: bool) -> None:
+        self.assertEqual(reference(val, type_info), valid)
+
+    def test_known_issue_explained(self) -> None:
+        case = Case(list[list[int | str]], [[1, "a"], ["b"]], True)
+        self.assertEqual(outcome(baseline, case.value, case.type_info), "False")
+        self.assertEqual(compare(case, {"isvalid": isvalid}), [])
+
+        # the same rejection at the top level is not the known issue
+        self.assertFalse(
+            explained(Disagreement("e", list[int | str], [1, "a"], "True", "False"))
+        )
+
+    def test_outcome(self) -> None:
+        self.assertEqual(outcome(isvalid, 1, int), "True")
+        self.assertEqual(outcome(isvalid, 1, str), "False")
+        self.assertEqual(outcome(isvalid, 1, object), "TypeError")
+
+    def test_shrink(self) -> None:
+        disagreement = Disagreement(
+            "inverted",
+            dict[str, list[int | str]],
+            {"a": [1, "a", 2, "b"], "b": [3]},
+            "True",
+            "False",
+        )
+        shrunk = shrink(disagreement, _mixed_lists_inverted)
+
+        # the smallest mixed list, whatever the (smallest) type
+        self.assertNotEqual(shrunk.expected, shrunk.actual)
+        self.assertIsInstance(shrunk.type_info, type)
+        self.assertEqual(type(shrunk.value), list)
+        self.assertEqual(len(shrunk.value), 2)
+
+    def test_run_finds_disagreements(self) -> None:
+        disagreements = run({"inverted": _mixed_lists_inverted}, seed=0, iterations=100)
+
+        self.assertNotEqual(disagreements, [])
+        for disagreement in disagreements:
+            self.assertEqual(len(disagreement.value), 2)
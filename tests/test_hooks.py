@@ -0,0 +1,174 @@
+import unittest
+import warnings
+from typing import Any, Optional
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from src.pyvalidify import hooks
+from src.pyvalidify.decorators import cls, func
+from src.pyvalidify.descriptor import Descriptor
+from src.pyvalidify.hooks import Event
+from src.pyvalidify.validator import describe_type, isvalid
+
+
+class TestHooks(unittest.TestCase):
+    def setUp(self) -> None:
+        self.started: list[Event] = []
+        self.ended: list[tuple[Event, float, Optional[bool]]] = []
+
+        def on_end(event: Event, duration: float, valid: Optional[bool]) -> None:
+            self.ended.append((event, duration, valid))
+
+        self.remove = hooks.add(self.started.append, on_end)
+
+    def tearDown(self) -> None:
+        hooks.clear()
+
+    def sources(self) -> list[str]:
+        return [event.source for event in self.started]
+
+    def test_add_and_remove(self) -> None:
+        self.assertTrue(hooks.enabled)
+        remove = hooks.add(on_end=lambda *_: None)
+        self.remove()
+        self.assertTrue(hooks.enabled)
+        remove()
+        self.assertFalse(hooks.enabled)
+
+        isvalid(1, int)
+        self.assertEqual(self.started, [])
+        self.assertEqual(self.ended, [])
+
+    @parameterized.expand(
+        [
+            ([1, 2], list[int], True),
+            ([1, "2"], list[int], False),
+        ]
+    )
+    def test_isvalid(self, val: Any, type_info: Any, expected: bool) -> None:
+        self.assertEqual(isvalid(val, type_info), expected)
+
+        event = self.started[0]
+        self.assertEqual(event, Event("isvalid", type_info, None, 2))
+        self.assertIs(self.ended[-1][0], event)
+        self.assertGreaterEqual(self.ended[-1][1], 0.0)
+        self.assertEqual(self.ended[-1][2], expected)
+
+    def test_describe_type_not_nested(self) -> None:
+        describe_type([[1], [2, 3]])
+
+        self.assertEqual(self.sources(), ["describe_type"])
+        self.assertEqual(self.started[0].size, 2)
+        self.assertIsNone(self.ended[0][2])
+
+    def test_combinations_not_nested(self) -> None:
+        d = Descriptor(list[tuple[int | str, list[int | float]]])
+        d.combinations()
+
+        self.assertEqual(self.sources(), ["combinations"])
+        self.assertIs(self.started[0].type_info, d)
+
+    def test_isvalid_raising(self) -> None:
+        with self.assertRaises(TypeError):
+            isvalid(1, object)
+
+        self.assertEqual(self.sources(), ["isvalid"])
+        self.assertIs(self.ended[0][0], self.started[0])
+        self.assertIsNone(self.ended[0][2])
+
+    def test_combinations_raising(self) -> None:
+        d = Descriptor(list[int | str])
+        with patch.object(Descriptor, "_combinations", side_effect=RecursionError):
+            with self.assertRaises(RecursionError):
+                d.combinations()
+
+        self.assertEqual(self.sources(), ["combinations"])
+        self.assertEqual(len(self.ended), 1)
+
+    @parameterized.expand([(False,), (True,)])
+    def test_func_validate_raising(self, specialize: bool) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            @func.validate(specialize=specialize)
+            def foo(a: object) -> None:
+                pass
+
+        with self.assertRaises(TypeError):
+            foo(1)
+
+        events = [
+            (event, valid)
+            for event, _, valid in self.ended
+            if event.source == "func.validate"
+        ]
+        self.assertEqual(events, [(self.started[0], None)])
+
+    def test_cls_validate_raising(self) -> None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+
+            @cls.validate
+            class Foo:
+                a: object
+
+        with self.assertRaises(TypeError):
+            Foo().a = 1
+
+        self.assertEqual(
+            [valid for event, _, valid in self.ended if event.source == "cls.validate"],
+            [None],
+        )
+        self.assertEqual(len(self.started), len(self.ended))
+
+    @parameterized.expand([(False,), (True,)])
+    def test_func_validate(self, specialize: bool) -> None:
+        @func.validate(specialize=specialize)
+        def foo(a: int, b: list[int]) -> None:
+            pass
+
+        foo(1, [1, 2, 3])
+        self.started.clear()
+        self.ended.clear()
+
+        foo(1, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            foo(1, [1, "2"])
+
+        wrapper_events = [
+            (event, valid)
+            for event, _, valid in self.ended
+            if event.source == "func.validate"
+        ]
+        self.assertEqual([valid for _, valid in wrapper_events], [True, False])
+        event = wrapper_events[0][0]
+        self.assertEqual(event.type_info, {"a": int, "b": list[int]})
+        self.assertEqual(event.name, f"{__name__}.{foo.__qualname__}")
+        self.assertEqual(event.size, 3)
+
+    def test_cls_validate(self) -> None:
+        @cls.validate
+        class Foo:
+            a: list[int]
+
+            def __init__(self, a: list[int]) -> None:
+                self.a = a
+
+        self.started.clear()
+        self.ended.clear()
+
+        foo = Foo([1, 2])
+        with self.assertRaises(TypeError):
+            foo.a = ["1"]  # type: ignore
+
+        events = [
+            (event, valid)
+            for event, _, valid in self.ended
+            if event.source == "cls.validate"
+        ]
+        self.assertEqual([valid for _, valid in events], [True, False])
+        self.assertEqual(
+            events[0][0],
+            Event("cls.validate", list[int], f"{__name__}.{Foo.__qualname__}.a", 2),
+        )
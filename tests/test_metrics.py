@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from src.pyvalidify import metrics
+from src.pyvalidify.decorators import cls, func
+from src.pyvalidify.metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def test_passed_and_failed(self) -> None:
+        m = Metrics("foo")
+        m.calls += 3
+        m.passed(0.0, 10)
+        m.passed(0.0, 5)
+        m.failed(0.0)
+
+        self.assertEqual(m.calls, 3)
+        self.assertEqual(m.validated, 3)
+        self.assertEqual(m.failures, 1)
+        self.assertEqual(m.max_size, 10)
+        self.assertGreater(m.total_time, m.max_time)
+        self.assertAlmostEqual(m.to_dict()["failure_rate"], 1 / 3)
+
+        m.reset()
+        self.assertEqual(m.to_dict()["calls"], 0)
+        self.assertEqual(m.to_dict()["failure_rate"], 0.0)
+
+    def test_register(self) -> None:
+        self.assertIs(
+            metrics.register("test_register"), metrics.register("test_register")
+        )
+        self.assertIs(metrics.get("test_register"), metrics.register("test_register"))
+        self.assertIsNone(metrics.get("test_register_missing"))
+
+    def test_to_prometheus(self) -> None:
+        m = metrics.register('test_to_prometheus."quoted"')
+        m.calls = 7
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE pyvalidify_calls_total counter\n", text)
+        self.assertIn("# TYPE pyvalidify_validation_seconds_max gauge\n", text)
+        self.assertIn(
+            'pyvalidify_calls_total{function="test_to_prometheus.\\"quoted\\""} 7\n',
+            text,
+        )
+        self.assertTrue(text.endswith("\n"))
+
+    def test_write_prometheus(self) -> None:
+        metrics.register("test_write_prometheus")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pyvalidify.prom")
+            metrics.write_prometheus(path, prefix="app")
+            with open(path) as f:
+                self.assertEqual(f.read(), metrics.to_prometheus(prefix="app"))
+
+
+class TestDecoratorsMetrics(unittest.TestCase):
+    def test_func_validate(self) -> None:
+        @func.validate
+        def _func(a: int, b: list[int]) -> None: ...
+
+        for _ in range(3):
+            _func(1, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            _func(1, ["1"])  # pyright: ignore
+
+        m = metrics.get(f"{__name__}.{_func.__qualname__}")
+        self.assertEqual(
+            {k: v for k, v in m.to_dict().items() if "time" not in k},  # type: ignore
+            {
+                "calls": 4,
+                "validated": 4,
+                "failures": 1,
+                "failure_rate": 0.25,
+                "max_size": 3,
+            },
+        )
+        self.assertGreater(m.total_time, 0.0)  # type: ignore
+
+    def test_func_validate_specialized(self) -> None:
+        @func.validate(specialize=True, sampling=2)
+        def _func(a: int, b: list[int]) -> None: ...
+
+        for _ in range(4):
+            _func(1, [1, 2])
+
+        m = metrics.get(f"{__name__}.{_func.__qualname__}")
+        self.assertEqual((m.calls, m.validated, m.max_size), (4, 2, 2))  # type: ignore
+
+    def test_cls_validate(self) -> None:
+        @cls.validate
+        class Cls:
+            a: list[int]
+
+        inst = Cls()
+        inst.a = [1]
+        with self.assertRaises(TypeError):
+            inst.a = ["1"]  # pyright: ignore
+
+        m = metrics.get(f"{__name__}.{Cls.__qualname__}")
+        self.assertEqual((m.calls, m.validated, m.failures), (2, 2, 1))  # type: ignore
@@ -0,0 +1,168 @@
+import unittest
+from typing import Any
+
+from parameterized import parameterized
+
+from src.pyvalidify import explain
+from src.pyvalidify.planning import Plan
+from src.pyvalidify.type_hints import TypeInfo
+
+
+class TestExplain(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (int, ["int - type check"]),
+            (int | None, ["int | None - type looked up in a set"]),
+            (
+                tuple[int, list[str]],
+                [
+                    "tuple[int, list[str]] - length, then position by position",
+                    "  int - type check",
+                    "  list[str] - each element (no unions)",
+                    "    str - type check",
+                ],
+            ),
+            (
+                list[tuple[int | str, ...]],
+                [
+                    "list[tuple[int | str, ...]] - each element (holds tuples)",
+                    "  tuple[int | str, ...] - each element",
+                    "    int | str - type looked up in a set",
+                ],
+            ),
+            (
+                list[list[int | str]],
+                [
+                    "list[list[int | str]] - value described, matched by 3 "
+                    "combinations",
+                    "  list[int | str]",
+                    "    int | str",
+                    "      int",
+                    "      str",
+                ],
+            ),
+            (
+                tuple[str, ...] | list[int],
+                [
+                    "tuple[str, ...] | list[int] - any of the members, in order",
+                    "  tuple[str, ...] - each element",
+                    "    str - type check",
+                    "  list[int] - each element (no unions)",
+                    "    int - type check",
+                ],
+            ),
+        ]
+    )
+    def test_tree(self, _type: TypeInfo, tree: list[str]) -> None:
+        self.assertEqual(explain(_type).tree, tree)
+
+    @parameterized.expand(
+        [
+            (list[int | None], 1, 2),
+            (list[int | str], 1, 2),
+            (list[list[int | str]], 2, 3),
+            (dict[str, int | None], 2, 3),
+            (dict[str, list[int | str]], 3, 4),
+            (list[set[int | str]], 2, 3),
+        ]
+    )
+    def test_work(self, _type: TypeInfo, nodes: int, variants: Any) -> None:
+        (work,) = explain(_type).work
+        self.assertEqual(work.nodes, nodes)
+        self.assertEqual(work.variants, variants)
+
+    def test_many_variants_explained(self) -> None:
+        plan = explain(list[list[int | str | float | bytes | None]])
+
+        self.assertEqual(plan.work[0].variants, 31)
+        self.assertIn("distinct types", plan.notes[0])
+        self.assertEqual(explain(list[int | str]).notes, plan.notes[-1:])
+
+    def test_collections_of_tuples(self) -> None:
+        plan = explain(list[tuple[int | str, ...]])
+
+        self.assertEqual(plan.work, [])
+        self.assertEqual(plan.combinations, 0)
+        self.assertIn("holds tuples", plan.fast_paths[0])
+
+    def test_fast_paths(self) -> None:
+        plan = explain(tuple[int, str | None])
+        self.assertEqual(
+            plan.fast_paths,
+            [
+                "`tuple[int, str | None]` - length checked before the elements, no "
+                "combinations",
+                "`str | None` - single lookup in a set of types",
+            ],
+        )
+        self.assertEqual(len(plan.notes), 1)
+        self.assertIn("very same object", plan.notes[0])
+
+        plan = explain(tuple[int, str])
+        self.assertEqual(
+            plan.fast_paths[-1], "validator compiled once and cached by the type"
+        )
+        self.assertEqual(plan.combinations, 0)
+
+    def test_many_combinations(self) -> None:
+        plan = explain(list[int | str | float | bytes | None | bool | complex])
+        self.assertGreater(plan.combinations, 64)
+        self.assertIn("combinations", plan.notes[0])
+
+    def test_measurement(self) -> None:
+        self.assertIsNone(explain(list[int]).measurement)
+
+        T = list[list[int | str]]
+        measurement = explain(T, [[i, i + 1] for i in range(100)]).measurement
+        assert measurement is not None
+        self.assertTrue(measurement.valid)
+        self.assertEqual(measurement.nodes, 301)
+        self.assertEqual(measurement.counts.nodes, 301)
+        # list[list[int]]
+        self.assertEqual(measurement.described, 3)
+        self.assertGreater(measurement.predicted, 301)
+        self.assertGreater(measurement.predicted_time, 0)
+        self.assertGreater(measurement.measured_time, 0)
+
+    def test_measurement_of_mixed_elements(self) -> None:
+        T = list[list[int | str]]
+        uniform = explain(T, [[1, "a"]] * 10).measurement
+        mixed = explain(T, [[1], ["a"], [1, "a"]]).measurement
+        assert uniform is not None and mixed is not None
+
+        # list[list[int | str]] vs list[list[int] | list[str] | list[int | str]]
+        self.assertEqual(uniform.described, 5)
+        self.assertEqual(mixed.described, 10)
+        self.assertGreater(mixed.predicted, uniform.predicted)
+
+    def test_none_is_a_value(self) -> None:
+        measurement = explain(int | None, None).measurement
+        assert measurement is not None
+        self.assertTrue(measurement.valid)
+
+    def test_str(self) -> None:
+        text = str(explain(list[list[int | str]], [[1, "a"]]))
+
+        self.assertTrue(text.startswith("Plan of `list[list[int | str]]`"))
+        for section in ["Type tree:", "Per element:", "Notes:", "Value:"]:
+            self.assertIn(section, text)
+        self.assertEqual(repr(Plan(int)), "Plan(<class 'int'>)")
+
+    def test_invalid_type(self) -> None:
+        with self.assertRaises(TypeError):
+            explain(object)
+
+    def test_docstring_example(self) -> None:
+        doc = explain.__doc__
+        assert doc is not None
+        text = str(explain(list[int | str | float | bytes | None]))
+
+        # the lines quoted in the example, "..." for the omitted ones
+        quoted = [
+            line.strip()[2:]
+            for line in doc.splitlines()
+            if line.strip().startswith("# ") and line.strip() != "# ..."
+        ]
+        self.assertNotEqual(quoted, [])
+        for line in quoted:
+            self.assertIn(line, text.splitlines())
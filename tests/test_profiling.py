@@ -0,0 +1,86 @@
+import unittest
+
+from src.pyvalidify import hooks, profiling
+from src.pyvalidify.validator import isvalid
+
+
+class TestProfiling(unittest.TestCase):
+    def test_phases(self) -> None:
+        T = list[list[int | str]]
+        with profiling.profile() as profile:
+            for _ in range(3):
+                isvalid([[1, 2], [3, 4]], T)
+
+        phases = profile.phases
+        self.assertEqual(list(phases), list(profiling.PHASES))
+        self.assertEqual(profile.calls, 3)
+        # validator of the type is compiled once
+        self.assertLessEqual(phases["Descriptor"].calls, 1)
+        self.assertLessEqual(phases["combinations"].calls, 1)
+        for name in ["describe_type", "reductions", "intersection"]:
+            self.assertEqual(phases[name].calls, 3, name)
+        # the list and 2 lists of 2 elements each
+        self.assertEqual(phases["describe_type"].objects, 3 * 7)
+        self.assertGreaterEqual(phases["undefined_tuple_combinations"].calls, 3)
+        self.assertGreater(profile.time, 0)
+        self.assertLessEqual(sum(phase.time for phase in phases.values()), profile.time)
+
+    def test_uncached(self) -> None:
+        with profiling.profile(cached=False) as profile:
+            for _ in range(3):
+                isvalid([1, 2], list[int | str])
+
+        self.assertEqual(profile.phases["Descriptor"].calls, 3)
+        self.assertEqual(profile.phases["Descriptor"].objects, 3 * 4)
+        self.assertEqual(profile.phases["combinations"].calls, 3)
+        self.assertFalse(profiling.uncached)
+
+    def test_non_generics_skip_phases(self) -> None:
+        with profiling.profile() as profile:
+            isvalid(1, int | str)
+            isvalid((1, "a"), tuple[int, str])
+
+        self.assertEqual(profile.calls, 2)
+        self.assertEqual(profile.phases["describe_type"].calls, 0)
+
+    def test_nested(self) -> None:
+        with profiling.profile() as outer:
+            isvalid([1], list[int | str])
+            with profiling.profile() as inner:
+                isvalid([1], list[int | str])
+
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(outer.calls, 2)
+        self.assertEqual(outer.phases["describe_type"].calls, 2)
+        self.assertFalse(profiling.enabled)
+
+    def test_with_hooks(self) -> None:
+        events = []
+        remove = hooks.add(on_end=lambda event, *_: events.append(event.source))
+        try:
+            with profiling.profile() as profile:
+                isvalid([1], list[int | str])
+        finally:
+            remove()
+
+        self.assertEqual(profile.calls, 1)
+        self.assertIn("isvalid", events)
+
+    def test_disabled(self) -> None:
+        with profiling.profile() as profile:
+            pass
+        isvalid([1], list[int | str])
+
+        self.assertEqual(profile.calls, 0)
+
+    def test_table(self) -> None:
+        with profiling.profile() as profile:
+            isvalid([1, "a"], list[int | str])
+
+        lines = profile.table().splitlines()
+        self.assertEqual(
+            [line.split()[0] for line in lines],
+            ["phase", *profiling.PHASES, "other", "isvalid"],
+        )
+        self.assertTrue(lines[-1].endswith("100.0%"))
+        self.assertIn("-", profiling.Profile().table())
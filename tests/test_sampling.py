@@ -0,0 +1,72 @@
+import unittest
+from parameterized import parameterized
+
+from src.pyvalidify.sampling import (
+    SamplingPolicy,
+    get_default_policy,
+    set_default_policy,
+    to_policy,
+)
+
+
+class TestSamplingPolicy(unittest.TestCase):
+    @parameterized.expand([(1,), (2,), (7,)])
+    def test_sample_one_in_every(self, every: int) -> None:
+        policy = SamplingPolicy(every)
+        sampled = [policy.sample() for _ in range(every * 10)]
+        self.assertEqual(sampled.count(True), 10)
+        self.assertTrue(sampled[every - 1])
+        self.assertEqual(policy.validated, 10)
+
+    @parameterized.expand(
+        [
+            ({"every": 0},),
+            ({"every": 2, "max_every": 1},),
+            ({"backoff_after": 0},),
+        ]
+    )
+    def test_invalid_parameters(self, kwargs: dict) -> None:
+        with self.assertRaises(ValueError):
+            SamplingPolicy(**kwargs)
+
+    def test_adaptive_backs_off_after_clean_streak(self) -> None:
+        policy = SamplingPolicy(2, adaptive=True, max_every=8, backoff_after=3)
+        for expected in [2, 2, 2, 4, 4, 4, 8, 8, 8, 8]:
+            self.assertEqual(policy.interval, expected)
+            policy.record(True)
+
+    def test_adaptive_validates_every_call_after_failure(self) -> None:
+        policy = SamplingPolicy(10, adaptive=True)
+        policy.record(False)
+        self.assertEqual(policy.interval, 1)
+        self.assertEqual(policy.failures, 1)
+        self.assertTrue(all(policy.sample() for _ in range(10)))
+
+    def test_non_adaptive_interval_fixed(self) -> None:
+        policy = SamplingPolicy(3, backoff_after=1)
+        policy.record(True)
+        policy.record(False)
+        policy.record(True)
+        self.assertEqual(policy.interval, 3)
+
+    def test_to_policy(self) -> None:
+        policy = SamplingPolicy(5)
+        self.assertIs(to_policy(policy), policy)
+        self.assertIsNone(to_policy(None))
+        self.assertEqual(to_policy(5).every, 5)  # type: ignore
+
+        with self.assertRaises(TypeError):
+            to_policy(True)
+
+        with self.assertRaises(TypeError):
+            to_policy(0.5)  # pyright: ignore
+
+    def test_default_policy(self) -> None:
+        self.assertIsNone(get_default_policy())
+        try:
+            set_default_policy(3)
+            self.assertEqual(get_default_policy().every, 3)  # type: ignore
+        finally:
+            set_default_policy(None)
+
+        self.assertIsNone(get_default_policy())
@@ -11,6 +11,7 @@ from src.pyvalidify.type_hints import (
     is_supported_base_type,
     is_non_union_generic,
     is_with_union,
+    normalize_type_info,
 )
 
 supported_generics_sample = [
@@ -293,3 +294,65 @@ class TestIsTypeInfo(unittest.TestCase):
     )
     def test_returns_false_for_unsupported_types(self, _type: Any | tuple) -> None:
         self.assertFalse(is_type_info(_type))
+
+
+class TestNormalizeTypeInfo(unittest.TestCase):
+    @parameterized.expand(
+        [
+            (str, str, 0, False, False, False),
+            (None, None, 0, False, False, False),
+            (NoneType, None, 0, False, False, False),
+            (list[str], list, 1, False, False, False),
+            (tuple[str, ...], tuple, 1, False, True, False),
+            (tuple[str, int], tuple, 2, False, False, False),
+            (list[str | int], list, 1, False, False, True),
+            (str | int, None, 2, True, False, True),
+            ((str, list[int]), None, 2, True, False, True),
+        ]
+    )
+    def test_classifies_the_top_level_node(
+        self,
+        _type: Any,
+        base: Any,
+        n_args: int,
+        is_union: bool,
+        is_variadic: bool,
+        has_union: bool,
+    ) -> None:
+        node = normalize_type_info(_type)
+        assert node is not None
+        self.assertEqual(_type, node.hint)
+        self.assertEqual(base, node.base)
+        self.assertEqual(n_args, len(node.args))
+        self.assertEqual(is_union, node.is_union)
+        self.assertEqual(is_variadic, node.is_variadic)
+        self.assertEqual(has_union, node.has_union)
+
+    @parameterized.expand(
+        [
+            (Any,),
+            (list[Any],),
+            (list[...],),
+            (tuple[..., int],),
+            (tuple[str | Sequence, ...],),
+            ((),),
+            (((str, int),),),
+            ([str, int],),
+        ]
+    )
+    def test_returns_none_for_unsupported_types(self, _type: Any) -> None:
+        self.assertIsNone(normalize_type_info(_type))
+
+    def test_preserves_order_of_union_members_of_equal_hints(self) -> None:
+        self.assertEqual(
+            [str, int],
+            [arg.base for arg in normalize_type_info(str | int).args],  # type: ignore
+        )
+        self.assertEqual(
+            [int, str],
+            [arg.base for arg in normalize_type_info(int | str).args],  # type: ignore
+        )
+
+    def test_cached_result_is_reused_for_the_same_hint(self) -> None:
+        _type = dict[str, list[int | None]]
+        self.assertIs(normalize_type_info(_type), normalize_type_info(_type))
@@ -4,7 +4,12 @@ import unittest
 from parameterized import parameterized
 from typing import Any
 
-from src.pyvalidify.validator import describe_type, isvalid
+from src.pyvalidify.validator import (
+    compile_validator,
+    describe_type,
+    estimate_cost,
+    isvalid,
+)
 from src.pyvalidify.descriptor import Descriptor
 from src.pyvalidify.type_hints import SupportedBaseType, TypeInfo
 
@@ -451,3 +456,106 @@ class TestValidator(unittest.TestCase):
         self, val: Any, _type: TypeInfo
     ) -> None:
         self.assertTrue(isvalid(val, _type), {"val": val, "type": _type})
+
+    @parameterized.expand(
+        [
+            ("empty tuple, undefined length", (), tuple[int, ...], True),
+            ("empty tuple, fixed length", (), tuple[int], False),
+            ("too long for fixed length", (1, 2, 3), tuple[int], False),
+            ("too short for fixed length", (1, 2), tuple[int, int, int], False),
+            ("positions swapped", (1, "a"), tuple[str, int], False),
+            ("union at a position", (1, "a"), tuple[int, int | str], True),
+            ("union of tuples", (1, "a"), tuple[int] | tuple[int, str], True),
+            ("nested tuple", (1, (1, "a")), tuple[int, tuple[int, str]], True),
+            ("nested tuple mismatch", (1, (1, 1)), tuple[int, tuple[int, str]], False),
+            ("large tuple", tuple(range(100_000)), tuple[int, ...], True),
+            (
+                "large tuple with a mismatch",
+                tuple(range(100_000)) + ("a",),
+                tuple[int, ...],
+                False,
+            ),
+            (
+                "large mixed tuple",
+                tuple([1, "a"] * 50_000),
+                tuple[int | str, ...],
+                True,
+            ),
+        ]
+    )
+    def test_is_valid_tuples(
+        self, _: str, val: Any, _type: TypeInfo, expected: bool
+    ) -> None:
+        self.assertEqual(expected, isvalid(val, _type))
+
+    @parameterized.expand(
+        [
+            ("too long in a list", [(1, 2, 3)], list[tuple[int]], False),
+            ("too long in a dict", {"a": (1, 2)}, dict[str, tuple[int]], False),
+            ("too long in a set", {(1, 2)}, set[tuple[int]], False),
+            ("too long as a key", {(1, 2): 1}, dict[tuple[int], int], False),
+            ("deeply nested", [[(1, 2)]], list[list[tuple[int]]], False),
+            ("empty in a list", [()], list[tuple[int, ...]], True),
+            ("empty in a dict", {"a": ()}, dict[str, tuple[int, ...]], True),
+            ("empty, fixed length", [()], list[tuple[int]], False),
+            ("mixed members", [(1, 2), ("a", 3)], list[tuple[int | str, int]], True),
+            ("mixed lengths", [(1,), (1, 2)], list[tuple[int, ...]], True),
+            ("union member", [1, (1, "a")], list[int | tuple[int, str]], True),
+            ("empty collection", [], list[tuple[int]], False),
+            ("empty dict", {}, dict[str, tuple[int]], False),
+        ]
+    )
+    def test_is_valid_nested_tuples(
+        self, _: str, val: Any, _type: TypeInfo, expected: bool
+    ) -> None:
+        self.assertEqual(expected, isvalid(val, _type))
+        # the same rules as at the top level
+        self.assertEqual(expected, isvalid((val,), tuple[_type]))
+
+    @parameterized.expand(
+        [
+            (object(), int),
+            ([object()], list[int]),
+            ({"a": object()}, dict[str, int]),
+            ([(object(),)], list[tuple[int]]),
+            ({}, dict[str, int]),
+        ]
+    )
+    def test_is_valid_unsupported_and_empty_values(
+        self, val: Any, _type: TypeInfo
+    ) -> None:
+        self.assertFalse(isvalid(val, _type))
+
+    def test_compile_validator_cached(self) -> None:
+        _type = list[int | str]
+        validator = compile_validator(_type)
+        self.assertIs(validator, compile_validator(_type))
+        self.assertIs(compile_validator(list[int]), compile_validator(list[int]))
+        self.assertTrue(validator([1, "2"]))
+        self.assertFalse(validator((1, "2")))
+        self.assertFalse(validator([1.0]))
+
+    def test_compile_validator_invalid_type_info(self) -> None:
+        with self.assertRaises(TypeError):
+            compile_validator([int])  # pyright: ignore
+
+    @parameterized.expand(
+        [
+            (int, 1),
+            (int | str | None, 1),
+            (tuple[int, str], 3),
+            (tuple[int, ...], 2),
+            (list[int], 2),
+            (list[int | str], 5),
+            (list[int] | str, 3),
+            (list[tuple[int, str]], 4),
+        ]
+    )
+    def test_estimate_cost(self, _type: TypeInfo, expected: int) -> None:
+        self.assertEqual(expected, estimate_cost(_type))
+
+    def test_estimate_cost_grows_with_nested_unions(self) -> None:
+        self.assertLess(
+            estimate_cost(list[dict[str, int]]),
+            estimate_cost(list[dict[str | bytes, int | float]]),
+        )